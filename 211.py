@@ -38,7 +38,7 @@ class DataSet:
         self.header = header
         self.vacancies_objects = []
 
-    def get_stat(self, vacancy_name):
+    def get_stat(self, vacancy_name, report):
         vacancies = self.vacancies_objects
         doly_stat = dict()
         salary_stat = dict()
@@ -197,13 +197,14 @@ vacancies_by_year.csv
 Программист
 """
 
-file_name = input('Введите название файла: ')
-vacancy_name = input('Введите название профессии: ')
-report = Report([
-    "Год",
-    "Средняя зарплата",
-    "Средняя зарплата - " + vacancy_name,
-    "Количество вакансий",
-    "Количество вакансий - " + vacancy_name])
-data_set = csv_read(file_name)
-data_set.get_stat(vacancy_name)
+if __name__ == '__main__':
+    file_name = input('Введите название файла: ')
+    vacancy_name = input('Введите название профессии: ')
+    report = Report([
+        "Год",
+        "Средняя зарплата",
+        "Средняя зарплата - " + vacancy_name,
+        "Количество вакансий",
+        "Количество вакансий - " + vacancy_name])
+    data_set = csv_read(file_name)
+    data_set.get_stat(vacancy_name, report)
@@ -41,7 +41,7 @@ class DataSet:
         self.header = header
         self.vacancies_objects = []
 
-    def get_stat(self, vacancy_name):
+    def get_stat(self, vacancy_name, report):
         vacancies = self.vacancies_objects
         doly_stat = dict()
         salary_stat = dict()
@@ -110,7 +110,8 @@ class Report:
     ws2: Worksheet
     thin_border: Border
 
-    def __init__(self, columns1):
+    def __init__(self, columns1, vacancy_name):
+        self.vacancy_name = vacancy_name
         self.wb = Workbook()
         self.ws1 = self.wb.active
         self.ws1.title = "Статистика по годам"
@@ -199,7 +200,7 @@ class Report:
         width = 0.35
         ax = fig.add_subplot(221)
         ax.bar(x - width / 2, salary_stat.values(), width, label="средняя з/п")
-        ax.bar(x + width / 2, selected_salary_stat.values(), width, label="з/п "+vacancy_name.lower())
+        ax.bar(x + width / 2, selected_salary_stat.values(), width, label="з/п "+self.vacancy_name.lower())
         ax.set_title("Уровень зарплат по годам")
         ax.set_xticks(x, salary_stat.keys(), rotation="vertical")
         ax.legend()
@@ -209,7 +210,7 @@ class Report:
         x = np.arange(len(vacancy_count_stat))
         ax1 = fig.add_subplot(222)
         ax1.bar(x - width / 2, vacancy_count_stat.values(), width, label="Количество вакансий")
-        ax1.bar(x + width / 2, selected_count_stat.values(), width, label="Количество вакансий "+vacancy_name.lower())
+        ax1.bar(x + width / 2, selected_count_stat.values(), width, label="Количество вакансий "+self.vacancy_name.lower())
         ax1.set_title("Количество вакансий по годам")
         ax1.set_xticks(x, vacancy_count_stat.keys(), rotation="vertical")
         ax1.legend()
@@ -257,13 +258,14 @@ vacancies_by_year.csv
 Программист
 """
 
-file_name = input('Введите название файла: ')
-vacancy_name = input('Введите название профессии: ')
-report = Report([
-    "Год",
-    "Средняя зарплата",
-    "Средняя зарплата - " + vacancy_name,
-    "Количество вакансий",
-    "Количество вакансий - " + vacancy_name])
-data_set = csv_read(file_name)
-data_set.get_stat(vacancy_name)
+if __name__ == '__main__':
+    file_name = input('Введите название файла: ')
+    vacancy_name = input('Введите название профессии: ')
+    report = Report([
+        "Год",
+        "Средняя зарплата",
+        "Средняя зарплата - " + vacancy_name,
+        "Количество вакансий",
+        "Количество вакансий - " + vacancy_name], vacancy_name)
+    data_set = csv_read(file_name)
+    data_set.get_stat(vacancy_name, report)
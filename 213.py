@@ -53,7 +53,7 @@ class DataSet:
         self.header = header
         self.vacancies_objects = []
 
-    def get_stat(self, vacancy_name):
+    def get_stat(self, vacancy_name, report):
         vacancies = self.vacancies_objects
         doly_stat = dict()
         salary_stat = dict()
@@ -126,9 +126,10 @@ class Report:
     thin_border: Border
     columns = []
 
-    def __init__(self, columns1):
+    def __init__(self, columns1, vacancy_name):
         self.columns = columns1
 
+        self.vacancy_name = vacancy_name
         self.wb = Workbook()
         self.ws1 = self.wb.active
         self.ws1.title = "Статистика по годам"
@@ -217,7 +218,7 @@ class Report:
         width = 0.35
         ax = fig.add_subplot(221)
         ax.bar(x - width / 2, salary_stat.values(), width, label="средняя з/п")
-        ax.bar(x + width / 2, selected_salary_stat.values(), width, label="з/п " + vacancy_name.lower())
+        ax.bar(x + width / 2, selected_salary_stat.values(), width, label="з/п " + self.vacancy_name.lower())
         ax.set_title("Уровень зарплат по годам")
         ax.set_xticks(x, salary_stat.keys(), rotation="vertical")
         ax.legend()
@@ -227,7 +228,7 @@ class Report:
         x = np.arange(len(vacancy_count_stat))
         ax1 = fig.add_subplot(222)
         ax1.bar(x - width / 2, vacancy_count_stat.values(), width, label="Количество вакансий")
-        ax1.bar(x + width / 2, selected_count_stat.values(), width, label="Количество вакансий " + vacancy_name.lower())
+        ax1.bar(x + width / 2, selected_count_stat.values(), width, label="Количество вакансий " + self.vacancy_name.lower())
         ax1.set_title("Количество вакансий по годам")
         ax1.set_xticks(x, vacancy_count_stat.keys(), rotation="vertical")
         ax1.legend()
@@ -261,8 +262,8 @@ class Report:
 
     def generate_pdf(self, salary_stat, vacancy_count_stat, selected_salary_stat,
                      selected_count_stat, area_salary_stat, doly_stat):
-        report.generate_image(salary_stat, vacancy_count_stat, selected_salary_stat,
-                              selected_count_stat, area_salary_stat, doly_stat)
+        self.generate_image(salary_stat, vacancy_count_stat, selected_salary_stat,
+                            selected_count_stat, area_salary_stat, doly_stat)
 
         data = [salary_stat, selected_salary_stat, vacancy_count_stat, selected_count_stat]
         data2 = [{k: area_salary_stat[k] for i, k in zip(range(10), area_salary_stat)},
@@ -344,7 +345,7 @@ class Report:
         """)
 
         pdfkit.from_string(
-            template.render(getpath=getpath, get_percent=get_percent, vacancy_name=vacancy_name, columns=self.columns,
+            template.render(getpath=getpath, get_percent=get_percent, vacancy_name=self.vacancy_name, columns=self.columns,
                             textstart='<center><p style="font-family: Verdana">', textend="</p></center>",
                             data=data, data2=data2),
             'report.pdf', configuration=config, options={"enable-local-file-access": ""})
@@ -365,13 +366,14 @@ vacancies_by_year.csv
 Программист
 """
 
-file_name = input('Введите название файла: ')
-vacancy_name = input('Введите название профессии: ')
-report = Report([
-    "Год",
-    "Средняя зарплата",
-    "Средняя зарплата - " + vacancy_name,
-    "Количество вакансий",
-    "Количество вакансий - " + vacancy_name])
-data_set = csv_read(file_name)
-data_set.get_stat(vacancy_name)
+if __name__ == '__main__':
+    file_name = input('Введите название файла: ')
+    vacancy_name = input('Введите название профессии: ')
+    report = Report([
+        "Год",
+        "Средняя зарплата",
+        "Средняя зарплата - " + vacancy_name,
+        "Количество вакансий",
+        "Количество вакансий - " + vacancy_name], vacancy_name)
+    data_set = csv_read(file_name)
+    data_set.get_stat(vacancy_name, report)
@@ -0,0 +1,130 @@
+import asyncio
+import random
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+def _import_aiohttp():
+    """Импортирует aiohttp, который нужен только для загрузки вакансий из API"""
+    try:
+        import aiohttp
+    except ImportError:
+        raise ImportError("Для загрузки вакансий из API нужен пакет aiohttp") from None
+    return aiohttp
+
+
+def item_to_fields(item):
+    """Переводит вакансию из ответа API (формат hh.ru) в именованные аргументы Vacancy
+
+    Args:
+        item (dict): Вакансия из списка items ответа API
+    Returns:
+        dict: Именованные аргументы Vacancy или None, если у вакансии нет обязательных полей
+    """
+    salary = item.get('salary') or dict()
+    area = item.get('area') or dict()
+    fields = {
+        'name': item.get('name'),
+        'salary_from': salary.get('from'),
+        'salary_to': salary.get('to'),
+        'salary_currency': salary.get('currency'),
+        'area_name': area.get('name'),
+        'published_at': item.get('published_at'),
+    }
+    if not all(v is not None and v != '' for v in fields.values()):
+        return None
+    return fields
+
+
+class RateLimiter:
+    """Ограничивает частоту запросов: не больше rate запросов в секунду
+
+    Attributes:
+        interval (float): Минимальный интервал между началами запросов в секундах
+    """
+
+    def __init__(self, rate):
+        """Инициализирует объект RateLimiter
+
+        Args:
+            rate (float): Максимальное количество запросов в секунду, без ограничения если None
+        """
+        self.interval = 0 if not rate else 1 / rate
+        self._next = 0
+        self._lock = asyncio.Lock()
+
+    async def wait(self):
+        """Ждёт, пока можно будет начать следующий запрос"""
+        if not self.interval:
+            return
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            now = loop.time()
+            if self._next > now:
+                await asyncio.sleep(self._next - now)
+                now = self._next
+            self._next = now + self.interval
+
+
+async def _fetch_page(session, url, params, page, semaphore, limiter, retries, backoff):
+    """Загружает одну страницу с повторными попытками и экспоненциальной задержкой"""
+    aiohttp = _import_aiohttp()
+    for attempt in range(retries + 1):
+        delay = backoff * 2 ** attempt * (1 + random.random())
+        async with semaphore:
+            await limiter.wait()
+            try:
+                async with session.get(url, params={**params, 'page': page}) as response:
+                    if response.status not in RETRY_STATUSES:
+                        response.raise_for_status()
+                        return await response.json()
+                    retry_after = response.headers.get('Retry-After')
+                    if retry_after is not None and retry_after.isdigit():
+                        delay = max(delay, int(retry_after))
+                    error = aiohttp.ClientResponseError(
+                        response.request_info, response.history, status=response.status)
+            except (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, asyncio.TimeoutError) as e:
+                error = e
+        if attempt < retries:
+            await asyncio.sleep(delay)
+    raise error
+
+
+async def fetch_vacancies(url, params=None, per_page=100, concurrency=8, rate=10, retries=5, backoff=0.5,
+                          timeout=30):
+    """Асинхронно загружает все страницы списка вакансий из API
+
+    Первая страница загружается отдельно, чтобы узнать количество страниц, остальные
+    загружаются параллельно через общий пул соединений и отдаются по мере готовности.
+
+    Args:
+        url (str): Адрес списка вакансий, например 'https://api.hh.ru/vacancies'
+        params (dict): Дополнительные параметры запроса
+        per_page (int): Количество вакансий на странице
+        concurrency (int): Максимальное количество одновременных запросов
+        rate (float): Максимальное количество запросов в секунду, без ограничения если None
+        retries (int): Количество повторных попыток для страницы
+        backoff (float): Начальная задержка перед повторной попыткой в секундах
+        timeout (float): Таймаут одного запроса в секундах
+    Yields:
+        dict: Вакансия из списка items ответа API
+    """
+    aiohttp = _import_aiohttp()
+    params = {**(params or dict()), 'per_page': per_page}
+    semaphore = asyncio.Semaphore(concurrency)
+    limiter = RateLimiter(rate)
+    connector = aiohttp.TCPConnector(limit=concurrency)
+    async with aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=timeout)) as session:
+        first = await _fetch_page(session, url, params, 0, semaphore, limiter, retries, backoff)
+        for item in first.get('items', []):
+            yield item
+        tasks = [asyncio.create_task(_fetch_page(session, url, params, page, semaphore, limiter, retries, backoff))
+                 for page in range(1, first.get('pages', 1))]
+        try:
+            for task in asyncio.as_completed(tasks):
+                for item in (await task).get('items', []):
+                    yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,72 @@
+import hashlib
+import json
+import os
+
+
+def content_hash(*parts):
+    """Возвращает хэш содержимого входных данных артефакта
+
+    Args:
+        *parts: Сериализуемые в JSON части входных данных (статистика, шаблон, параметры отрисовки)
+    Returns:
+        str: Хэш sha256 в шестнадцатеричном виде
+    """
+    data = json.dumps(parts, ensure_ascii=False, default=repr, separators=(',', ':'))
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+
+class BuildCache:
+    """Манифест хэшей входных данных артефактов для пропуска повторной генерации
+
+    Артефакт считается актуальным, если файл существует и хэш его входных данных совпадает
+    с записанным при последней генерации. Без пути манифеста кэш отключён: все артефакты
+    генерируются заново, а на диск ничего не пишется.
+
+    Attributes:
+        path (str): Путь к файлу манифеста
+        hashes (dict): Хэш входных данных по пути артефакта
+    """
+
+    def __init__(self, path='.report_cache.json'):
+        """Инициализирует объект BuildCache, читая манифест, если он есть
+
+        Args:
+            path (str): Путь к файлу манифеста, кэш отключён если None
+        """
+        self.path = path
+        self.hashes = dict()
+        if path is None:
+            return
+        try:
+            with open(path, encoding='utf-8') as file:
+                self.hashes = json.load(file)
+        except (OSError, ValueError):
+            self.hashes = dict()
+
+    def is_fresh(self, artifact, key):
+        """Проверяет, можно ли не генерировать артефакт заново
+
+        Args:
+            artifact (str): Путь к артефакту
+            key (str): Хэш текущих входных данных артефакта
+        Returns:
+            bool: True, если артефакт существует и построен из тех же входных данных
+        """
+        if self.path is None:
+            return False
+        return self.hashes.get(os.path.abspath(artifact)) == key and os.path.exists(artifact)
+
+    def record(self, artifact, key):
+        """Запоминает хэш входных данных сгенерированного артефакта
+
+        Args:
+            artifact (str): Путь к артефакту
+            key (str): Хэш входных данных артефакта
+        """
+        if self.path is None:
+            return
+        self.hashes[os.path.abspath(artifact)] = key
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as file:
+            json.dump(self.hashes, file, ensure_ascii=False, indent=4)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,124 @@
+import csv
+import os
+import pickle
+
+from compression import detect_compression
+
+
+def input_identity(filename):
+    """Возвращает признаки входного файла, по которым контрольная точка относится именно к нему
+
+    Args:
+        filename (str): Путь к файлу
+    Returns:
+        tuple[str, int, int]: Абсолютный путь, размер и время изменения файла в наносекундах
+    """
+    stat = os.stat(filename)
+    return os.path.abspath(filename), stat.st_size, stat.st_mtime_ns
+
+
+class Checkpoint:
+    """Файл контрольной точки с состоянием долгого чтения
+
+    Состояние записывается атомарно (во временный файл и os.replace), поэтому при аварийном
+    завершении в файле остаётся либо прежняя, либо новая контрольная точка целиком.
+
+    Attributes:
+        path (str): Путь к файлу контрольной точки
+    """
+
+    def __init__(self, path):
+        """Инициализирует объект Checkpoint
+
+        Args:
+            path (str): Путь к файлу контрольной точки
+        """
+        self.path = path
+
+    def load(self, key):
+        """Читает сохранённое состояние
+
+        Args:
+            key: Ключ входных данных, с которым состояние было сохранено
+        Returns:
+            Состояние или None, если контрольной точки нет или она относится к другим входным данным
+        """
+        try:
+            with open(self.path, 'rb') as file:
+                data = pickle.load(file)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+        if data.get('key') != key:
+            return None
+        return data['state']
+
+    def save(self, key, state):
+        """Записывает состояние
+
+        Args:
+            key: Ключ входных данных (например, input_identity файла и параметры запуска)
+            state: Сериализуемое pickle состояние
+        """
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'wb') as file:
+            pickle.dump({'key': key, 'state': state}, file, pickle.HIGHEST_PROTOCOL)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, self.path)
+
+    def remove(self):
+        """Удаляет контрольную точку после успешного завершения"""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+class OffsetLineReader:
+    """Построчное чтение несжатого .csv файла с отслеживанием смещения в байтах
+
+    Используется как источник строк для csv.reader. csv.reader берёт строки по одной и только
+    пока запись не закончится, поэтому после получения очередной записи offset указывает на начало
+    следующей, даже если в полях есть переводы строк.
+
+    Attributes:
+        header (list[str]): Заголовок .csv файла
+        offset (int): Смещение в байтах после последней прочитанной строки
+    """
+
+    def __init__(self, filename, offset=None, encoding='utf-8'):
+        """Инициализирует объект OffsetLineReader, читая заголовок файла
+
+        Args:
+            filename (str): Путь к несжатому .csv файлу
+            offset (int): Смещение, с которого продолжить чтение, с первой строки данных если None
+            encoding (str): Кодировка файла
+        """
+        if detect_compression(filename) is not None:
+            raise ValueError("Контрольные точки возможны только при чтении несжатого .csv файла")
+        self.encoding = encoding
+        self._file = open(filename, 'rb')
+        self.header = next(csv.reader([self._file.readline().decode('utf-8-sig')]))
+        if offset is not None:
+            self._file.seek(offset)
+        self.offset = self._file.tell()
+        self._lines = iter(self._file)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        line = next(self._lines)
+        self.offset += len(line)
+        return line.decode(self.encoding)
+
+    def close(self):
+        """Закрывает файл"""
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
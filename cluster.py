@@ -0,0 +1,132 @@
+import json
+import socket
+import socketserver
+import struct
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+HEADER = struct.Struct('>I')
+MAX_MESSAGE = 1 << 30
+
+
+def send_message(sock, message):
+    """Отправляет сообщение: длина и сжатый zlib JSON
+
+    Args:
+        sock (socket.socket): Сокет
+        message (dict): Сообщение
+    """
+    data = zlib.compress(json.dumps(message, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+    sock.sendall(HEADER.pack(len(data)) + data)
+
+
+def _recv_exactly(sock, size):
+    """Читает из сокета ровно size байт"""
+    chunks = []
+    while size:
+        chunk = sock.recv(min(size, 1 << 20))
+        if not chunk:
+            raise ConnectionError("Соединение закрыто до конца сообщения")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b''.join(chunks)
+
+
+def recv_message(sock):
+    """Принимает сообщение, отправленное send_message
+
+    Args:
+        sock (socket.socket): Сокет
+    Returns:
+        dict: Сообщение
+    """
+    size, = HEADER.unpack(_recv_exactly(sock, HEADER.size))
+    if size > MAX_MESSAGE:
+        raise ValueError(f"Слишком большое сообщение: {size} байт")
+    return json.loads(zlib.decompress(_recv_exactly(sock, size)).decode('utf-8'))
+
+
+def encode_partial(partial):
+    """Переводит результат get_partial_stat в сериализуемый в JSON вид (ключи-годы остаются числами)
+
+    Args:
+        partial (tuple): Результат get_partial_stat
+    Returns:
+        list: Общее количество вакансий и списки пар (ключ, значение)
+    """
+    return [partial[0]] + [list(stat.items()) for stat in partial[1:]]
+
+
+def decode_partial(data):
+    """Восстанавливает результат get_partial_stat из encode_partial
+
+    Args:
+        data (list): Результат encode_partial
+    Returns:
+        tuple: Результат в формате get_partial_stat
+    """
+    return (data[0], *({k: v for k, v in stat} for stat in data[1:]))
+
+
+def parse_address(address):
+    """Разбирает адрес вида 'host:port'
+
+    Args:
+        address (str): Адрес
+    Returns:
+        tuple[str, int]: Хост и порт
+    """
+    host, _, port = address.rpartition(':')
+    return host or '127.0.0.1', int(port)
+
+
+def serve(port, compute, host='0.0.0.0', rejects=None):
+    """Запускает рабочий узел, который отвечает на запросы координатора частичной статистикой
+
+    Args:
+        port (int): Порт
+        compute (Callable[[str], tuple]): Функция, собирающая get_partial_stat по названию вакансии
+        host (str): Адрес, на котором слушать соединения
+        rejects (dict): Количество строк, отклонённых узлом при чтении, по причинам (отправляется с ответом)
+    """
+
+    class Handler(socketserver.BaseRequestHandler):
+        def handle(self):
+            try:
+                request = recv_message(self.request)
+                send_message(self.request, {'partial': encode_partial(compute(request['vacancy_name'])),
+                                            'rejects': rejects or dict()})
+            except Exception as e:
+                send_message(self.request, {'error': f"{type(e).__name__}: {e}"})
+
+    class Server(socketserver.ThreadingTCPServer):
+        allow_reuse_address = True
+        daemon_threads = True
+
+    with Server((host, port), Handler) as server:
+        server.serve_forever()
+
+
+def _request_partial(address, vacancy_name, timeout):
+    """Запрашивает частичную статистику у одного рабочего узла"""
+    with socket.create_connection(parse_address(address), timeout=timeout) as sock:
+        send_message(sock, {'vacancy_name': vacancy_name})
+        response = recv_message(sock)
+    if 'error' in response:
+        raise RuntimeError(f"Ошибка на рабочем узле {address}: {response['error']}")
+    return decode_partial(response['partial']), response.get('rejects', dict())
+
+
+def request_partials(addresses, vacancy_name, timeout=600):
+    """Параллельно запрашивает частичную статистику у всех рабочих узлов
+
+    Args:
+        addresses (list[str]): Адреса рабочих узлов вида 'host:port'
+        vacancy_name (str): Название вакансии, о которой нужно отдельно собрать статистику
+        timeout (float): Таймаут соединения и ответа одного узла в секундах
+    Returns:
+        list[tuple[tuple, dict]]: Результаты get_partial_stat рабочих узлов и количество отклонённых ими
+            строк по причинам в порядке addresses
+    """
+    with ThreadPoolExecutor(max(1, len(addresses))) as pool:
+        return list(pool.map(lambda address: _request_partial(address, vacancy_name, timeout), addresses))
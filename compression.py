@@ -0,0 +1,132 @@
+import bz2
+import gzip
+import io
+import lzma
+import queue
+import threading
+
+CHUNK_SIZE = 1 << 20
+
+_MAGIC = (
+    (b'\x1f\x8b', 'gz'),
+    (b'BZh', 'bz2'),
+    (b'\xfd7zXZ\x00', 'xz'),
+    (b'\x28\xb5\x2f\xfd', 'zst'),
+)
+
+
+def detect_compression(filename):
+    """Определяет сжатие файла по сигнатуре в начале файла
+
+    Args:
+        filename (str): Путь к файлу
+    Returns:
+        str: 'gz', 'bz2', 'xz', 'zst' или None для несжатого файла
+    """
+    with open(filename, 'rb') as file:
+        head = file.read(6)
+    for magic, kind in _MAGIC:
+        if head.startswith(magic):
+            return kind
+    return None
+
+
+def _open_decompressed(filename, kind):
+    """Открывает сжатый файл как бинарный поток распакованных данных"""
+    if kind == 'gz':
+        return gzip.open(filename, 'rb')
+    if kind == 'bz2':
+        return bz2.open(filename, 'rb')
+    if kind == 'xz':
+        return lzma.open(filename, 'rb')
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError("Для чтения .zst файлов нужен пакет zstandard") from None
+    return zstandard.ZstdDecompressor().stream_reader(open(filename, 'rb'), read_across_frames=True, closefd=True)
+
+
+class _ThreadedReader(io.RawIOBase):
+    """Бинарный поток, который распаковывает файл в отдельном потоке
+
+    Поток-распаковщик читает блоки по CHUNK_SIZE байт и складывает их в ограниченную очередь,
+    а парсер забирает их отсюда. gzip, bz2, lzma и zstandard отпускают GIL во время распаковки,
+    поэтому распаковка идёт параллельно с разбором строк.
+    """
+
+    def __init__(self, source, depth=8):
+        super().__init__()
+        self._source = source
+        self._queue = queue.Queue(depth)
+        self._stop = threading.Event()
+        self._buffer = memoryview(b'')
+        self._eof = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _put(self, item):
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _run(self):
+        try:
+            while True:
+                chunk = self._source.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                if not self._put(chunk):
+                    return
+            self._put(b'')
+        except BaseException as e:
+            self._put(e)
+        finally:
+            self._source.close()
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        while not self._buffer:
+            if self._eof:
+                return 0
+            item = self._queue.get()
+            if isinstance(item, BaseException):
+                self._eof = True
+                raise item
+            if not item:
+                self._eof = True
+                return 0
+            self._buffer = memoryview(item)
+        n = min(len(b), len(self._buffer))
+        b[:n] = self._buffer[:n]
+        self._buffer = self._buffer[n:]
+        return n
+
+    def close(self):
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join()
+        super().close()
+
+
+def open_text(filename, encoding='utf-8-sig'):
+    """Открывает .csv файл для чтения, прозрачно распаковывая .gz, .bz2, .xz и .zst
+
+    Сжатые файлы распаковываются потоково в отдельном потоке, без записи на диск.
+
+    Args:
+        filename (str): Путь к файлу
+        encoding (str): Кодировка текста
+    Returns:
+        io.TextIOBase: Текстовый поток
+    """
+    kind = detect_compression(filename)
+    if kind is None:
+        return open(filename, encoding=encoding)
+    raw = _ThreadedReader(_open_decompressed(filename, kind))
+    return io.TextIOWrapper(io.BufferedReader(raw, CHUNK_SIZE), encoding=encoding)
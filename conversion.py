@@ -0,0 +1,70 @@
+import numpy as np
+
+from periods import month_index, parse_month_indexes
+
+BATCH_SIZE = 10000
+MAX_INT64 = 2.0 ** 63
+
+
+def _parse_floats(values):
+    """Переводит пачку строк в массив float64, отмечая строки, которые не удалось разобрать"""
+    try:
+        return np.array(values, dtype=np.float64), np.zeros(len(values), dtype=bool)
+    except ValueError:
+        result = np.zeros(len(values), dtype=np.float64)
+        bad = np.zeros(len(values), dtype=bool)
+        for i, value in enumerate(values):
+            try:
+                result[i] = float(value)
+            except ValueError:
+                bad[i] = True
+        return result, bad
+
+
+def convert_salaries(salary_from, salary_to, salary_currency, currency_to_ruble):
+    """Векторно переводит пачку вилок окладов в средние зарплаты в рублях
+
+    Результат совпадает с int((float(salary_from) + float(salary_to)) // 2 * rate) для каждой строки:
+    деление на 2 в float64 точное, поэтому floor((f + t) / 2) равно (f + t) // 2, а int() — это trunc.
+    Валюты переводятся в небольшие целые коды, курс берётся из массива по коду.
+
+    Args:
+        salary_from (Sequence[str]): Нижние границы оклада
+        salary_to (Sequence[str]): Верхние границы оклада
+        salary_currency (Sequence[str]): Валюты (ключи currency_to_ruble)
+        currency_to_ruble (dict): Курсы валют к рублю
+    Returns:
+        tuple[list[int], np.ndarray]: Зарплаты в рублях (0 для некорректных строк) и маска строк,
+            в которых оклад не число или зарплата бесконечна либо не помещается в int64
+    """
+    codes = {currency: i for i, currency in enumerate(currency_to_ruble)}
+    rates = np.array(list(currency_to_ruble.values()), dtype=np.float64)
+    currency_codes = np.fromiter(map(codes.__getitem__, salary_currency), dtype=np.intp, count=len(salary_currency))
+    salary_from, bad_from = _parse_floats(salary_from)
+    salary_to, bad_to = _parse_floats(salary_to)
+    with np.errstate(invalid='ignore', over='ignore'):
+        salary = np.trunc(np.floor((salary_from + salary_to) / 2) * rates[currency_codes])
+        bad = bad_from | bad_to | ~(np.abs(salary) < MAX_INT64)
+    return np.where(bad, 0, salary).astype(np.int64).tolist(), bad
+
+
+def convert_months(published_at):
+    """Переводит пачку дат в номера месяцев, отмечая даты, которые не удалось разобрать
+
+    Args:
+        published_at (Sequence[str]): Даты в формате ISO-8601
+    Returns:
+        tuple[list[int], np.ndarray]: Номера месяцев (0 для некорректных дат) и маска некорректных дат
+    """
+    bad = np.zeros(len(published_at), dtype=bool)
+    try:
+        return parse_month_indexes(published_at).tolist(), bad
+    except ValueError:
+        months = []
+        for i, value in enumerate(published_at):
+            try:
+                months.append(month_index(value))
+            except ValueError:
+                months.append(0)
+                bad[i] = True
+        return months, bad
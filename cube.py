@@ -0,0 +1,175 @@
+import json
+
+import numpy as np
+
+ALL = ''
+
+
+class SalaryCube:
+    """Предрассчитанный куб сумм и количеств зарплат по измерениям год × город × профессия
+
+    Профессия с индексом 0 (ALL) означает все вакансии, остальные профессии совпадают с вакансией,
+    если их название является подстрокой названия вакансии (как в DataSet.get_stat), поэтому
+    одна вакансия может попасть в несколько профессий. Свёртки по городам и по годам
+    хранятся отдельно, чтобы запросы без среза по городам не суммировали весь куб.
+
+    Attributes:
+        years (np.ndarray): Годы по возрастанию
+        areas (np.ndarray): Названия городов в порядке первого появления
+        professions (list[str]): Профессии, первая из них ALL
+        sums (np.ndarray): Суммы зарплат формы (годы, города, профессии)
+        counts (np.ndarray): Количества вакансий формы (годы, города, профессии)
+        year_sums (np.ndarray): Свёртка sums по городам формы (годы, профессии)
+        year_counts (np.ndarray): Свёртка counts по городам формы (годы, профессии)
+        area_sums (np.ndarray): Свёртка sums по годам формы (города, профессии)
+        area_counts (np.ndarray): Свёртка counts по годам формы (города, профессии)
+        rejects (dict): Количество строк, отклонённых при чтении данных для куба, по причинам
+    """
+
+    def __init__(self, years, areas, professions, sums, counts, rejects=None):
+        """Инициализирует объект SalaryCube и строит свёртки
+
+        Args:
+            years (np.ndarray): Годы по возрастанию
+            areas (np.ndarray): Названия городов
+            professions (list[str]): Профессии, первая из них ALL
+            sums (np.ndarray): Суммы зарплат формы (годы, города, профессии)
+            counts (np.ndarray): Количества вакансий формы (годы, города, профессии)
+            rejects (dict): Количество отклонённых строк по причинам
+        """
+        self.years = np.asarray(years)
+        self.areas = np.asarray(areas)
+        self.professions = list(professions)
+        self.sums = sums
+        self.counts = counts
+        self.year_sums = sums.sum(axis=1)
+        self.year_counts = counts.sum(axis=1)
+        self.area_sums = sums.sum(axis=0)
+        self.area_counts = counts.sum(axis=0)
+        self.rejects = dict(rejects or dict())
+        self._area_index = {area: i for i, area in enumerate(self.areas.tolist())}
+
+    @classmethod
+    def build(cls, years, areas, names, salaries, professions, rejects=None):
+        """Строит куб по данным вакансий
+
+        Args:
+            years (Sequence[int]): Годы вакансий
+            areas (Sequence[str]): Города вакансий
+            names (Sequence[str]): Названия вакансий
+            salaries (Sequence[int]): Зарплаты вакансий в рублях
+            professions (Iterable[str]): Названия профессий для измерения профессий
+            rejects (dict): Количество строк, отклонённых при чтении данных, сохраняется вместе с кубом
+        Returns:
+            SalaryCube: Объект SalaryCube
+        """
+        professions = [ALL] + [p for p in dict.fromkeys(professions) if p != ALL]
+        if len(professions) > 63:
+            raise ValueError("В кубе может быть не больше 62 профессий")
+        year_values, year_codes = np.unique(np.asarray(years, dtype=np.int64), return_inverse=True)
+        area_values, first, area_codes = np.unique(np.asarray(areas, dtype=object), return_index=True,
+                                                   return_inverse=True)
+        # Города в порядке первого появления, как в словарях DataSet.get_partial_stat: от этого
+        # зависит порядок городов с равными значениями после устойчивой сортировки в finalize_stat
+        order = np.argsort(first, kind='stable')
+        rank = np.empty_like(order)
+        rank[order] = np.arange(len(order))
+        area_values, area_codes = area_values[order], rank[area_codes]
+        salaries = np.asarray(salaries, dtype=np.int64)
+
+        name_masks = dict()
+        mask = np.empty(len(salaries), dtype=np.int64)
+        for i, name in enumerate(names):
+            bits = name_masks.get(name)
+            if bits is None:
+                bits = name_masks[name] = sum(1 << j for j, p in enumerate(professions) if p in name)
+            mask[i] = bits
+
+        shape = (len(year_values), len(area_values), len(professions))
+        cells = (year_codes * shape[1] + area_codes) * shape[2]
+        sums = np.zeros(shape[0] * shape[1] * shape[2], dtype=np.int64)
+        counts = np.zeros_like(sums)
+        for j in range(len(professions)):
+            selected = (mask >> j) & 1 == 1
+            index = cells[selected] + j
+            np.add.at(sums, index, salaries[selected])
+            counts += np.bincount(index, minlength=len(counts))
+        return cls(year_values, area_values.astype(str), professions, sums.reshape(shape), counts.reshape(shape),
+                   rejects)
+
+    def save(self, path):
+        """Сохраняет куб в файл
+
+        Args:
+            path (str): Путь к файлу куба
+        """
+        with open(path, 'wb') as file:
+            np.savez_compressed(file, years=self.years, areas=self.areas, professions=np.array(self.professions),
+                                sums=self.sums, counts=self.counts, rejects=np.array(json.dumps(self.rejects)))
+
+    @classmethod
+    def load(cls, path):
+        """Загружает куб из файла
+
+        Args:
+            path (str): Путь к файлу куба
+        Returns:
+            SalaryCube: Объект SalaryCube
+        """
+        with np.load(path) as data:
+            rejects = json.loads(data['rejects'].item()) if 'rejects' in data.files else None
+            return cls(data['years'], data['areas'], data['professions'].tolist(), data['sums'], data['counts'],
+                       rejects)
+
+    def query(self, vacancy_name, years=None, areas=None):
+        """Возвращает суммы и количества для статистики по срезу куба
+
+        Args:
+            vacancy_name (str): Название профессии из измерения профессий куба
+            years (tuple[int, int]): Диапазон лет включительно, все годы если None
+            areas (Iterable[str]): Города среза, все города если None
+        Returns:
+            tuple: Общее количество вакансий, суммы и количества зарплат по годам, то же для выбранной
+                профессии, суммы и количества зарплат по городам и количество вакансий по городам
+                (в порядке аргументов finalize_stat)
+        """
+        if vacancy_name not in self.professions:
+            raise ValueError(f"Профессии '{vacancy_name}' нет в кубе, доступны: {self.professions[1:]}")
+        profession = self.professions.index(vacancy_name)
+        year_slice = slice(None)
+        if years is not None:
+            year_slice = slice(np.searchsorted(self.years, years[0]), np.searchsorted(self.years, years[1], 'right'))
+        area_index = slice(None)
+        if areas is not None:
+            area_index = np.array(sorted(self._area_index[a] for a in set(areas) if a in self._area_index),
+                                  dtype=np.int64)
+
+        if areas is None:
+            year_sums, year_counts = self.year_sums[year_slice], self.year_counts[year_slice]
+        else:
+            year_sums = self.sums[year_slice, area_index].sum(axis=1)
+            year_counts = self.counts[year_slice, area_index].sum(axis=1)
+        if years is None:
+            area_sums, area_counts = self.area_sums[area_index, 0], self.area_counts[area_index, 0]
+        else:
+            area_sums = self.sums[year_slice, area_index, 0].sum(axis=0)
+            area_counts = self.counts[year_slice, area_index, 0].sum(axis=0)
+
+        year_keys = self.years[year_slice].tolist()
+        area_keys = self.areas[area_index].tolist()
+        present = year_counts[:, 0] > 0
+        year_keys = [k for k, p in zip(year_keys, present) if p]
+        year_sums, year_counts = year_sums[present], year_counts[present]
+        area_present = area_counts > 0
+        area_keys = [k for k, p in zip(area_keys, area_present) if p]
+        area_sums, area_counts = area_sums[area_present], area_counts[area_present]
+
+        area_count_stat = dict(zip(area_keys, area_counts.tolist()))
+        return (int(year_counts[:, 0].sum()),
+                dict(zip(year_keys, year_sums[:, 0].tolist())),
+                dict(zip(year_keys, year_counts[:, 0].tolist())),
+                dict(zip(year_keys, year_sums[:, profession].tolist())),
+                dict(zip(year_keys, year_counts[:, profession].tolist())),
+                dict(zip(area_keys, area_sums.tolist())),
+                area_count_stat,
+                dict(area_count_stat))
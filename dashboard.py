@@ -0,0 +1,282 @@
+from html import escape
+from math import cos, floor, log10, pi, sin
+
+from jinja2 import Template
+
+COLORS = ('#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd', '#8c564b', '#e377c2', '#7f7f7f', '#bcbd22',
+          '#17becf', '#aec7e8')
+WIDTH = 480
+HEIGHT = 320
+
+
+def nice_ticks(maximum, count=5):
+    """Подбирает круглые деления оси от нуля до maximum
+
+    Args:
+        maximum (float): Максимальное значение на оси
+        count (int): Желаемое количество делений
+    Returns:
+        list[float]: Значения делений, последнее не меньше maximum
+    """
+    if maximum <= 0:
+        return [0, 1]
+    raw_step = maximum / count
+    magnitude = 10 ** floor(log10(raw_step))
+    step = next(m * magnitude for m in (1, 2, 2.5, 5, 10) if m * magnitude >= raw_step)
+    ticks = [0]
+    while ticks[-1] < maximum:
+        ticks.append(ticks[-1] + step)
+    return ticks
+
+
+def _tick_label(value):
+    """Подпись деления оси без лишних нулей"""
+    return f"{value:g}" if value < 1e6 else f"{value / 1e6:g}M"
+
+
+def _svg(body, height=HEIGHT):
+    """Оборачивает элементы в тег svg"""
+    return (f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {WIDTH} {height}" width="{WIDTH}" '
+            f'height="{height}" font-family="Verdana, sans-serif" font-size="10">' + ''.join(body) + '</svg>')
+
+
+def _title(text):
+    """Подпись диаграммы по центру сверху"""
+    return f'<text x="{WIDTH / 2}" y="16" text-anchor="middle" font-size="12">{escape(text)}</text>'
+
+
+def _legend(labels, x, y):
+    """Легенда: цветной квадрат и подпись для каждого ряда"""
+    body = []
+    for i, label in enumerate(labels):
+        body.append(f'<rect x="{x}" y="{y + i * 14}" width="10" height="10" fill="{COLORS[i % len(COLORS)]}"/>'
+                    f'<text x="{x + 14}" y="{y + i * 14 + 9}">{escape(str(label))}</text>')
+    return ''.join(body)
+
+
+def bar_chart_svg(title, categories, series):
+    """Строит вертикальную столбчатую диаграмму с группами столбцов, как ax.bar в Report.generate_image
+
+    Args:
+        title (str): Заголовок диаграммы
+        categories (list): Подписи групп по оси X (например, годы)
+        series (list[tuple[str, list[float]]]): Подписи рядов и их значения по группам
+    Returns:
+        str: Разметка SVG
+    """
+    left, top, right, bottom = 60, 28 + 14 * len(series), WIDTH - 10, HEIGHT - 40
+    ticks = nice_ticks(max([max(values, default=0) for _, values in series], default=0))
+    scale = (bottom - top) / ticks[-1]
+    body = [_title(title)]
+    for tick in ticks:
+        y = bottom - tick * scale
+        body.append(f'<line x1="{left}" y1="{y:.1f}" x2="{right}" y2="{y:.1f}" stroke="#ddd"/>'
+                    f'<text x="{left - 4}" y="{y + 3:.1f}" text-anchor="end">{_tick_label(tick)}</text>')
+    group = (right - left) / max(len(categories), 1)
+    width = group * 0.7 / max(len(series), 1)
+    for i, category in enumerate(categories):
+        x = left + group * i + group * 0.15
+        for j, (label, values) in enumerate(series):
+            height = values[i] * scale
+            body.append(f'<rect x="{x + j * width:.1f}" y="{bottom - height:.1f}" width="{width:.1f}" '
+                        f'height="{height:.1f}" fill="{COLORS[j % len(COLORS)]}">'
+                        f'<title>{escape(f"{category}, {label}: {values[i]}")}</title></rect>')
+        cx = left + group * (i + 0.5)
+        body.append(f'<text x="{cx:.1f}" y="{bottom + 6}" text-anchor="end" '
+                    f'transform="rotate(-90 {cx:.1f} {bottom + 6})" dy="3">{escape(str(category))}</text>')
+    body.append(f'<line x1="{left}" y1="{bottom}" x2="{right}" y2="{bottom}" stroke="#333"/>')
+    body.append(_legend([label for label, _ in series], left, 24))
+    return _svg(body)
+
+
+def hbar_chart_svg(title, labels, values):
+    """Строит горизонтальную столбчатую диаграмму, как ax.barh в Report.generate_image
+
+    Args:
+        title (str): Заголовок диаграммы
+        labels (list[str]): Подписи столбцов сверху вниз
+        values (list[float]): Значения столбцов
+    Returns:
+        str: Разметка SVG
+    """
+    left, top, right, bottom = 130, 28, WIDTH - 20, HEIGHT - 20
+    ticks = nice_ticks(max(values, default=0), 4)
+    scale = (right - left) / ticks[-1]
+    row = (bottom - top) / max(len(labels), 1)
+    body = [_title(title)]
+    for tick in ticks:
+        x = left + tick * scale
+        body.append(f'<line x1="{x:.1f}" y1="{top}" x2="{x:.1f}" y2="{bottom}" stroke="#ddd"/>'
+                    f'<text x="{x:.1f}" y="{bottom + 12}" text-anchor="middle">{_tick_label(tick)}</text>')
+    for i, (label, value) in enumerate(zip(labels, values)):
+        y = top + row * i
+        body.append(f'<rect x="{left}" y="{y + row * 0.15:.1f}" width="{value * scale:.1f}" height="{row * 0.7:.1f}" '
+                    f'fill="{COLORS[0]}"><title>{escape(f"{label}: {value}")}</title></rect>'
+                    f'<text x="{left - 4}" y="{y + row / 2 + 3:.1f}" text-anchor="end">{escape(label)}</text>')
+    body.append(f'<line x1="{left}" y1="{top}" x2="{left}" y2="{bottom}" stroke="#333"/>')
+    return _svg(body)
+
+
+def pie_chart_svg(title, labels, values):
+    """Строит круговую диаграмму с легендой, как ax.pie в Report.generate_image
+
+    Args:
+        title (str): Заголовок диаграммы
+        labels (list[str]): Подписи секторов
+        values (list[float]): Значения секторов
+    Returns:
+        str: Разметка SVG
+    """
+    cx, cy, r = 130, HEIGHT / 2 + 10, 110
+    total = sum(values)
+    body = [_title(title)]
+    angle = pi / 2
+    for i, (label, value) in enumerate(zip(labels, values)):
+        color = COLORS[i % len(COLORS)]
+        tooltip = f'<title>{escape(f"{label}: {value / total * 100:.2f}%")}</title>' if total else ''
+        if total and value >= total:
+            body.append(f'<circle cx="{cx}" cy="{cy}" r="{r}" fill="{color}">{tooltip}</circle>')
+            continue
+        sweep = 2 * pi * value / total if total else 0
+        x1, y1 = cx + r * cos(angle), cy - r * sin(angle)
+        angle += sweep
+        x2, y2 = cx + r * cos(angle), cy - r * sin(angle)
+        body.append(f'<path d="M{cx},{cy} L{x1:.2f},{y1:.2f} A{r},{r} 0 {int(sweep > pi)} 0 {x2:.2f},{y2:.2f} Z" '
+                    f'fill="{color}" stroke="#fff" stroke-width="0.5">{tooltip}</path>')
+    body.append(_legend(labels, cx + r + 20, 40))
+    return _svg(body)
+
+
+def stat_charts(vacancy_name, salary_stat, vacancy_count_stat, selected_salary_stat,
+                selected_count_stat, area_salary_stat, doly_stat):
+    """Строит те же четыре графика, что и Report.generate_image, в виде SVG
+
+    Args:
+        vacancy_name (str): Название выбранной профессии
+        salary_stat (dict): Динамика уровня зарплат по годам
+        vacancy_count_stat (dict): Динамика количества вакансий по годам
+        selected_salary_stat (dict): Динамика уровня зарплат по годам для выбранной профессии
+        selected_count_stat (dict): Динамика количества вакансий по годам для выбранной профессии
+        area_salary_stat (dict): Уровень зарплат по городам (в порядке убывания)
+        doly_stat (dict): Доля вакансий по городам (в порядке убывания)
+    Returns:
+        list[str]: Разметка SVG четырёх графиков
+    """
+    top_areas = list(area_salary_stat)[:10]
+    doly_labels = list(doly_stat)[:10]
+    doly_values = list(doly_stat.values())[:10]
+    if len(doly_stat) > 10:
+        doly_labels.append("Другие")
+        doly_values.append(sum(list(doly_stat.values())[10:]))
+    return [
+        bar_chart_svg("Уровень зарплат по годам", list(salary_stat), [
+            ("средняя з/п", list(salary_stat.values())),
+            ("з/п " + vacancy_name.lower(), [selected_salary_stat.get(k, 0) for k in salary_stat])]),
+        bar_chart_svg("Количество вакансий по годам", list(vacancy_count_stat), [
+            ("Количество вакансий", list(vacancy_count_stat.values())),
+            ("Количество вакансий " + vacancy_name.lower(),
+             [selected_count_stat.get(k, 0) for k in vacancy_count_stat])]),
+        hbar_chart_svg("Уровень зарплат по городам", top_areas, [area_salary_stat[k] for k in top_areas]),
+        pie_chart_svg("Доля вакансий по городам", doly_labels, doly_values),
+    ]
+
+
+TEMPLATE = Template(r"""<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <title>Аналитика по зарплатам и городам</title>
+    <style>
+        body { font-family: Verdana, sans-serif; margin: 0 auto; max-width: 1000px; text-align: center; }
+        .charts { display: flex; flex-wrap: wrap; justify-content: center; }
+        table { border-collapse: collapse; margin: 0 auto; }
+        td, th { border: 1px solid #333; padding: 5px; text-align: center; }
+        .areas > tbody > tr > td { border: none; vertical-align: top; }
+    </style>
+</head>
+<body>
+{% if profiles|length > 1 %}
+<p>
+    <label for="profession">Профессия:</label>
+    <select id="profession" onchange="showProfile(this.value)">
+    {% for profile in profiles %}
+        <option value="{{ loop.index0 }}">{{ profile.vacancy_name|e }}</option>
+    {% endfor %}
+    </select>
+</p>
+{% endif %}
+{% for profile in profiles %}
+<section class="profile" id="profile-{{ loop.index0 }}"{% if not loop.first %} hidden{% endif %}>
+    <h1>Аналитика по зарплатам и городам для профессии {{ profile.vacancy_name|e }}</h1>
+    <div class="charts">
+    {% for chart in profile.charts %}
+        {{ chart }}
+    {% endfor %}
+    </div>
+
+    <h2>Статистика по годам</h2>
+    <table>
+        <tr>
+        {% for c in profile.columns %}
+            <th>{{ c|e }}</th>
+        {% endfor %}
+        </tr>
+        {% for year in profile.data[0] %}
+        <tr>
+            <td>{{ year }}</td>
+            {% for d in profile.data %}
+            <td>{{ d[year] }}</td>
+            {% endfor %}
+        </tr>
+        {% endfor %}
+    </table>
+
+    <h2>Статистика по городам</h2>
+    <table class="areas">
+        <tr>
+            <td>
+                <table>
+                    <tr><th>Город</th><th>Уровень зарплат</th></tr>
+                    {% for city in profile.data2[0] %}
+                    <tr><td>{{ city|e }}</td><td>{{ profile.data2[0][city] }}</td></tr>
+                    {% endfor %}
+                </table>
+            </td>
+            <td>
+                <table>
+                    <tr><th>Город</th><th>Доля вакансий</th></tr>
+                    {% for city in profile.data2[1] %}
+                    <tr><td>{{ city|e }}</td><td>{{ get_percent(profile.data2[1][city]) }}</td></tr>
+                    {% endfor %}
+                </table>
+            </td>
+        </tr>
+    </table>
+</section>
+{% endfor %}
+<script>
+    function showProfile(index) {
+        document.querySelectorAll('section.profile').forEach(function (section) {
+            section.hidden = section.id !== 'profile-' + index;
+        });
+    }
+</script>
+</body>
+</html>
+""")
+
+
+def render_dashboard(profiles, get_percent):
+    """Собирает самодостаточную HTML страницу со статистикой по одной или нескольким профессиям
+
+    Графики встроены в страницу как SVG, внешние файлы и сеть не нужны. Если профессий несколько,
+    между ними можно переключаться списком вверху страницы без перезагрузки.
+
+    Args:
+        profiles (list[dict]): Статистика профессий: 'vacancy_name', 'columns' (заголовок таблицы по годам),
+            'data' и 'data2' (как в Report.generate_pdf) и 'charts' (результат stat_charts)
+        get_percent (Callable[[float], str]): Функция перевода доли в проценты
+    Returns:
+        str: HTML страница
+    """
+    return TEMPLATE.render(profiles=profiles, get_percent=get_percent)
@@ -0,0 +1,290 @@
+import hashlib
+import json
+import os
+from typing import NamedTuple
+
+from checkpoint import input_identity
+from compression import detect_compression
+from shared_columns import FORMAT_VERSION
+
+ENGINES = ('csv', 'columns', 'checkpoint', 'parquet', 'sqlite', 'cube', 'api', 'cluster')
+MEMORY_PER_BYTE = 5
+COMPRESSION_RATIO = 8
+MEMORY_HEADROOM = 0.5
+CHECKPOINT_MIN_SIZE = 1 << 30
+COLUMNS_CACHE_MIN_SIZE = 64 << 20
+CACHE_DIR_ENV = 'VACANCIES_CACHE_DIR'
+
+
+class EngineDecision(NamedTuple):
+    """Выбранная стратегия чтения входных данных
+
+    Attributes:
+        engine (str): Стратегия из ENGINES
+        reason (str): Почему выбрана эта стратегия
+        facts (dict): Признаки входных данных и машины, по которым принималось решение
+        write_cache (bool): После чтения .csv файла сохранить колонки в кэш для следующих запусков
+    """
+    engine: str
+    reason: str
+    facts: dict
+    write_cache: bool = False
+
+
+def _cgroup_memory_paths():
+    """Перечисляет файлы ограничения памяти cgroup v2 и v1 для группы текущего процесса и корня иерархии
+
+    Returns:
+        list[str]: Пути к memory.max и memory.limit_in_bytes
+    """
+    groups = {'': '/', 'memory': '/'}
+    try:
+        with open('/proc/self/cgroup') as file:
+            for line in file:
+                _, controllers, group = line.rstrip('\n').split(':', 2)
+                for controller in controllers.split(','):
+                    if controller in groups:
+                        groups[controller] = group
+    except (OSError, ValueError):
+        pass
+    paths = []
+    for group in (groups[''], '/'):
+        paths.append(os.path.join('/sys/fs/cgroup', group.lstrip('/'), 'memory.max'))
+    for group in (groups['memory'], '/'):
+        paths.append(os.path.join('/sys/fs/cgroup/memory', group.lstrip('/'), 'memory.limit_in_bytes'))
+    return list(dict.fromkeys(paths))
+
+
+def _available_memory():
+    """Возвращает доступную память машины (MemAvailable, с учётом освобождаемого кэша страниц)
+
+    Если /proc/meminfo недоступен, используется свободная память из sysconf.
+
+    Returns:
+        int: Доступная память в байтах или None, если её не удалось определить
+    """
+    try:
+        with open('/proc/meminfo') as file:
+            for line in file:
+                if line.startswith('MemAvailable:'):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        return os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_AVPHYS_PAGES')
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def memory_limit():
+    """Возвращает доступную процессу память: меньшее из ограничения cgroup и доступной памяти машины
+
+    Returns:
+        int: Доступная память в байтах или None, если её не удалось определить
+    """
+    limits = []
+    for path in _cgroup_memory_paths():
+        try:
+            with open(path) as file:
+                value = file.read().strip()
+        except OSError:
+            continue
+        if value.isdigit() and int(value) < 1 << 60:
+            limits.append(int(value))
+    available = _available_memory()
+    if available is not None:
+        limits.append(available)
+    return min(limits, default=None)
+
+
+def cache_dir(directory=None):
+    """Возвращает каталог кэша колонок и контрольных точек
+
+    Кэш не пишется рядом с входным файлом: его каталог может быть только для чтения или сетевым.
+
+    Args:
+        directory (str): Каталог, заданный явно
+    Returns:
+        str: directory, иначе переменная окружения CACHE_DIR_ENV, иначе $XDG_CACHE_HOME/vacancies
+            (по умолчанию ~/.cache/vacancies)
+    """
+    if directory:
+        return directory
+    if os.environ.get(CACHE_DIR_ENV):
+        return os.environ[CACHE_DIR_ENV]
+    return os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'), 'vacancies')
+
+
+def _cache_name(filename):
+    """Возвращает имя записи кэша для входного файла: имя файла и хэш его абсолютного пути"""
+    path = os.path.abspath(filename)
+    return f"{os.path.basename(path)}-{hashlib.sha1(path.encode('utf-8')).hexdigest()[:12]}"
+
+
+def columns_cache_path(filename, directory=None):
+    """Возвращает каталог кэша колонок для .csv файла
+
+    Args:
+        filename (str): Путь к .csv файлу
+        directory (str): Каталог кэша (см. cache_dir)
+    Returns:
+        str: Путь к каталогу кэша колонок в каталоге кэша
+    """
+    return os.path.join(cache_dir(directory), _cache_name(filename) + '.columns')
+
+
+def checkpoint_path(filename, directory=None):
+    """Возвращает путь к контрольной точке потокового чтения .csv файла
+
+    Args:
+        filename (str): Путь к .csv файлу
+        directory (str): Каталог кэша (см. cache_dir)
+    Returns:
+        str: Путь к файлу контрольной точки в каталоге кэша
+    """
+    return os.path.join(cache_dir(directory), _cache_name(filename) + '.checkpoint')
+
+
+def read_cache_meta(filename, directory=None):
+    """Читает описание кэша колонок, если он построен по текущей версии файла
+
+    Args:
+        filename (str): Путь к .csv файлу
+        directory (str): Каталог кэша (см. cache_dir)
+    Returns:
+        dict: Описание кэша (input_identity и отклонённые строки) или None, если кэша нет, он устарел
+            или записан в другом формате колонок
+    """
+    try:
+        with open(os.path.join(columns_cache_path(filename, directory), 'source.json'), encoding='utf-8') as file:
+            meta = json.load(file)
+    except (OSError, ValueError):
+        return None
+    if meta.get('identity') != list(input_identity(filename)) or meta.get('format') != FORMAT_VERSION:
+        return None
+    return meta
+
+
+def write_cache_meta(filename, rejects, directory=None):
+    """Записывает описание кэша колонок после того, как колонки сохранены
+
+    Args:
+        filename (str): Путь к .csv файлу
+        rejects (dict): Количество отклонённых при чтении строк по причинам
+        directory (str): Каталог кэша (см. cache_dir)
+    """
+    with open(os.path.join(columns_cache_path(filename, directory), 'source.json'), 'w', encoding='utf-8') as file:
+        json.dump({'identity': list(input_identity(filename)), 'format': FORMAT_VERSION, 'rejects': rejects}, file,
+                  ensure_ascii=False)
+
+
+def _unsupported(engine, features):
+    """Сообщает, что стратегия не поддерживает запрошенные возможности чтения
+
+    Args:
+        engine (str): Стратегия из ENGINES
+        features (list[str]): Названия запрошенных возможностей
+    Raises:
+        ValueError: Если запрошена хотя бы одна возможность
+    """
+    if features:
+        raise ValueError(f"Стратегия '{engine}' не поддерживает {' и '.join(features)}")
+
+
+def choose_engine(source, force=None, limit=None, directory=None, quarantine=False, dedup=False):
+    """Выбирает стратегию чтения по входным данным, кэшу и доступной памяти
+
+    Адреса и форматы, отличные от .csv, читаются своими способами. Для .csv файла используется
+    свежий кэш колонок, если он есть; иначе оценивается память под вакансии
+    (около MEMORY_PER_BYTE байт на байт распакованного файла), и если она не помещается
+    в долю MEMORY_HEADROOM доступной памяти или файл больше CHECKPOINT_MIN_SIZE, несжатый файл
+    читается потоково с контрольными точками. Прочитанный целиком большой файл сохраняется в кэш колонок.
+    Состав отчёта от стратегии не зависит: для csv, columns и checkpoint выводятся одни и те же листы и графики.
+    Карантин отклонённых строк и удаление повторов возможны только при чтении .csv файла целиком
+    (стратегия csv): остальные стратегии не видят исходных строк, поэтому с quarantine или dedup
+    выбирается csv без кэша колонок.
+
+    Args:
+        source (str): Путь к файлу или адрес (tcp://, http://, https://)
+        force (str): Стратегия из ENGINES, которую нужно использовать без выбора
+        limit (int): Доступная память в байтах, определяется memory_limit если None
+        directory (str): Каталог кэша колонок (см. cache_dir)
+        quarantine (bool): Нужно ли записывать отклонённые строки в карантин
+        dedup (bool): Нужно ли отбрасывать повторы вакансий
+    Returns:
+        EngineDecision: Выбранная стратегия, причина и признаки
+    Raises:
+        ValueError: Если стратегия неизвестна или не подходит для входных данных и запрошенных возможностей
+    """
+    features = [feature for feature, requested in (('карантин отклонённых строк', quarantine),
+                                                   ('удаление повторов', dedup)) if requested]
+    if force is not None and force not in ENGINES:
+        raise ValueError(f"Неизвестная стратегия чтения '{force}', доступны: {', '.join(ENGINES)}")
+    facts = {'memory_limit': limit if limit is not None else memory_limit()}
+
+    if source.startswith('tcp://'):
+        engine, reason = 'cluster', "адрес рабочих узлов"
+    elif source.startswith(('http://', 'https://')):
+        engine, reason = 'api', "адрес HTTP API"
+    elif source.endswith('.parquet'):
+        engine, reason = 'parquet', "файл .parquet"
+    elif source.endswith('.db'):
+        engine, reason = 'sqlite', "база SQLite"
+    elif source.endswith('.cube'):
+        engine, reason = 'cube', "предрассчитанный куб"
+    else:
+        engine, reason = None, None
+    if engine is not None:
+        if force not in (None, engine):
+            raise ValueError(f"Стратегия '{force}' не подходит для {source}, нужна '{engine}'")
+        _unsupported(engine, features)
+        return EngineDecision(engine, reason, facts)
+
+    compression = detect_compression(source)
+    size = os.path.getsize(source)
+    cached = read_cache_meta(source, directory) is not None
+    estimate = size * MEMORY_PER_BYTE * (COMPRESSION_RATIO if compression else 1)
+    facts.update(size=size, compression=compression, columns_cache=cached, estimated_memory=estimate)
+
+    if force == 'checkpoint' and compression is not None:
+        raise ValueError("Стратегия 'checkpoint' возможна только для несжатого .csv файла")
+    if force not in (None, 'csv', 'columns', 'checkpoint'):
+        raise ValueError(f"Стратегия '{force}' не подходит для .csv файла")
+    if force in ('columns', 'checkpoint'):
+        _unsupported(force, features)
+    if features:
+        reason = "задана флагом" if force else "только она поддерживает " + " и ".join(features)
+        return EngineDecision('csv', reason + ", кэш колонок не используется", facts)
+    if force == 'columns':
+        return EngineDecision('columns', "задана флагом" + ("" if cached else ", кэш будет построен"), facts,
+                              write_cache=not cached)
+    if force is not None:
+        return EngineDecision(force, "задана флагом", facts)
+
+    if cached:
+        return EngineDecision('columns', "есть кэш колонок для этой версии файла", facts)
+    too_big = facts['memory_limit'] is not None and estimate > facts['memory_limit'] * MEMORY_HEADROOM
+    if (too_big or size >= CHECKPOINT_MIN_SIZE) and compression is None:
+        reason = ("оценка памяти больше доступной" if too_big else "большой файл") + \
+                 ", потоковое чтение с контрольными точками"
+        return EngineDecision('checkpoint', reason, facts)
+    reason = "файл помещается в память"
+    if too_big:
+        reason = "оценка памяти больше доступной, но потоковое чтение возможно только для несжатого файла"
+    if size >= COLUMNS_CACHE_MIN_SIZE:
+        return EngineDecision('csv', reason + ", колонки будут сохранены в кэш", facts, write_cache=True)
+    return EngineDecision('csv', reason, facts)
+
+
+def format_decision(decision):
+    """Возвращает отчёт о выбранной стратегии чтения
+
+    Args:
+        decision (EngineDecision): Выбранная стратегия
+    Returns:
+        str: Стратегия, причина и признаки, по которым она выбрана
+    """
+    names = {'memory_limit': 'доступно памяти', 'size': 'размер файла',
+             'compression': 'сжатие', 'columns_cache': 'кэш колонок', 'estimated_memory': 'оценка памяти'}
+    facts = ', '.join(f"{names[k]}: {v}" for k, v in decision.facts.items())
+    return f"Стратегия чтения: {decision.engine} ({decision.reason}; {facts})"
@@ -0,0 +1,119 @@
+import os
+import time
+from collections import deque
+from multiprocessing import Pipe, Process
+from multiprocessing.connection import wait
+from typing import NamedTuple
+
+TIMEOUT = 600
+RETRIES = 1
+
+
+class FarmResult(NamedTuple):
+    """Результат одной задачи фермы отчётов
+
+    Attributes:
+        name (str): Название задачи
+        ok (bool): Задача выполнена успешно
+        seconds (float): Время выполнения всех попыток в секундах
+        attempts (int): Количество попыток
+        error (str): Ошибка последней попытки, None при успехе
+    """
+    name: str
+    ok: bool
+    seconds: float
+    attempts: int
+    error: str
+
+
+def _run_task(conn, target, args):
+    """Выполняет задачу в дочернем процессе и отправляет результат и время выполнения по conn"""
+    start = time.perf_counter()
+    try:
+        target(*args)
+        conn.send((True, time.perf_counter() - start, None))
+    except Exception as e:
+        conn.send((False, time.perf_counter() - start, f"{type(e).__name__}: {e}"))
+    finally:
+        conn.close()
+
+
+def run_farm(tasks, target, workers=None, timeout=TIMEOUT, retries=RETRIES):
+    """Выполняет задачи параллельно в процессах, не больше workers одновременно
+
+    Каждая попытка выполняется в отдельном процессе, поэтому зависшую задачу можно остановить
+    по таймауту, не затрагивая остальные. Упавшая или не уложившаяся в таймаут задача
+    ставится в конец очереди ещё retries раз.
+
+    Args:
+        tasks (dict): Аргументы target (tuple) по названиям задач
+        target (Callable): Функция уровня модуля, выполняющая одну задачу
+        workers (int): Количество одновременно работающих процессов, по количеству процессоров если None
+        timeout (float): Таймаут одной попытки в секундах
+        retries (int): Количество повторов упавшей задачи
+    Returns:
+        list[FarmResult]: Результаты задач в порядке tasks
+    """
+    workers = max(1, workers or os.cpu_count() or 1)
+    names = list(tasks)
+    results = dict()
+    spent = dict.fromkeys(names, 0.0)
+    pending = deque((name, 1) for name in names)
+    running = dict()
+
+    def finish(conn, ok, seconds, error):
+        name, attempt, process, started = running.pop(conn)
+        conn.close()
+        process.join()
+        spent[name] += seconds
+        if not ok and attempt <= retries:
+            pending.append((name, attempt + 1))
+        else:
+            results[name] = FarmResult(name, ok, spent[name], attempt, error)
+
+    while pending or running:
+        while pending and len(running) < workers:
+            name, attempt = pending.popleft()
+            receiver, sender = Pipe(duplex=False)
+            process = Process(target=_run_task, args=(sender, target, tasks[name]), daemon=True)
+            process.start()
+            sender.close()
+            running[receiver] = (name, attempt, process, time.monotonic())
+
+        deadline = min(started for _, _, _, started in running.values()) + timeout
+        for conn in wait(list(running), max(0.0, deadline - time.monotonic())):
+            try:
+                finish(conn, *conn.recv())
+            except EOFError:
+                name, attempt, process, started = running[conn]
+                process.join()
+                finish(conn, False, time.monotonic() - started,
+                       f"Процесс завершился с кодом {process.exitcode} без результата")
+
+        now = time.monotonic()
+        for conn, (name, attempt, process, started) in list(running.items()):
+            if now - started >= timeout:
+                process.terminate()
+                finish(conn, False, now - started, f"Превышен таймаут {timeout} с")
+    return [results[name] for name in names]
+
+
+def format_summary(results, wall_seconds):
+    """Возвращает сводку времени выполнения задач фермы
+
+    Args:
+        results (list[FarmResult]): Результаты run_farm
+        wall_seconds (float): Общее время работы фермы в секундах
+    Returns:
+        str: Таблица с временем, количеством попыток и ошибками по задачам и итоговая строка
+    """
+    width = max((len(r.name) for r in results), default=6)
+    lines = [f"{'Отчёт':<{width}}  {'Время, с':>9}  Попытки  Результат"]
+    for r in sorted(results, key=lambda r: -r.seconds):
+        status = 'готов' if r.ok else r.error.splitlines()[0]
+        lines.append(f"{r.name:<{width}}  {r.seconds:>9.2f}  {r.attempts:>7}  {status}")
+    total = sum(r.seconds for r in results)
+    failed = sum(not r.ok for r in results)
+    lines.append(f"Отчётов: {len(results)}, с ошибками: {failed}, сумма времени: {total:.2f} с, "
+                 f"общее время: {wall_seconds:.2f} с")
+    return '\n'.join(lines)
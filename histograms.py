@@ -0,0 +1,95 @@
+from typing import NamedTuple
+
+import numpy as np
+
+SALARY_BINS = (1000, 2000, 5000, 10000, 20000, 50000, 100000, 200000, 500000, 1000000, 2000000, 5000000, 10000000)
+
+
+class SalaryHistograms(NamedTuple):
+    """Распределение зарплат по интервалам для каждого года
+
+    Attributes:
+        edges (tuple[int]): Границы интервалов: первый интервал — зарплаты меньше edges[0],
+            последний — не меньше edges[-1], поэтому интервалов на один больше, чем границ
+        counts (dict): Количество вакансий по интервалам (список) по годам
+        selected_counts (dict): То же для выбранной профессии
+    """
+    edges: tuple
+    counts: dict
+    selected_counts: dict
+
+
+def log_bins(low, high, per_decade=3):
+    """Возвращает границы интервалов, равномерных в логарифмическом масштабе, округлённые до 1-2-5
+
+    Args:
+        low (int): Нижняя граница (степень десяти)
+        high (int): Верхняя граница (степень десяти)
+        per_decade (int): Количество интервалов на порядок: 1 (1), 2 (1, 3), 3 (1, 2, 5)
+    Returns:
+        tuple[int]: Границы интервалов
+    """
+    steps = {1: (1,), 2: (1, 3), 3: (1, 2, 5)}[per_decade]
+    edges = []
+    decade = low
+    while decade < high:
+        edges.extend(step * decade for step in steps)
+        decade *= 10
+    return tuple(edges) + (high,)
+
+
+def bin_labels(edges):
+    """Возвращает подписи интервалов
+
+    Args:
+        edges (tuple[int]): Границы интервалов
+    Returns:
+        list[str]: Подписи вида 'до 1000', '1000–2000', 'от 10000000'
+    """
+    return ([f"до {edges[0]}"] + [f"{a}–{b}" for a, b in zip(edges, edges[1:])] + [f"от {edges[-1]}"])
+
+
+def salary_histograms(years, salaries, selected, edges=SALARY_BINS):
+    """Считает распределение зарплат по годам векторно: одним searchsorted и одним bincount
+
+    Args:
+        years (np.ndarray): Годы вакансий
+        salaries (np.ndarray): Зарплаты вакансий в рублях
+        selected (np.ndarray): Маска вакансий выбранной профессии
+        edges (tuple[int]): Границы интервалов
+    Returns:
+        SalaryHistograms: Количество вакансий по интервалам по годам (в порядке возрастания лет)
+    """
+    if len(years) == 0:
+        return SalaryHistograms(tuple(edges), dict(), dict())
+    years = np.asarray(years, dtype=np.int64)
+    num_bins = len(edges) + 1
+    start = int(years.min())
+    cells = (years - start) * num_bins + np.searchsorted(np.asarray(edges), salaries, side='right')
+    size = (int(years.max()) - start + 1) * num_bins
+    counts = np.bincount(cells, minlength=size).reshape(-1, num_bins)
+    selected_counts = np.bincount(cells[selected], minlength=size).reshape(-1, num_bins)
+    present = np.nonzero(counts.sum(axis=1))[0]
+    return SalaryHistograms(tuple(edges),
+                            {int(i) + start: counts[i].tolist() for i in present},
+                            {int(i) + start: selected_counts[i].tolist() for i in present})
+
+
+def merge_histograms(histograms):
+    """Складывает распределения зарплат, собранные по разным частям данных с одинаковыми границами
+
+    Args:
+        histograms (Iterable[SalaryHistograms]): Распределения зарплат частей данных
+    Returns:
+        SalaryHistograms: Общее распределение (в порядке возрастания лет), с границами SALARY_BINS если частей нет
+    """
+    edges = tuple(SALARY_BINS)
+    counts = dict()
+    selected_counts = dict()
+    for part in histograms:
+        edges = part.edges
+        for total, part_counts in ((counts, part.counts), (selected_counts, part.selected_counts)):
+            for year, row in part_counts.items():
+                total[year] = [a + b for a, b in zip(total[year], row)] if year in total else list(row)
+    return SalaryHistograms(edges, {k: counts[k] for k in sorted(counts)},
+                            {k: selected_counts[k] for k in sorted(selected_counts)})
@@ -1,5 +1,14 @@
+import asyncio
+import base64
 import csv
+import inspect
+import json
+import time
+import warnings
+from typing import NamedTuple
 from math import log10
+from itertools import compress
+from operator import attrgetter, itemgetter
 
 from openpyxl import Workbook
 from openpyxl.worksheet.worksheet import Worksheet
@@ -12,16 +21,66 @@ import numpy as np
 
 import pdfkit
 import os
+import shutil
+import sys
 from jinja2 import Template
 
-
-def getpath():
+from sketches import BloomFilter, NameSketch, SpaceSaving
+from periods import PeriodStat, month_index, period_stat, rolling_mean
+from compression import open_text
+from parquet_source import read_row_groups
+from sqlite_store import import_vacancies, query_rejects, query_stat
+from api_source import fetch_vacancies, item_to_fields
+from cube import SalaryCube
+from build_cache import BuildCache, content_hash
+from spill import SpillingAccumulator
+from preview import BlockSampler, PreviewStat
+from cluster import request_partials, serve
+from conversion import BATCH_SIZE, MAX_INT64, convert_months, convert_salaries
+import dashboard
+from checkpoint import Checkpoint, OffsetLineReader, input_identity
+from histograms import SALARY_BINS, bin_labels, merge_histograms, salary_histograms
+from pivot import add_pivot_cells, area_year_pivot, pivot_from_cells
+from farm import format_summary, run_farm
+from shared_columns import SharedColumns
+from engine import checkpoint_path as default_checkpoint_path
+from engine import choose_engine, columns_cache_path, format_decision, read_cache_meta, write_cache_meta
+
+
+def getpath(path="graph.png"):
     """Возвращает путь к графику
 
+    Args:
+        path (str): Путь к графику относительно текущего каталога или абсолютный
     Returns:
-        str: Путь к графику
+        str: Абсолютный путь к графику с прямыми слэшами
     """
-    return os.path.join(os.path.abspath("."), "graph.png").replace("\\", '/')
+    return os.path.abspath(path).replace("\\", '/')
+
+
+def is_path(target):
+    """Проверяет, что вывод задан путём к файлу, а не файловым объектом
+
+    Args:
+        target (str or os.PathLike or BinaryIO): Путь или двоичный файловый объект
+    Returns:
+        bool: True для пути
+    """
+    return isinstance(target, (str, os.PathLike))
+
+
+def write_output(target, data):
+    """Записывает вывод в файл по пути или в двоичный файловый объект (например, io.BytesIO)
+
+    Args:
+        target (str or os.PathLike or BinaryIO): Путь или двоичный файловый объект
+        data (bytes): Содержимое вывода
+    """
+    if is_path(target):
+        with open(target, 'wb') as file:
+            file.write(data)
+    else:
+        target.write(data)
 
 
 def get_percent(v):
@@ -35,6 +94,233 @@ def get_percent(v):
     return f"{v * 100:.2f}%"
 
 
+def report_columns(vacancy_name):
+    """Возвращает названия колонок таблицы статистики по годам
+
+    Args:
+        vacancy_name (str): Название выбранной профессии
+    Returns:
+        list[str]: Названия колонок
+    """
+    return ["Год",
+            "Средняя зарплата",
+            "Средняя зарплата - " + vacancy_name,
+            "Количество вакансий",
+            "Количество вакансий - " + vacancy_name]
+
+
+class SalaryStat(NamedTuple):
+    """Итоговая статистика по вакансиям (сериализуется pickle, поэтому её можно передавать между процессами)
+
+    Attributes:
+        salary_stat (dict): Динамика уровня зарплат по годам
+        vacancy_count_stat (dict): Динамика количества вакансий по годам
+        selected_salary_stat (dict): Динамика уровня зарплат по годам для выбранной профессии
+        selected_count_stat (dict): Динамика количества вакансий по годам для выбранной профессии
+        area_salary_stat (dict): Уровень зарплат по городам (в порядке убывания)
+        doly_stat (dict): Доля вакансий по городам (в порядке убывания)
+    """
+    salary_stat: dict
+    vacancy_count_stat: dict
+    selected_salary_stat: dict
+    selected_count_stat: dict
+    area_salary_stat: dict
+    doly_stat: dict
+
+
+def finalize_stat(total, salary_stat, vacancy_count_stat, selected_salary_stat, selected_count_stat,
+                  area_salary_stat, area_count_stat, doly_stat):
+    """Переводит накопленные суммы и количества в итоговую статистику
+
+    Arguments:
+        total (int): Общее количество вакансий
+        salary_stat (dict): Сумма зарплат по годам
+        vacancy_count_stat (dict): Количество вакансий по годам
+        selected_salary_stat (dict): Сумма зарплат по годам для выбранной профессии
+        selected_count_stat (dict): Количество вакансий по годам для выбранной профессии
+        area_salary_stat (dict): Сумма зарплат по городам
+        area_count_stat (dict): Количество зарплат по городам
+        doly_stat (dict): Количество вакансий по городам
+    Returns:
+        SalaryStat: Динамика уровня зарплат и количества вакансий по годам, то же для выбранной профессии,
+            уровень зарплат и доля вакансий по городам (в порядке убывания)
+    """
+    doly_stat = {k: doly_stat[k] / total for k in doly_stat if doly_stat[k] >= int(total / 100)}
+    doly_stat = {k: round(doly_stat[k], 4) for k in sorted(doly_stat, key=lambda k: -doly_stat[k])}
+    salary_stat = {k: salary_stat[k] // vacancy_count_stat[k] for k in sorted(salary_stat)}
+    vacancy_count_stat = {k: vacancy_count_stat[k] for k in sorted(vacancy_count_stat)}
+    selected_salary_stat = {
+        k: selected_salary_stat[k] // selected_count_stat[k] if selected_count_stat[k] != 0 else 0 for k in
+        sorted(selected_salary_stat)}
+    selected_count_stat = {k: selected_count_stat[k] for k in sorted(selected_count_stat)}
+    area_salary_stat = {k: area_salary_stat[k] // area_count_stat[k] for k in area_salary_stat if k in doly_stat}
+    area_salary_stat = {k: area_salary_stat[k] for k in
+                        sorted(area_salary_stat, key=lambda k: -area_salary_stat[k])}
+    return SalaryStat(salary_stat, vacancy_count_stat, selected_salary_stat, selected_count_stat, area_salary_stat,
+                      doly_stat)
+
+
+OUTPUTS = ('excel', 'image', 'pdf', 'json', 'html')
+HISTOGRAM_OUTPUTS = {'excel', 'image', 'pdf'}
+PIVOT_OUTPUTS = {'excel', 'image'}
+OUTPUT_PATHS = {'excel': "report.xlsx", 'image': "graph.png", 'pivot': "pivot.png", 'pdf': "report.pdf",
+                'json': "stats.json", 'html': "report.html"}
+
+
+def get_outputs(print_type):
+    """Возвращает множество выводов для print_type
+
+    Arguments:
+        print_type (int or Iterable[str]): 0 — Excel, 1 — PDF (с графиком) или набор выводов из OUTPUTS
+    Returns:
+        set[str]: Множество выводов из OUTPUTS
+    """
+    if print_type == 0:
+        return {'excel'}
+    if print_type == 1:
+        return {'pdf'}
+    outputs = set(print_type)
+    if not outputs <= set(OUTPUTS):
+        raise ValueError(f"Неизвестные выводы: {outputs - set(OUTPUTS)}")
+    return outputs
+
+
+def output_stat(print_type, vacancy_name, salary_stat, vacancy_count_stat, selected_salary_stat,
+                selected_count_stat, area_salary_stat, doly_stat, report=None, build_cache=None, histograms=None,
+                pivot=None, paths=None, name_estimates=None, period_stats=None):
+    """Просит объект Report вывести одну и ту же статистику во все запрошенные файлы
+
+    Если передан build_cache, report.xlsx, graph.png, pivot.png, report.pdf и report.html не генерируются заново, когда
+    хэш их входных данных (статистики, исходного кода и шаблона класса Report, параметров отрисовки) не изменился.
+    Выводы в файловые объекты генерируются всегда.
+
+    Arguments:
+        print_type (int or Iterable[str]):
+            Данные о вакансиях выводятся в файл Excel, если 0.
+            Статистика выводится в .pdf файл, если 1.
+            Иначе набор выводов из OUTPUTS: 'excel' (report.xlsx), 'image' (graph.png),
+            'pdf' (report.pdf вместе с graph.png), 'json' (stats.json) и 'html'
+            (report.html с графиками SVG, быстрая замена PDF).
+        vacancy_name (str): Название выбранной профессии
+        salary_stat (dict): Динамика уровня зарплат по годам
+        vacancy_count_stat (dict): Динамика количества вакансий по годам
+        selected_salary_stat (dict): Динамика уровня зарплат по годам для выбранной профессии
+        selected_count_stat (dict): Динамика количества вакансий по годам для выбранной профессии
+        area_salary_stat (dict): Уровень зарплат по городам (в порядке убывания)
+        doly_stat (dict): Доля вакансий по городам (в порядке убывания)
+        report (Report): Объект вывода, по умолчанию создаётся для vacancy_name
+        build_cache (BuildCache): Манифест хэшей входных данных, все файлы генерируются заново если None
+        histograms (SalaryHistograms): Распределение зарплат по годам для дополнительного листа Excel
+            и графика, не выводится если None
+        pivot (AreaYearPivot): Матрица город × год для листов Excel и тепловой карты pivot.png
+            (выводится вместе с графиком), не выводится если None
+        paths (dict): Пути или двоичные файловые объекты (например, io.BytesIO) выводов по ключам
+            OUTPUT_PATHS ('pivot' — тепловая карта pivot.png), для остальных выводов пути по умолчанию.
+            Для PDF в памяти график тоже нужно выводить в файловый объект с методом getvalue
+        name_estimates (dict): Оценки NameSketch.estimates для stats.json, не выводятся если None
+        period_stats (PeriodStat): Статистика по месяцам или кварталам для листа Excel и stats.json,
+            не выводится если None
+    """
+    outputs = get_outputs(print_type)
+    if report is None:
+        report = Report(report_columns(vacancy_name), vacancy_name)
+    if build_cache is None:
+        build_cache = BuildCache(None)
+    paths = {**OUTPUT_PATHS, **(paths or dict())}
+
+    def is_fresh(output, key):
+        return is_path(paths[output]) and build_cache.is_fresh(paths[output], key)
+
+    def record(output, key):
+        if is_path(paths[output]):
+            build_cache.record(paths[output], key)
+
+    stats = (salary_stat, vacancy_count_stat, selected_salary_stat, selected_count_stat, area_salary_stat, doly_stat)
+    renderer = ''.join(inspect.getsource(f) for f in vars(Report).values() if inspect.isfunction(f))
+    if 'excel' in outputs:
+        data = [salary_stat, selected_salary_stat, vacancy_count_stat, selected_count_stat]
+        data2 = [{k: area_salary_stat[k] for i, k in zip(range(10), area_salary_stat)},
+                 {k: doly_stat[k] for i, k in zip(range(10), doly_stat)}]
+        key = content_hash('excel', renderer, report.columns, data, data2, histograms, pivot, period_stats)
+        if not is_fresh('excel', key):
+            report.generate_excel(data, data2, histograms, pivot, path=paths['excel'], period_stats=period_stats)
+            record('excel', key)
+    if 'pdf' in outputs or 'image' in outputs:
+        image_key = content_hash('image', renderer, vacancy_name, stats, histograms)
+        if not is_fresh('image', image_key):
+            report.generate_image(*stats, histograms=histograms, path=paths['image'])
+            record('image', image_key)
+    if 'image' in outputs and pivot is not None:
+        key = content_hash('pivot', renderer, pivot)
+        if not is_fresh('pivot', key):
+            report.generate_pivot_image(pivot, path=paths['pivot'])
+            record('pivot', key)
+    if 'pdf' in outputs:
+        key = content_hash('pdf', renderer, vacancy_name, report.columns, stats, image_key,
+                           getpath(paths['image']) if is_path(paths['image']) else None)
+        if not is_fresh('pdf', key):
+            report.generate_pdf(*stats, render_image=False, path=paths['pdf'], image=paths['image'])
+            record('pdf', key)
+    if 'html' in outputs:
+        key = content_hash('html', renderer, inspect.getsource(dashboard), vacancy_name, stats)
+        if not is_fresh('html', key):
+            report.generate_html({vacancy_name: stats}, paths['html'])
+            record('html', key)
+    if 'json' in outputs:
+        report.generate_json(*stats, path=paths['json'], name_estimates=name_estimates, period_stats=period_stats)
+
+
+def render_report(directory, vacancy_name, stats, print_type, histograms=None, pivot=None):
+    """Выводит статистику одной профессии в отдельный каталог (задача фермы отчётов)
+
+    Arguments:
+        directory (str): Каталог для файлов отчёта, создаётся если его нет
+        vacancy_name (str): Название выбранной профессии
+        stats (SalaryStat): Итоговая статистика
+        print_type (int or Iterable[str]): Выводы (см. output_stat)
+        histograms (SalaryHistograms): Распределение зарплат по годам, не выводится если None
+        pivot (AreaYearPivot): Матрица город × год, не выводится если None
+    """
+    os.makedirs(directory, exist_ok=True)
+    output_stat(print_type, vacancy_name, *stats, build_cache=BuildCache(os.path.join(directory, '.report_cache.json')),
+                histograms=histograms, pivot=pivot,
+                paths={output: os.path.join(directory, path) for output, path in OUTPUT_PATHS.items()})
+
+
+def render_shared_report(directory, vacancy_name, columns_path, print_type):
+    """Собирает статистику одной профессии по общим колонкам и выводит её в каталог (задача фермы отчётов)
+
+    Задача только подключается к колонкам, записанным DataSet.share, без чтения .csv файла и копирования данных.
+
+    Arguments:
+        directory (str): Каталог для файлов отчёта, создаётся если его нет
+        vacancy_name (str): Название выбранной профессии
+        columns_path (str): Каталог общих колонок (SharedColumns.path)
+        print_type (int or Iterable[str]): Выводы (см. output_stat)
+    """
+    with SharedDataSet(columns_path) as data_set:
+        render_report(directory, vacancy_name, finalize_stat(*data_set.get_partial_stat(vacancy_name)), print_type,
+                      data_set.get_salary_histograms(vacancy_name), data_set.get_area_year_pivot())
+
+
+def merge_partial_stats(partials):
+    """Складывает суммы и количества, собранные get_partial_stat по разным частям данных
+
+    Arguments:
+        partials (Iterable[tuple]): Результаты get_partial_stat
+    Returns:
+        tuple: Общий результат в формате get_partial_stat
+    """
+    total = 0
+    merged = [dict() for _ in range(7)]
+    for partial in partials:
+        total += partial[0]
+        for stat, part in zip(merged, partial[1:]):
+            for k, v in part.items():
+                stat[k] = stat.get(k, 0) + v
+    return (total, *merged)
+
+
 class Vacancy:
     """Класс для хранения данных о вакансии
 
@@ -42,6 +328,7 @@ class Vacancy:
         name (str): Название вакансии
         area_name (str): Название города вакансии
         year (int): Год, в котором были сохранены данные о вакансии
+        month (int): Номер месяца публикации вакансии (год * 12 + месяц - 1)
         salary_currency (str): Валюта вакансии
         salary (int): Средняя зарплата вакансии в рублях
     """
@@ -68,16 +355,42 @@ class Vacancy:
             salary_currency (str): Валюта вакансии
             salary_from (int or float or str): Нижняя граница оклада вакансии
             salary_to (int or float or str): Верхняя граница оклада вакансии
+        Raises:
+            ValueError: Если оклад не число или зарплата в рублях не помещается в int64
         """
         self.name = kwargs['name']
         self.area_name = kwargs['area_name']
-        spliten = kwargs['published_at'].split('T')
-        date = spliten[0].split('-')
-        self.year = int(date[0])
+        self.month = month_index(kwargs['published_at'])
+        self.year = self.month // 12
 
         self.salary_currency = kwargs['salary_currency']
-        self.salary = int((float(kwargs['salary_from']) + float(kwargs['salary_to'])) // 2 *
-                          self.currency_to_ruble[self.salary_currency])
+        salary = ((float(kwargs['salary_from']) + float(kwargs['salary_to'])) // 2 *
+                  self.currency_to_ruble[self.salary_currency])
+        if not abs(salary) < MAX_INT64:
+            raise ValueError(f'Зарплата {salary} не помещается в int64')
+        self.salary = int(salary)
+
+    @classmethod
+    def from_values(cls, name, area_name, month, salary_currency, salary):
+        """Создаёт объект Vacancy из уже разобранных значений, без повторной конвертации
+
+        Args:
+            name (str): Название вакансии
+            area_name (str): Название города вакансии
+            month (int): Номер месяца публикации вакансии (год * 12 + месяц - 1)
+            salary_currency (str): Валюта вакансии
+            salary (int): Средняя зарплата вакансии в рублях
+        Returns:
+            Vacancy: Объект Vacancy
+        """
+        vacancy = cls.__new__(cls)
+        vacancy.name = name
+        vacancy.area_name = area_name
+        vacancy.month = month
+        vacancy.year = month // 12
+        vacancy.salary_currency = salary_currency
+        vacancy.salary = salary
+        return vacancy
 
 
 class DataSet:
@@ -86,21 +399,74 @@ class DataSet:
     Attributes:
         header (str[]): Названия полей о вакансии из csv файла
         vacancies_objects (Vacancy[]): Массив с данными о всех вакансиях из csv файла
+        rejects (dict): Количество отклонённых при чтении строк по причинам
     """
 
     def __init__(self, header):
         """Инициализирует объект DataSet"""
         self.header = header
         self.vacancies_objects = []
+        self.rejects = dict()
 
-    def get_stat(self, vacancy_name, print_type):
+    def get_stat(self, vacancy_name, print_type, approx=False, capacity=1000, granularity=None, memory_budget=None,
+                 report=None, build_cache=None):
         """Собирает статистику и данные о вакансиях и просит класс Report вывести их
 
         Attributes:
             vacancy_name (str): Название вакансии, о которой нужно отдельно собрать статистику
-            print_type (int):
+            print_type (int or Iterable[str]):
                 Метод собирает данные о вакансиях в файл Excel, если 0.
                 Метод собирает статистику в .pdf файл, если 1.
+                Иначе набор выводов из OUTPUTS, которые строятся по одному проходу статистики.
+                Распределение зарплат собирается только для Excel, графика и PDF, а матрица город × год —
+                только для Excel и графика, если не заданы approx или memory_budget.
+            approx (bool): Приближённый режим (см. get_partial_stat), в stats.json дополнительно выводятся
+                оценки количества различных названий вакансий по годам и самых частых названий
+            capacity (int): Количество счётчиков Space-Saving в приближённом режиме
+            granularity (str): Дополнительно вывести статистику по месяцам ('month') или кварталам ('quarter')
+                в report.xlsx и stats.json
+            memory_budget (int): Бюджет памяти в байтах для сумм по городам (см. get_partial_stat)
+            report (Report): Объект вывода, по умолчанию создаётся для vacancy_name
+            build_cache (BuildCache): Манифест для пропуска неизменившихся файлов, все генерируются если None
+        """
+        outputs = get_outputs(print_type)
+        with_histograms = bool(outputs & HISTOGRAM_OUTPUTS)
+        # Матрица город × год хранит все города, поэтому в режимах с ограниченной памятью не строится
+        with_pivot = bool(outputs & PIVOT_OUTPUTS) and not approx and memory_budget is None
+        columns = None
+        if with_histograms or with_pivot or granularity is not None:
+            columns = self.get_columns(vacancy_name, areas=with_pivot)
+        names = NameSketch(capacity) if approx else None
+        output_stat(outputs, vacancy_name, *finalize_stat(
+            *self.get_partial_stat(vacancy_name, approx, capacity, memory_budget, names)), report=report,
+                    build_cache=build_cache,
+                    histograms=self.get_salary_histograms(vacancy_name, columns=columns) if with_histograms else None,
+                    pivot=self.get_area_year_pivot(columns) if with_pivot else None,
+                    name_estimates=names.estimates() if approx else None,
+                    period_stats=None if granularity is None else self.get_period_stat(vacancy_name, granularity,
+                                                                                       columns=columns))
+        return
+
+    def get_partial_stat(self, vacancy_name, approx=False, capacity=1000, memory_budget=None, names=None):
+        """Собирает суммы и количества зарплат по годам и городам за один проход по вакансиям
+
+        Результаты для разных частей данных можно сложить merge_partial_stats.
+
+        Attributes:
+            vacancy_name (str): Название вакансии, о которой нужно отдельно собрать статистику
+            approx (bool): Приближённый режим: статистика по городам собирается скетчем Space-Saving
+                в фиксированной памяти
+            capacity (int): Количество счётчиков Space-Saving в приближённом режиме.
+                Города с долей больше 1 / capacity гарантированно попадают в статистику
+            memory_budget (int): Бюджет памяти в байтах для сумм по городам. При превышении частичные суммы
+                сбрасываются в отсортированные файлы на диске и сливаются в конце, результат совпадает
+                с обычным режимом (в сумме остаются только города с долей не меньше 1%)
+            names (NameSketch): Скетч, в который дополнительно добавляются годы и названия вакансий
+                для оценки количества различных названий и самых частых названий
+        Returns:
+            tuple: Общее количество вакансий, суммы и количества зарплат по годам, то же для выбранной
+                профессии, суммы и количества зарплат по городам и количество вакансий по городам
+                (в порядке аргументов finalize_stat)
         """
         vacancies = self.vacancies_objects
         doly_stat = dict()
@@ -110,15 +476,26 @@ class DataSet:
         selected_count_stat = dict()
         area_salary_stat = dict()
         area_count_stat = dict()
+        if approx:
+            areas = SpaceSaving(capacity)
+        elif memory_budget is not None:
+            areas = SpillingAccumulator(memory_budget)
         for vacancy in vacancies:
             salary = vacancy.salary
-            if vacancy.area_name not in doly_stat:
-                doly_stat[vacancy.area_name] = 0
-                area_salary_stat[vacancy.area_name] = 0
-                area_count_stat[vacancy.area_name] = 0
-            doly_stat[vacancy.area_name] += 1
-            area_salary_stat[vacancy.area_name] += salary
-            area_count_stat[vacancy.area_name] += 1
+            if approx:
+                areas.add(vacancy.area_name, salary)
+            elif memory_budget is not None:
+                areas.add(vacancy.area_name, salary)
+            else:
+                if vacancy.area_name not in doly_stat:
+                    doly_stat[vacancy.area_name] = 0
+                    area_salary_stat[vacancy.area_name] = 0
+                    area_count_stat[vacancy.area_name] = 0
+                doly_stat[vacancy.area_name] += 1
+                area_salary_stat[vacancy.area_name] += salary
+                area_count_stat[vacancy.area_name] += 1
+            if names is not None:
+                names.add(vacancy.year, vacancy.name)
 
             if vacancy.year not in salary_stat:
                 salary_stat[vacancy.year] = 0
@@ -131,36 +508,413 @@ class DataSet:
                 selected_salary_stat[vacancy.year] += salary
                 selected_count_stat[vacancy.year] += 1
 
-        doly_stat = {k: doly_stat[k] / len(vacancies) for k in doly_stat if doly_stat[k] >= int(len(vacancies) / 100)}
-        doly_stat = {k: round(doly_stat[k], 4) for k in sorted(doly_stat, key=lambda k: -doly_stat[k])}
-        salary_stat = {k: salary_stat[k] // vacancy_count_stat[k] for k in sorted(salary_stat)}
-        selected_salary_stat = {
-            k: selected_salary_stat[k] // selected_count_stat[k] if selected_count_stat[k] != 0 else 0 for k in
-            sorted(selected_salary_stat)}
-        area_salary_stat = {k: area_salary_stat[k] // area_count_stat[k] for k in area_salary_stat if k in doly_stat}
-        area_salary_stat = {k: area_salary_stat[k] for k in
-                            sorted(area_salary_stat, key=lambda k: -area_salary_stat[k])}
-
-        if print_type == 0:
-            report.generate_excel(
-                [salary_stat, selected_salary_stat, vacancy_count_stat, selected_count_stat],
-                [{k: area_salary_stat[k] for i, k in zip(range(10), area_salary_stat)},
-                 {k: doly_stat[k] for i, k in zip(range(10), doly_stat)}]
-            )
-        else:
-            report.generate_pdf(salary_stat, vacancy_count_stat, selected_salary_stat,
-                                selected_count_stat, area_salary_stat, doly_stat)
+        if approx:
+            doly_stat, area_salary_stat, area_count_stat = areas.counts, areas.sums, areas.observed
+        elif memory_budget is not None:
+            threshold = int(len(vacancies) / 100)
+            try:
+                kept = sorted((first, key, salary, count) for key, salary, count, first in areas.items()
+                              if count >= threshold)
+            finally:
+                areas.close()
+            for first, key, salary, count in kept:
+                doly_stat[key] = count
+                area_salary_stat[key] = salary
+                area_count_stat[key] = count
+
+        return (len(vacancies), salary_stat, vacancy_count_stat, selected_salary_stat, selected_count_stat,
+                area_salary_stat, area_count_stat, doly_stat)
+
+    def get_columns(self, vacancy_name=None, areas=False):
+        """Извлекает из вакансий столбцы numpy для распределения зарплат, матрицы город × год
+        и статистики по периодам
+
+        Каждое поле читается из объектов Vacancy один раз, а год получается из номера месяца.
 
+        Attributes:
+            vacancy_name (str): Название выбранной профессии, маска 'selected' не строится если None
+            areas (bool): Дополнительно построить коды городов
+        Returns:
+            dict: Столбцы 'month', 'year' и 'salary', маска 'selected', а если areas, то ещё
+                'area_codes' и 'areas' (названия городов в порядке первого появления)
         """
-        print('Динамика уровня зарплат по годам:', salary_stat)
-        print('Динамика количества вакансий по годам:', vacancy_count_stat)
-        print('Динамика уровня зарплат по годам для выбранной профессии:', selected_salary_stat)
-        print('Динамика количества вакансий по годам для выбранной профессии:', selected_count_stat)
-        print('Уровень зарплат по городам (в порядке убывания):',
-              {k: area_salary_stat[k] for i, k in zip(range(10), area_salary_stat)})
-        print('Доля вакансий по городам (в порядке убывания):', {k: doly_stat[k] for i, k in zip(range(10), doly_stat)})
+        vacancies = self.vacancies_objects
+        count = len(vacancies)
+        months = np.fromiter(map(attrgetter('month'), vacancies), dtype=np.int32, count=count)
+        columns = {'month': months, 'year': months // 12,
+                   'salary': np.fromiter(map(attrgetter('salary'), vacancies), dtype=np.int64, count=count)}
+        if vacancy_name is not None:
+            columns['selected'] = np.fromiter((vacancy_name in v.name for v in vacancies), dtype=bool, count=count)
+        if areas:
+            codes = dict()
+            columns['area_codes'] = np.fromiter((codes.setdefault(v.area_name, len(codes)) for v in vacancies),
+                                                dtype=np.int64, count=count)
+            columns['areas'] = list(codes)
+        return columns
+
+    def get_period_stat(self, vacancy_name, granularity='month', window=3, columns=None):
+        """Собирает статистику по месяцам или кварталам
+
+        Attributes:
+            vacancy_name (str): Название вакансии, о которой нужно отдельно собрать статистику
+            granularity (str): 'month' или 'quarter'
+            window (int): Размер окна скользящей средней зарплаты в календарных периодах
+            columns (dict): Столбцы get_columns для vacancy_name, извлекаются заново если None
+        Returns:
+            PeriodStat: Статистика по периодам
         """
-        return
+        if columns is None:
+            columns = self.get_columns(vacancy_name)
+        months, salaries, selected = columns['month'], columns['salary'], columns['selected']
+
+        salary_stat, count_stat = period_stat(months, salaries, granularity)
+        selected_salary_stat, selected_count_stat = period_stat(months[selected], salaries[selected], granularity)
+        selected_salary_stat = {k: selected_salary_stat.get(k, 0) for k in salary_stat}
+        selected_count_stat = {k: selected_count_stat.get(k, 0) for k in salary_stat}
+        return PeriodStat(granularity, salary_stat, rolling_mean(salary_stat, window, granularity), count_stat,
+                          selected_salary_stat, selected_count_stat)
+
+    def get_salary_histograms(self, vacancy_name, edges=SALARY_BINS, columns=None):
+        """Собирает распределение зарплат по интервалам для каждого года
+
+        Attributes:
+            vacancy_name (str): Название вакансии, о которой нужно отдельно собрать статистику
+            edges (tuple[int]): Границы интервалов (по умолчанию логарифмические 1-2-5 от 1000 до 10000000)
+            columns (dict): Столбцы get_columns для vacancy_name, извлекаются заново если None
+        Returns:
+            SalaryHistograms: Количество вакансий по интервалам по годам, всего и для выбранной профессии
+        """
+        if columns is None:
+            columns = self.get_columns(vacancy_name)
+        return salary_histograms(columns['year'], columns['salary'], columns['selected'], edges)
+
+    def get_area_year_pivot(self, columns=None):
+        """Собирает матрицу сумм и количеств зарплат город × год
+
+        Attributes:
+            columns (dict): Столбцы get_columns с кодами городов, извлекаются заново если None
+        Returns:
+            AreaYearPivot: Матрица город × год (города в порядке убывания количества вакансий)
+        """
+        if columns is None:
+            columns = self.get_columns(areas=True)
+        return area_year_pivot(columns['year'], columns['area_codes'], columns['areas'], columns['salary'])
+
+    def share(self, path=None):
+        """Записывает вакансии колонками для общего доступа из других процессов (см. SharedDataSet)
+
+        Attributes:
+            path (str): Каталог для колонок (сохраняется), временный каталог если None
+        Returns:
+            SharedColumns: Колонки вакансий, временный каталог удаляется при их close
+        """
+        return SharedColumns.create(self.vacancies_objects, path)
+
+    def build_cube(self, professions):
+        """Строит куб сумм и количеств зарплат по годам, городам и профессиям
+
+        Attributes:
+            professions (Iterable[str]): Названия профессий для измерения профессий
+        Returns:
+            SalaryCube: Объект SalaryCube
+        """
+        vacancies = self.vacancies_objects
+        return SalaryCube.build([v.year for v in vacancies], [v.area_name for v in vacancies],
+                                [v.name for v in vacancies], [v.salary for v in vacancies], professions,
+                                self.rejects)
+
+
+class PartialStatDataSet:
+    """Базовый класс для источников, которые сами собирают суммы и количества в формате DataSet.get_partial_stat
+
+    Наследники переопределяют get_partial_stat, а если могут, то и get_salary_histograms
+    и get_area_year_pivot (по умолчанию дополнительные листы и графики не выводятся).
+
+    Attributes:
+        rejects (dict): Количество отклонённых при чтении строк по причинам
+    """
+
+    def __init__(self, rejects=None):
+        """Инициализирует объект PartialStatDataSet
+
+        Args:
+            rejects (dict): Количество отклонённых при чтении строк по причинам
+        """
+        self.rejects = dict(rejects or dict())
+
+    def get_partial_stat(self, vacancy_name):
+        """Собирает суммы и количества зарплат по годам и городам
+
+        Attributes:
+            vacancy_name (str): Название вакансии, о которой нужно отдельно собрать статистику
+        Returns:
+            tuple: Результат в формате DataSet.get_partial_stat
+        """
+        raise NotImplementedError
+
+    def get_salary_histograms(self, vacancy_name):
+        """Собирает распределение зарплат по годам (см. DataSet.get_salary_histograms), None если нельзя"""
+        return None
+
+    def get_area_year_pivot(self):
+        """Собирает матрицу город × год (см. DataSet.get_area_year_pivot), None если источник не может"""
+        return None
+
+    def get_stat(self, vacancy_name, print_type, report=None, build_cache=None):
+        """Собирает статистику get_partial_stat и просит класс Report вывести её
+
+        Attributes:
+            vacancy_name (str): Название вакансии, о которой нужно отдельно собрать статистику
+            print_type (int or Iterable[str]):
+                Метод собирает данные о вакансиях в файл Excel, если 0.
+                Метод собирает статистику в .pdf файл, если 1.
+                Иначе набор выводов из OUTPUTS, которые строятся по одному проходу статистики.
+            report (Report): Объект вывода, по умолчанию создаётся для vacancy_name
+            build_cache (BuildCache): Манифест для пропуска неизменившихся файлов, все генерируются если None
+        """
+        outputs = get_outputs(print_type)
+        output_stat(outputs, vacancy_name, *finalize_stat(*self.get_partial_stat(vacancy_name)),
+                    report=report, build_cache=build_cache,
+                    histograms=self.get_salary_histograms(vacancy_name) if outputs & HISTOGRAM_OUTPUTS else None,
+                    pivot=self.get_area_year_pivot() if outputs & PIVOT_OUTPUTS else None)
+
+
+def add_rejects(total, rejects):
+    """Прибавляет количество отклонённых строк по причинам к общему
+
+    Args:
+        total (dict): Общее количество отклонённых строк по причинам, пополняется
+        rejects (dict): Количество отклонённых строк по причинам
+    """
+    for reason, count in rejects.items():
+        total[reason] = total.get(reason, 0) + count
+
+
+class CubeDataSet(PartialStatDataSet):
+    """Класс для вывода информации о вакансиях из предрассчитанного куба SalaryCube
+
+    Attributes:
+        cube (SalaryCube): Куб сумм и количеств зарплат
+        years (tuple[int, int]): Диапазон лет среза включительно, все годы если None
+        areas (Iterable[str]): Города среза, все города если None
+        rejects (dict): Количество строк, отклонённых при построении куба, по причинам
+    """
+
+    def __init__(self, path, years=None, areas=None):
+        """Инициализирует объект CubeDataSet, загружая куб из файла"""
+        self.cube = SalaryCube.load(path)
+        self.years = years
+        self.areas = areas
+        super().__init__(self.cube.rejects)
+
+    def get_partial_stat(self, vacancy_name):
+        """Собирает суммы и количества по срезу куба (vacancy_name — профессия из куба)"""
+        return self.cube.query(vacancy_name, self.years, self.areas)
+
+
+class ClusterDataSet(PartialStatDataSet):
+    """Класс для вывода информации о вакансиях, распределённых по рабочим узлам (команда worker)
+
+    Attributes:
+        addresses (list[str]): Адреса рабочих узлов вида 'host:port'
+        rejects (dict): Количество строк, отклонённых рабочими узлами, по причинам
+            (заполняется при сборе статистики)
+    """
+
+    def __init__(self, addresses):
+        """Инициализирует объект ClusterDataSet"""
+        self.addresses = addresses
+        super().__init__()
+
+    def get_partial_stat(self, vacancy_name):
+        """Собирает частичную статистику со всех рабочих узлов и складывает её"""
+        results = request_partials(self.addresses, vacancy_name)
+        self.rejects = dict()
+        for _, rejects in results:
+            add_rejects(self.rejects, rejects)
+        return merge_partial_stats(partial for partial, _ in results)
+
+
+class StoredDataSet(PartialStatDataSet):
+    """Класс для вывода информации о вакансиях, загруженных в базу SQLite командой import
+
+    Attributes:
+        db_path (str): Путь к файлу базы данных
+        rejects (dict): Количество строк, отклонённых при загрузке, по причинам
+    """
+
+    def __init__(self, db_path):
+        """Инициализирует объект StoredDataSet"""
+        self.db_path = db_path
+        super().__init__(query_rejects(db_path))
+
+    def get_partial_stat(self, vacancy_name):
+        """Собирает суммы и количества запросами к базе"""
+        return query_stat(self.db_path, vacancy_name)
+
+
+CHECKPOINT_INTERVAL = 64 << 20
+CHECKPOINT_FORMAT = 2
+
+
+class CheckpointedDataSet(PartialStatDataSet):
+    """Класс для вывода информации о вакансиях из большого .csv файла с контрольными точками
+
+    Вакансии не хранятся в памяти: суммы и количества get_partial_stat, распределение зарплат
+    и ячейки матрицы город × год накапливаются по пачкам read_vacancy_batches, и примерно каждые
+    interval байт входного файла они вместе со смещением и отклонёнными строками записываются
+    в контрольную точку. Перезапуск с тем же файлом и той же профессией продолжает чтение
+    с последней контрольной точки, а результат совпадает с запуском без перерыва и с DataSet.
+    После успешного чтения контрольная точка удаляется. Если контрольную точку не удаётся записать,
+    чтение продолжается без неё.
+
+    Attributes:
+        filename (str): Путь к несжатому .csv файлу
+        checkpoint (Checkpoint): Контрольная точка
+        interval (int): Количество байт входного файла между контрольными точками
+        rejects (dict): Количество отклонённых строк по причинам (заполняется при сборе статистики)
+        histograms (SalaryHistograms): Распределение зарплат по годам (заполняется при сборе статистики)
+        pivot (AreaYearPivot): Матрица город × год (заполняется при сборе статистики)
+    """
+
+    def __init__(self, filename, checkpoint_path=None, interval=CHECKPOINT_INTERVAL):
+        """Инициализирует объект CheckpointedDataSet
+
+        Args:
+            filename (str): Путь к несжатому .csv файлу
+            checkpoint_path (str): Путь к файлу контрольной точки, по умолчанию в каталоге кэша (см. cache_dir)
+            interval (int): Количество байт входного файла между контрольными точками
+        """
+        self.filename = filename
+        self.checkpoint = Checkpoint(checkpoint_path or default_checkpoint_path(filename))
+        self.interval = interval
+        self.histograms = None
+        self.pivot = None
+        super().__init__()
+
+    def get_partial_stat(self, vacancy_name):
+        """Собирает суммы и количества зарплат, продолжая с контрольной точки, если она есть
+
+        Заодно собираются распределение зарплат и матрица город × год (histograms и pivot).
+
+        Attributes:
+            vacancy_name (str): Название вакансии, о которой нужно отдельно собрать статистику
+        Returns:
+            tuple: Результат в формате DataSet.get_partial_stat
+        """
+        key = (input_identity(self.filename), vacancy_name, CHECKPOINT_FORMAT)
+        offset, partial, self.rejects, histograms, cells = self.checkpoint.load(key) or (
+            None, merge_partial_stats([]), dict(), merge_histograms([]), dict())
+        saving = True
+        with OffsetLineReader(self.filename, offset) as lines:
+            next_checkpoint = lines.offset + self.interval
+            batch_set = DataSet(lines.header)
+            for batch in read_vacancy_batches(csv.reader(lines), lines.header, self.rejects):
+                batch_set.vacancies_objects = batch
+                partial = merge_partial_stats([partial, batch_set.get_partial_stat(vacancy_name)])
+                columns = batch_set.get_columns(vacancy_name, areas=True)
+                histograms = merge_histograms([histograms, batch_set.get_salary_histograms(vacancy_name,
+                                                                                           columns=columns)])
+                add_pivot_cells(cells, columns['year'], columns['area_codes'], columns['areas'], columns['salary'])
+                if saving and lines.offset >= next_checkpoint:
+                    try:
+                        self.checkpoint.save(key, (lines.offset, partial, self.rejects, histograms, cells))
+                    except OSError as e:
+                        warnings.warn(f'Контрольная точка не записана, чтение продолжается без неё: {e}',
+                                      RuntimeWarning)
+                        saving = False
+                    next_checkpoint = lines.offset + self.interval
+        self.checkpoint.remove()
+        self.histograms = histograms
+        self.pivot = pivot_from_cells(cells)
+        return partial
+
+    def get_salary_histograms(self, vacancy_name):
+        """Возвращает распределение зарплат, собранное get_partial_stat"""
+        return self.histograms
+
+    def get_area_year_pivot(self):
+        """Возвращает матрицу город × год, собранную get_partial_stat"""
+        return self.pivot
+
+
+class SharedDataSet(PartialStatDataSet):
+    """Класс для вывода информации о вакансиях из общих колонок, записанных DataSet.share
+
+    Колонки отображаются в память без копирования, поэтому рабочие процессы не читают и не
+    распаковывают данные, а статистика считается группировками numpy по кодам и совпадает с DataSet.
+
+    Attributes:
+        columns (SharedColumns): Колонки вакансий
+        rejects (dict): Количество строк, отклонённых при чтении, по причинам
+    """
+
+    def __init__(self, path, rejects=None):
+        """Инициализирует объект SharedDataSet, подключаясь к колонкам
+
+        Args:
+            path (str): Каталог общих колонок (SharedColumns.path)
+            rejects (dict): Количество строк, отклонённых при чтении, по причинам
+        """
+        self.columns = SharedColumns.attach(path)
+        super().__init__(rejects)
+
+    def get_partial_stat(self, vacancy_name):
+        """Собирает суммы и количества зарплат по годам и городам
+
+        Attributes:
+            vacancy_name (str): Название вакансии, о которой нужно отдельно собрать статистику
+        Returns:
+            tuple: Результат в формате DataSet.get_partial_stat (города в порядке первого появления)
+        """
+        columns = self.columns
+        selected = columns.selected(vacancy_name)
+        start = int(columns.year.min()) if len(columns) else 0
+        year_codes = columns.year - start
+        vacancy_count_stat = np.bincount(year_codes)
+        selected_count_stat = np.bincount(year_codes[selected], minlength=len(vacancy_count_stat))
+        area_count_stat = np.bincount(columns.area_codes, minlength=len(columns.areas))
+        salary_stat = np.zeros(len(vacancy_count_stat), dtype=np.int64)
+        selected_salary_stat = np.zeros(len(vacancy_count_stat), dtype=np.int64)
+        area_salary_stat = np.zeros(len(columns.areas), dtype=np.int64)
+        np.add.at(salary_stat, year_codes, columns.salary)
+        np.add.at(selected_salary_stat, year_codes[selected], columns.salary[selected])
+        np.add.at(area_salary_stat, columns.area_codes, columns.salary)
+
+        present = np.flatnonzero(vacancy_count_stat)
+        salary_stat, vacancy_count_stat = salary_stat[present], vacancy_count_stat[present]
+        selected_salary_stat, selected_count_stat = selected_salary_stat[present], selected_count_stat[present]
+        years = (present + start).tolist()
+        areas = columns.areas.tolist()
+        area_count_stat = dict(zip(areas, area_count_stat.tolist()))
+        return (len(columns),
+                dict(zip(years, salary_stat.tolist())),
+                dict(zip(years, vacancy_count_stat.tolist())),
+                dict(zip(years, selected_salary_stat.tolist())),
+                dict(zip(years, selected_count_stat.tolist())),
+                dict(zip(areas, area_salary_stat.tolist())),
+                area_count_stat,
+                dict(area_count_stat))
+
+    def get_salary_histograms(self, vacancy_name, edges=SALARY_BINS):
+        """Собирает распределение зарплат по интервалам для каждого года (см. DataSet.get_salary_histograms)"""
+        columns = self.columns
+        return salary_histograms(columns.year, columns.salary, columns.selected(vacancy_name), edges)
+
+    def get_area_year_pivot(self):
+        """Собирает матрицу сумм и количеств зарплат город × год (см. DataSet.get_area_year_pivot)"""
+        columns = self.columns
+        return area_year_pivot(columns.year, columns.area_codes, columns.areas.tolist(), columns.salary)
+
+    def close(self):
+        """Отключается от колонок"""
+        self.columns.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
 
 
 class Report:
@@ -172,6 +926,7 @@ class Report:
         ws2 (Worksheet): Объект страницы в Excel файле для статистики по городам
         thin_border (Border): Стиль границы для ячейки в Excel файле
         columns (str[]): Названия колонок для статистики по годам
+        vacancy_name (str): Название выбранной профессии для подписей графиков и отчётов
     """
     wb: Workbook
     ws1: Worksheet
@@ -179,13 +934,15 @@ class Report:
     thin_border: Border
     columns = []
 
-    def __init__(self, columns1):
+    def __init__(self, columns1, vacancy_name):
         """Инициализирует объект Report, подгатавливает Excel файл для записи данных
 
         Arguments:
             columns1 (str[]): Названия колонок для статистики по годам
+            vacancy_name (str): Название выбранной профессии
         """
         self.columns = columns1
+        self.vacancy_name = vacancy_name
 
         self.wb = Workbook()
         self.ws1 = self.wb.active
@@ -220,7 +977,8 @@ class Report:
         cell.font = font
         cell.border = self.thin_border
 
-    def generate_excel(self, data: list[dict], data2: list[dict]):
+    def generate_excel(self, data: list[dict], data2: list[dict], histograms=None, pivot=None, path="report.xlsx",
+                       period_stats=None):
         """Генерация Excel файла
 
         Arguments:
@@ -232,6 +990,13 @@ class Report:
             data2 (list[dict]): лист статистики данных в следующем порядке:
                 1. Уровень зарплат по городам (в порядке убывания, первые 10 значений)
                 2. Доля вакансий по городам (в порядке убывания, первые 10 значений)
+            histograms (SalaryHistograms): Распределение зарплат по годам для листа
+                "Распределение зарплат", лист не добавляется если None
+            pivot (AreaYearPivot): Матрица город × год для листов "Зарплаты по городам и годам"
+                и "Вакансии по городам и годам", листы не добавляются если None
+            path (str or BinaryIO): Путь к файлу или двоичный файловый объект (например, io.BytesIO)
+            period_stats (PeriodStat): Статистика по месяцам или кварталам для листа "Статистика по периодам",
+                лист не добавляется если None
         """
 
         a = data[0]  # for keys
@@ -276,10 +1041,126 @@ class Report:
         self.ws2.column_dimensions[get_column_letter(4)].width = width1_max + 2
         self.ws2.column_dimensions[get_column_letter(5)].width = width2_max + 2
 
-        self.wb.save("report.xlsx")
+        if histograms is not None:
+            self.generate_histogram_sheet(histograms)
+        if pivot is not None:
+            self.generate_pivot_sheet("Зарплаты по городам и годам", pivot.years, pivot.areas, pivot.averages())
+            self.generate_pivot_sheet("Вакансии по городам и годам", pivot.years, pivot.areas, pivot.counts)
+        if period_stats is not None:
+            self.generate_period_sheet(period_stats)
+
+        self.wb.save(path)
+
+    def generate_histogram_sheet(self, histograms):
+        """Добавляет в Excel файл лист с распределением зарплат по годам: всего и для выбранной профессии
+
+        Arguments:
+            histograms (SalaryHistograms): Распределение зарплат по годам
+        """
+        title = "Распределение зарплат"
+        if title in self.wb.sheetnames:
+            del self.wb[title]
+        ws = self.wb.create_sheet(title)
+        font = Font(bold=True)
+        labels = bin_labels(histograms.edges)
+        row = 1
+        for first_column, counts in (("Год", histograms.counts),
+                                     ("Год - " + self.vacancy_name, histograms.selected_counts)):
+            for j, c in enumerate([first_column] + labels, 1):
+                cell = ws.cell(row, j, c)
+                cell.font = font
+                cell.border = self.thin_border
+            for year, year_counts in counts.items():
+                row += 1
+                ws.cell(row, 1, year).border = self.thin_border
+                for j, count in enumerate(year_counts, 2):
+                    ws.cell(row, j, count).border = self.thin_border
+            row += 2
+        ws.column_dimensions[get_column_letter(1)].width = max(len("Год - " + self.vacancy_name) + 2, 6)
+        for j, label in enumerate(labels, 2):
+            ws.column_dimensions[get_column_letter(j)].width = len(label) + 2
+
+    def generate_period_sheet(self, period_stats):
+        """Добавляет в Excel файл лист со статистикой по месяцам или кварталам
+
+        Arguments:
+            period_stats (PeriodStat): Статистика по периодам
+        """
+        title = "Статистика по периодам"
+        if title in self.wb.sheetnames:
+            del self.wb[title]
+        ws = self.wb.create_sheet(title)
+        font = Font(bold=True)
+        columns = ["Месяц" if period_stats.granularity == 'month' else "Квартал", "Средняя зарплата",
+                   "Скользящая средняя", "Количество вакансий", "Средняя зарплата - " + self.vacancy_name,
+                   "Количество вакансий - " + self.vacancy_name]
+        for j, c in enumerate(columns, 1):
+            cell = ws.cell(1, j, c)
+            cell.font = font
+            cell.border = self.thin_border
+            ws.column_dimensions[get_column_letter(j)].width = len(c) + 2
+        for i, key in enumerate(period_stats.salary_stat, 2):
+            row = (key, period_stats.salary_stat[key], period_stats.rolling_salary_stat.get(key),
+                   period_stats.vacancy_count_stat[key], period_stats.selected_salary_stat[key],
+                   period_stats.selected_count_stat[key])
+            for j, value in enumerate(row, 1):
+                ws.cell(i, j, value).border = self.thin_border
+        ws.freeze_panes = "B2"
+
+    def generate_pivot_sheet(self, title, years, areas, values):
+        """Добавляет в Excel файл лист с матрицей город × год
+
+        Arguments:
+            title (str): Название листа
+            years (list[int]): Годы (столбцы)
+            areas (list[str]): Города (строки)
+            values (list[list]): Значения по городам и годам, пустая ячейка для None
+        """
+        if title in self.wb.sheetnames:
+            del self.wb[title]
+        ws = self.wb.create_sheet(title)
+        font = Font(bold=True)
+        for j, c in enumerate(["Город"] + years, 1):
+            cell = ws.cell(1, j, c)
+            cell.font = font
+            cell.border = self.thin_border
+        for i, (area, row) in enumerate(zip(areas, values), 2):
+            ws.cell(i, 1, area).border = self.thin_border
+            for j, value in enumerate(row, 2):
+                ws.cell(i, j, value).border = self.thin_border
+        ws.column_dimensions[get_column_letter(1)].width = max(map(len, areas), default=5) + 2
+        width = max((len(str(value)) for row in values for value in row), default=4) + 2
+        for j in range(2, len(years) + 2):
+            ws.column_dimensions[get_column_letter(j)].width = max(width, 6)
+        ws.freeze_panes = "B2"
+
+    def generate_pivot_image(self, pivot, top=30, path="pivot.png"):
+        """Генерация тепловой карты средних зарплат город × год в файл pivot.png
+
+        Arguments:
+            pivot (AreaYearPivot): Матрица город × год
+            top (int): Количество городов с наибольшим количеством вакансий на карте
+            path (str or BinaryIO): Путь к файлу или двоичный файловый объект (например, io.BytesIO)
+        """
+        pivot = pivot.top(top)
+        averages = np.array([[np.nan if v is None else v for v in row] for row in pivot.averages()],
+                            dtype=np.float64).reshape(len(pivot.areas), len(pivot.years))
+
+        plt.rcParams.update({'font.size': 8})
+        fig = plt.figure(figsize=(6.4, max(2.4, 0.2 * len(pivot.areas) + 1.2)))
+        ax = fig.add_subplot()
+        image = ax.imshow(averages, aspect='auto', cmap='viridis')
+        ax.set_title("Средняя зарплата по городам и годам")
+        ax.set_xticks(np.arange(len(pivot.years)), pivot.years, rotation="vertical")
+        ax.set_yticks(np.arange(len(pivot.areas)), pivot.areas, fontsize=6)
+        fig.colorbar(image, ax=ax)
+
+        fig.tight_layout()
+        fig.savefig(path, format="png")
+        plt.close(fig)
 
     def generate_image(self, salary_stat, vacancy_count_stat, selected_salary_stat,
-                       selected_count_stat, area_salary_stat, doly_stat):
+                       selected_count_stat, area_salary_stat, doly_stat, histograms=None, path="graph.png"):
         """Генерация графика в файл graph.png
 
         Arguments:
@@ -289,17 +1170,21 @@ class Report:
             selected_count_stat (dict): Динамика количества вакансий по годам для выбранной профессии
             area_salary_stat (dict): Уровень зарплат по городам (в порядке убывания)
             doly_stat (dict): Доля вакансий по городам (в порядке убывания)
+            histograms (SalaryHistograms): Распределение зарплат по годам, выводится дополнительным рядом
+                тепловых карт (всего и для выбранной профессии), если не None
+            path (str or BinaryIO): Путь к файлу или двоичный файловый объект (например, io.BytesIO)
         """
 
         plt.rcParams.update({'font.size': 8})
-        fig = plt.figure()
+        rows = 2 if histograms is None else 3
+        fig = plt.figure(figsize=(6.4, 2.4 * rows))
 
         # Graph 1
         x = np.arange(len(salary_stat))
         width = 0.35
-        ax = fig.add_subplot(221)
+        ax = fig.add_subplot(rows, 2, 1)
         ax.bar(x - width / 2, salary_stat.values(), width, label="средняя з/п")
-        ax.bar(x + width / 2, selected_salary_stat.values(), width, label="з/п " + vacancy_name.lower())
+        ax.bar(x + width / 2, selected_salary_stat.values(), width, label="з/п " + self.vacancy_name.lower())
         ax.set_title("Уровень зарплат по годам")
         ax.set_xticks(x, salary_stat.keys(), rotation="vertical")
         ax.legend()
@@ -307,9 +1192,10 @@ class Report:
 
         # Graph 2
         x = np.arange(len(vacancy_count_stat))
-        ax1 = fig.add_subplot(222)
+        ax1 = fig.add_subplot(rows, 2, 2)
         ax1.bar(x - width / 2, vacancy_count_stat.values(), width, label="Количество вакансий")
-        ax1.bar(x + width / 2, selected_count_stat.values(), width, label="Количество вакансий " + vacancy_name.lower())
+        ax1.bar(x + width / 2, selected_count_stat.values(), width,
+                label="Количество вакансий " + self.vacancy_name.lower())
         ax1.set_title("Количество вакансий по годам")
         ax1.set_xticks(x, vacancy_count_stat.keys(), rotation="vertical")
         ax1.legend()
@@ -318,7 +1204,7 @@ class Report:
         # Graph 3
         area_salary_stat = {k: area_salary_stat[k] for i, k in zip(range(10), area_salary_stat)}
         x = np.arange(len(area_salary_stat))
-        ax2 = fig.add_subplot(223)
+        ax2 = fig.add_subplot(rows, 2, 3)
         ax2.barh(x, area_salary_stat.values(), 0.7)
         ax2.set_title("Уровень зарплат по городам")
         ax2.set_yticks(x, [k.replace("-", "-\n") for k in area_salary_stat.keys()])
@@ -329,7 +1215,7 @@ class Report:
 
         # Graph 4
         x = np.arange(len(doly_stat))
-        ax3 = fig.add_subplot(224)
+        ax3 = fig.add_subplot(rows, 2, 4)
         if len(doly_stat) <= 10:
             ax3.pie(doly_stat.values(), labels=doly_stat.keys(), textprops={'fontsize': 6})
         else:
@@ -338,11 +1224,59 @@ class Report:
                     textprops={'fontsize': 6})
         ax3.set_title("Доля зарплат по городам")
 
+        # Graphs 5 and 6
+        if histograms is not None:
+            labels = bin_labels(histograms.edges)
+            for i, (title, counts) in enumerate(((
+                    "Распределение зарплат по годам", histograms.counts), (
+                    "Распределение зарплат - " + self.vacancy_name.lower(), histograms.selected_counts)), 5):
+                ax4 = fig.add_subplot(rows, 2, i)
+                shares = np.array(list(counts.values()), dtype=np.float64).reshape(-1, len(labels))
+                shares /= np.maximum(shares.sum(axis=1, keepdims=True), 1)
+                ax4.imshow(shares, aspect='auto', cmap='Blues', vmin=0)
+                ax4.set_title(title)
+                ax4.set_xticks(np.arange(len(labels)), labels, rotation="vertical", fontsize=5)
+                ax4.set_yticks(np.arange(len(counts)), counts.keys(), fontsize=6)
+
         fig.tight_layout()
-        plt.savefig("graph.png")
+        fig.savefig(path, format="png")
+        plt.close(fig)
+
+    def generate_json(self, salary_stat, vacancy_count_stat, selected_salary_stat,
+                      selected_count_stat, area_salary_stat, doly_stat, path="stats.json", name_estimates=None,
+                      period_stats=None):
+        """Сохранение статистики в файл stats.json
+
+        Arguments:
+            salary_stat (dict): Динамика уровня зарплат по годам
+            selected_salary_stat (dict): Динамика уровня зарплат по годам для выбранной профессии
+            vacancy_count_stat (dict): Динамика количества вакансий по годам
+            selected_count_stat (dict): Динамика количества вакансий по годам для выбранной профессии
+            area_salary_stat (dict): Уровень зарплат по городам (в порядке убывания)
+            doly_stat (dict): Доля вакансий по городам (в порядке убывания)
+            path (str or BinaryIO): Путь к файлу или двоичный файловый объект (например, io.BytesIO)
+            name_estimates (dict): Оценки количества различных названий по годам и самых частых
+                названий (NameSketch.estimates), не сохраняются если None
+            period_stats (PeriodStat): Статистика по месяцам или кварталам, не сохраняется если None
+        """
+        stats = {
+            "vacancy_name": self.vacancy_name,
+            "salary_stat": salary_stat,
+            "vacancy_count_stat": vacancy_count_stat,
+            "selected_salary_stat": selected_salary_stat,
+            "selected_count_stat": selected_count_stat,
+            "area_salary_stat": area_salary_stat,
+            "doly_stat": doly_stat,
+        }
+        if name_estimates is not None:
+            stats.update(name_estimates)
+        if period_stats is not None:
+            stats["period_stat"] = period_stats._asdict()
+        write_output(path, json.dumps(stats, ensure_ascii=False, indent=4).encode('utf-8'))
 
     def generate_pdf(self, salary_stat, vacancy_count_stat, selected_salary_stat,
-                     selected_count_stat, area_salary_stat, doly_stat):
+                     selected_count_stat, area_salary_stat, doly_stat, render_image=True, histograms=None,
+                     path="report.pdf", image="graph.png"):
         """Генерация статистики в файл report.pdf
 
         Arguments:
@@ -352,10 +1286,20 @@ class Report:
             selected_count_stat (dict): Динамика количества вакансий по годам для выбранной профессии
             area_salary_stat (dict): Уровень зарплат по городам (в порядке убывания)
             doly_stat (dict): Доля вакансий по городам (в порядке убывания)
+            render_image (bool): Сгенерировать graph.png заново (False, если он уже актуален)
+            histograms (SalaryHistograms): Распределение зарплат по годам для графика (см. generate_image)
+            path (str or BinaryIO): Путь к файлу или двоичный файловый объект (например, io.BytesIO)
+            image (str or BinaryIO): Путь к графику или файловый объект с методом getvalue (io.BytesIO),
+                из которого график встраивается в PDF
         """
 
-        report.generate_image(salary_stat, vacancy_count_stat, selected_salary_stat,
-                              selected_count_stat, area_salary_stat, doly_stat)
+        if render_image:
+            self.generate_image(salary_stat, vacancy_count_stat, selected_salary_stat,
+                                selected_count_stat, area_salary_stat, doly_stat, histograms, image)
+        if is_path(image):
+            image_src = "file:///" + getpath(image)
+        else:
+            image_src = "data:image/png;base64," + base64.b64encode(image.getvalue()).decode('ascii')
 
         data = [salary_stat, selected_salary_stat, vacancy_count_stat, selected_count_stat]
         data2 = [{k: area_salary_stat[k] for i, k in zip(range(10), area_salary_stat)},
@@ -378,7 +1322,7 @@ class Report:
         Аналитика по зарплатам и городам для профессии {{ vacancy_name }}
             </h1>
 
-        <img src="file:///{{ getpath() }}">
+        <img src="{{ image_src }}">
 
         <h2>Статистика по годам</h2>
         <table border="1" cellpadding="5">
@@ -436,47 +1380,461 @@ class Report:
         </html>
         """)
 
-        pdfkit.from_string(
-            template.render(getpath=getpath, get_percent=get_percent, vacancy_name=vacancy_name, columns=self.columns,
-                            textstart='<center><p style="font-family: Verdana">', textend="</p></center>",
-                            data=data, data2=data2),
-            'report.pdf', configuration=config, options={"enable-local-file-access": ""})
+        write_output(path, pdfkit.from_string(
+            template.render(image_src=image_src, get_percent=get_percent, vacancy_name=self.vacancy_name,
+                            columns=self.columns, textstart='<center><p style="font-family: Verdana">',
+                            textend="</p></center>", data=data, data2=data2),
+            False, configuration=config, options={"enable-local-file-access": ""}))
+
+    def generate_html(self, profiles, path="report.html"):
+        """Генерация статистики в самодостаточный HTML файл с графиками SVG
+
+        В отличие от generate_pdf не нужен wkhtmltopdf: таблицы те же, графики строятся
+        без matplotlib прямо в разметке. Между профессиями можно переключаться на странице.
 
+        Arguments:
+            profiles (dict): Статистика по названию профессии: кортеж из шести словарей
+                в порядке аргументов generate_pdf
+            path (str or BinaryIO): Путь к HTML файлу или двоичный файловый объект (например, io.BytesIO)
+        """
+        sections = []
+        for name, stats in profiles.items():
+            (salary_stat, vacancy_count_stat, selected_salary_stat, selected_count_stat,
+             area_salary_stat, doly_stat) = stats
+            sections.append({
+                'vacancy_name': name,
+                'columns': report_columns(name),
+                'data': [salary_stat, selected_salary_stat, vacancy_count_stat, selected_count_stat],
+                'data2': [{k: area_salary_stat[k] for i, k in zip(range(10), area_salary_stat)},
+                          {k: doly_stat[k] for i, k in zip(range(10), doly_stat)}],
+                'charts': dashboard.stat_charts(name, *stats),
+            })
+        write_output(path, dashboard.render_dashboard(sections, get_percent).encode('utf-8'))
+
+
+VACANCY_FIELDS = ('name', 'salary_from', 'salary_to', 'salary_currency', 'area_name', 'published_at')
+DEDUP_KEY = ('name', 'area_name', 'published_at', 'salary_from', 'salary_to')
+
+
+def read_vacancy_batches(reader, header, rejects, quarantine_writer=None, dedup=None, dedup_memory=None,
+                         batch_size=BATCH_SIZE):
+    """Разбирает строки .csv файла в вакансии пачками
+
+    Строки проверяются по одной, а зарплаты и даты прошедших проверку строк конвертируются пачками
+    по batch_size строк (convert_salaries и convert_months) с тем же результатом, что и в Vacancy.__init__.
+    Пачка отдаётся сразу после чтения её последней строки, поэтому к этому моменту все строки,
+    прочитанные из reader, уже учтены в пачках или в rejects.
 
-def csv_read(filename):
-    """Считывание данных о вакансиях из .csv файла
+    Arguments:
+        reader (Iterator[list[str]]): Строки .csv файла без заголовка
+        header (list[str]): Заголовок .csv файла
+        rejects (dict): Количество отклонённых строк по причинам, пополняется по мере чтения
+        quarantine_writer (csv.writer): Запись отклонённых строк с причиной в последней колонке, не пишутся если None
+        dedup (tuple[str]): Названия полей, по которым вакансии считаются повторами, повторы не ищутся если None
+        dedup_memory (int): Ограничение памяти для поиска повторов в байтах (фильтр Блума вместо множества)
+        batch_size (int): Количество строк в пачке для конвертации зарплат и дат
+    Yields:
+        list[Vacancy]: Вакансии очередной пачки
+    """
+    currency_index = header.index('salary_currency')
+    fields = itemgetter(*[header.index(k) for k in VACANCY_FIELDS])
+    if dedup is not None:
+        dedup_indexes = [header.index(k) for k in dedup]
+        seen = set() if dedup_memory is None else BloomFilter(dedup_memory)
+
+    def reject(line, reason):
+        rejects[reason] = rejects.get(reason, 0) + 1
+        if quarantine_writer is not None:
+            quarantine_writer.writerow(line + [reason])
+
+    def convert(values, lines, keys):
+        columns = [list(map(itemgetter(i), values)) for i in range(len(VACANCY_FIELDS))]
+        salaries, bad_salaries = convert_salaries(*columns[1:4], Vacancy.currency_to_ruble)
+        months, bad_months = convert_months(columns[5])
+        columns = [columns[0], columns[4], months, columns[3], salaries]
+        bad = bad_salaries | bad_months
+        if bad.any():
+            rejects['bad_value'] = rejects.get('bad_value', 0) + int(bad.sum())
+            if quarantine_writer is not None:
+                quarantine_writer.writerows(line + ['bad_value'] for line in compress(lines, bad.tolist()))
+            good = (~bad).tolist()
+            columns = [list(compress(column, good)) for column in columns]
+            lines = list(compress(lines, good))
+            keys = list(compress(keys, good))
+        if dedup is not None:
+            unique = []
+            for i, key in enumerate(keys):
+                if dedup_memory is None:
+                    duplicate = key in seen
+                    seen.add(key)
+                else:
+                    duplicate = seen.add(key)
+                if duplicate:
+                    reject(lines[i] if lines else None, 'duplicate')
+                unique.append(not duplicate)
+            columns = [list(compress(column, unique)) for column in columns]
+        return list(map(Vacancy.from_values, *columns))
+
+    # Строки целиком копятся только для quarantine: списки отслеживаются сборщиком мусора,
+    # и пачка из десятков тысяч списков заметно замедляет чтение
+    values = []
+    lines = []
+    keys = []
+    for line in reader:
+        if len(line) != len(header):
+            reject(line, 'wrong_length')
+        elif not all(row_values := fields(line)):
+            reject(line, 'empty_field')
+        elif line[currency_index] not in Vacancy.currency_to_ruble:
+            reject(line, 'unknown_currency')
+        else:
+            values.append(row_values)
+            if quarantine_writer is not None:
+                lines.append(line)
+            if dedup is not None:
+                keys.append('\x1f'.join([line[i] for i in dedup_indexes]))
+            if len(values) == batch_size:
+                yield convert(values, lines, keys)
+                values = []
+                lines = []
+                keys = []
+    if values:
+        yield convert(values, lines, keys)
+
+
+def csv_read(filename, quarantine=None, dedup=None, dedup_memory=None, batch_size=BATCH_SIZE):
+    """Считывание данных о вакансиях из .csv файла (в том числе сжатого gzip, bzip2, xz или zstd)
+
+    Некорректные строки не прерывают чтение: они пропускаются, подсчитываются по причинам в
+    DataSet.rejects и, если указан quarantine, записываются в отдельный .csv файл с причиной
+    в последней колонке. Повторы вакансий отбрасываются с причиной 'duplicate'.
+    Из строки извлекаются только поля VACANCY_FIELDS (их индексы определяются по заголовку один раз),
+    поэтому пустые значения в остальных колонках широких выгрузок не отбрасывают строку.
+    Зарплаты и даты конвертируются пачками (см. read_vacancy_batches).
 
     Arguments:
         filename (str): Путь к файлу .csv с данными о вакансиях
+        quarantine (str): Путь к .csv файлу для отклонённых строк, не записывается если None
+        dedup (tuple[str]): Названия полей, по которым вакансии считаются повторами
+            (например, DEDUP_KEY), повторы не ищутся если None
+        dedup_memory (int): Ограничение памяти для поиска повторов в байтах. Если указано,
+            вместо точного множества используется фильтр Блума такого размера
+            (редкие уникальные вакансии могут быть ошибочно приняты за повторы)
+        batch_size (int): Количество строк в пачке для конвертации зарплат и дат
     Returns:
         DataSet: Объект DataSet
     """
-    with open(filename, encoding='utf-8-sig') as file:
+    with open_text(filename) as file:
         reader = csv.reader(file)
         header = reader.__next__()
         ds = DataSet(header)
-        ds.vacancies_objects = [Vacancy(
-            **{k: v for k, v in zip(header, line)}) for line in reader if len(line) == len(header) and all(line)]
+        quarantine_file = None
+        quarantine_writer = None
+        if quarantine is not None:
+            quarantine_file = open(quarantine, 'w', encoding='utf-8-sig', newline='', buffering=1 << 20)
+            quarantine_writer = csv.writer(quarantine_file)
+            quarantine_writer.writerow(header + ['reject_reason'])
+        try:
+            for batch in read_vacancy_batches(reader, header, ds.rejects, quarantine_writer, dedup, dedup_memory,
+                                              batch_size):
+                ds.vacancies_objects.extend(batch)
+        finally:
+            if quarantine_file is not None:
+                quarantine_file.close()
     return ds
 
 
+def parquet_read(filename, years=None):
+    """Считывание данных о вакансиях из .parquet файла
+
+    Читаются только нужные Vacancy столбцы, группы строк вне диапазона years пропускаются
+    по статистике файла, а зарплаты и даты конвертируются векторно средствами pyarrow.
+
+    Arguments:
+        filename (str): Путь к файлу .parquet с данными о вакансиях
+        years (tuple[int, int]): Диапазон лет включительно, читаются все годы если None
+    Returns:
+        DataSet: Объект DataSet
+    """
+    ds = DataSet(list(VACANCY_FIELDS))
+    vacancies = ds.vacancies_objects
+    for columns, rejects in read_row_groups(filename, Vacancy.currency_to_ruble, years):
+        add_rejects(ds.rejects, rejects)
+        vacancies.extend(map(Vacancy.from_values, columns['name'].to_pylist(), columns['area_name'].to_pylist(),
+                             columns['month'].to_pylist(), columns['salary_currency'].to_pylist(),
+                             columns['salary'].to_pylist()))
+    return ds
+
+
+def api_read(url, **kwargs):
+    """Загрузка данных о вакансиях из постраничного API (формат hh.ru)
+
+    Страницы загружаются асинхронно с ограничением параллельности и частоты запросов,
+    вакансии без обязательных полей или с неизвестной валютой подсчитываются в DataSet.rejects.
+
+    Arguments:
+        url (str): Адрес списка вакансий, например 'https://api.hh.ru/vacancies'
+        **kwargs: Параметры загрузки fetch_vacancies (params, per_page, concurrency, rate, retries, ...)
+    Returns:
+        DataSet: Объект DataSet
+    """
+    ds = DataSet(list(VACANCY_FIELDS))
+
+    async def consume():
+        async for item in fetch_vacancies(url, **kwargs):
+            fields = item_to_fields(item)
+            if fields is None:
+                reason = 'empty_field'
+            elif fields['salary_currency'] not in Vacancy.currency_to_ruble:
+                reason = 'unknown_currency'
+            else:
+                try:
+                    ds.vacancies_objects.append(Vacancy(**fields))
+                    continue
+                except (TypeError, ValueError, OverflowError):
+                    reason = 'bad_value'
+            ds.rejects[reason] = ds.rejects.get(reason, 0) + 1
+
+    asyncio.run(consume())
+    return ds
+
+
+def preview_stat(filename, vacancy_name, step=0.01, block_size=1 << 20, seed=None):
+    """Приближённая статистика по случайной выборке блоков .csv файла с уточнением
+
+    Блоки читаются в случайном порядке, после каждой доли step прочитанных блоков возвращается
+    оценка статистики с 95% доверительными интервалами. Если читать до конца, последняя оценка
+    совпадает с точной статистикой, а интервалы становятся нулевыми.
+
+    Arguments:
+        filename (str): Путь к несжатому файлу .csv с данными о вакансиях
+        vacancy_name (str): Название вакансии, о которой нужно отдельно собрать статистику
+        step (float): Доля блоков файла между оценками
+        block_size (int): Размер блока в байтах
+        seed (int): Зерно генератора случайного порядка блоков
+    Yields:
+        dict: Оценка статистики PreviewStat.snapshot
+    """
+    sampler = BlockSampler(filename, block_size, seed)
+    header = sampler.header
+    fields = itemgetter(*[header.index(k) for k in VACANCY_FIELDS])
+    stat = PreviewStat(sampler.num_blocks)
+    blocks_per_step = max(1, int(step * sampler.num_blocks))
+    for i, rows in enumerate(sampler.blocks(), 1):
+        vacancies = []
+        for line in rows:
+            values = fields(line) if len(line) == len(header) else None
+            if values is None or not all(values) or values[3] not in Vacancy.currency_to_ruble:
+                continue
+            try:
+                vacancies.append(Vacancy(**dict(zip(VACANCY_FIELDS, values))))
+            except (ValueError, OverflowError):
+                pass
+        stat.add_block(vacancies, vacancy_name)
+        if i % blocks_per_step == 0 or i == sampler.num_blocks:
+            yield stat.snapshot()
+
+
+def print_preview(snapshot):
+    """Выводит оценку статистики с доверительными интервалами
+
+    Arguments:
+        snapshot (dict): Оценка статистики PreviewStat.snapshot
+    """
+    def fmt(stat, percent=False):
+        if percent:
+            return {k: f"{get_percent(v)} ± {get_percent(e)}" for k, (v, e) in stat.items()}
+        return {k: f"{v:.0f} ± {e:.0f}" for k, (v, e) in stat.items()}
+
+    print(f"Прочитано {get_percent(snapshot['fraction'])} файла:")
+    print('Динамика уровня зарплат по годам:', fmt(snapshot['salary_stat']))
+    print('Динамика количества вакансий по годам:', fmt(snapshot['vacancy_count_stat']))
+    print('Динамика уровня зарплат по годам для выбранной профессии:', fmt(snapshot['selected_salary_stat']))
+    print('Динамика количества вакансий по годам для выбранной профессии:', fmt(snapshot['selected_count_stat']))
+    print('Уровень зарплат по городам (в порядке убывания):',
+          {k: v for i, (k, v) in zip(range(10), fmt(snapshot['area_salary_stat']).items())})
+    print('Доля вакансий по городам (в порядке убывания):',
+          {k: v for i, (k, v) in zip(range(10), fmt(snapshot['doly_stat'], percent=True).items())})
+
+
 """
 vacancies_by_year.csv
 Программист
 """
 
-file_name = input('Введите название файла: ')
-vacancy_name = input('Введите название профессии: ')
-printing_type = input('Вакансии или Статистика?: ')
-if printing_type == "Вакансии":
-    printing_type = 0
-else:
-    printing_type = 1
-report = Report([
-    "Год",
-    "Средняя зарплата",
-    "Средняя зарплата - " + vacancy_name,
-    "Количество вакансий",
-    "Количество вакансий - " + vacancy_name])
-data_set = csv_read(file_name)
-data_set.get_stat(vacancy_name, printing_type)
+
+def open_data_set(source, decision, cache_dir=None, quarantine=None, dedup=None, dedup_memory=None):
+    """Открывает входные данные стратегией, выбранной choose_engine
+
+    Кэш колонок и контрольные точки пишутся в каталог кэша, а не рядом с входным файлом.
+    Если кэш колонок не удаётся записать, данные всё равно возвращаются.
+
+    Args:
+        source (str): Путь к файлу или адрес (tcp://, http://, https://)
+        decision (EngineDecision): Выбранная стратегия
+        cache_dir (str): Каталог кэша (см. engine.cache_dir)
+        quarantine (str): Путь к .csv файлу для отклонённых строк (см. csv_read), стратегия должна
+            быть выбрана choose_engine с quarantine=True
+        dedup (tuple[str]): Поля, по которым вакансии считаются повторами (см. csv_read), стратегия должна
+            быть выбрана choose_engine с dedup=True
+        dedup_memory (int): Ограничение памяти для поиска повторов в байтах (см. csv_read)
+    Returns:
+        PartialStatDataSet or DataSet: Объект с методом get_stat и словарём rejects
+    """
+    engine = decision.engine
+    if engine == 'cluster':
+        return ClusterDataSet(source[len('tcp://'):].split(','))
+    if engine == 'api':
+        return api_read(source)
+    if engine == 'parquet':
+        return parquet_read(source)
+    if engine == 'sqlite':
+        return StoredDataSet(source)
+    if engine == 'cube':
+        return CubeDataSet(source)
+    if engine == 'checkpoint':
+        return CheckpointedDataSet(source, default_checkpoint_path(source, cache_dir))
+    if engine == 'columns' and not decision.write_cache:
+        return SharedDataSet(columns_cache_path(source, cache_dir), read_cache_meta(source, cache_dir)['rejects'])
+    data_set = csv_read(source, quarantine=quarantine, dedup=dedup, dedup_memory=dedup_memory)
+    if decision.write_cache:
+        cache_path = columns_cache_path(source, cache_dir)
+        try:
+            shutil.rmtree(cache_path, ignore_errors=True)
+            data_set.share(cache_path).close()
+            write_cache_meta(source, data_set.rejects, cache_dir)
+        except OSError as e:
+            shutil.rmtree(cache_path, ignore_errors=True)
+            warnings.warn(f'Кэш колонок не сохранён: {e}', RuntimeWarning)
+    return data_set
+
+
+def main():
+    """Запускает команды из аргументов командной строки или интерактивный режим с вводом файла и профессии
+
+    Команды:
+        import <файл.csv> <база.db> — загрузить вакансии в базу SQLite
+        cube <файл.csv> <файл.cube> <профессии...> — построить куб сумм и количеств зарплат
+        dashboard <файл.csv или .cube> <файл.html> <профессии...> — HTML отчёт по нескольким профессиям
+        preview <файл.csv> <профессия> [доля] — оценка статистики по случайной выборке блоков
+        worker <порт> <файлы.csv...> — рабочий узел для распределённого подсчёта
+        farm <файл.csv или .cube> <каталог> <профессии...> — Excel, графики и PDF по нескольким профессиям
+            параллельно, каждая профессия в своём подкаталоге
+
+    Флаги интерактивного режима:
+        --engine=<стратегия> — читать входные данные заданной стратегией из ENGINES вместо автоматического выбора
+        --memory-limit=<байт> — доступная память для выбора стратегии вместо определённой автоматически
+        --cache-dir=<каталог> — каталог для кэша колонок и контрольных точек (см. engine.cache_dir)
+
+    Флаги чтения .csv файлов (для команд import, cube, dashboard, farm, worker и интерактивного режима):
+        --quarantine=<файл.csv> — записать отклонённые строки с причиной в отдельный .csv файл
+        --dedup[=<байт>] — отбросить повторы вакансий по полям DEDUP_KEY, а если указан размер,
+            искать их фильтром Блума такого размера вместо точного множества
+    """
+    options = dict(arg[2:].partition('=')[::2] for arg in sys.argv[1:] if arg.startswith('--'))
+    argv = [arg for arg in sys.argv if not arg.startswith('--')]
+    read_options = {'quarantine': options.get('quarantine'),
+                    'dedup': DEDUP_KEY if 'dedup' in options else None,
+                    'dedup_memory': int(options['dedup']) if options.get('dedup') else None}
+    if len(argv) == 4 and argv[1] == 'import':
+        data_set = csv_read(argv[2], **read_options)
+        if data_set.rejects:
+            print('Отклонённые строки:', data_set.rejects)
+        print('Загружено вакансий:', import_vacancies(argv[3], data_set.vacancies_objects, rejects=data_set.rejects))
+        return
+
+    if len(argv) >= 4 and argv[1] == 'cube':
+        data_set = csv_read(argv[2], **read_options)
+        if data_set.rejects:
+            print('Отклонённые строки:', data_set.rejects)
+        data_set.build_cube(argv[4:]).save(argv[3])
+        return
+
+    if len(argv) >= 5 and argv[1] == 'dashboard':
+        if argv[2].endswith('.cube'):
+            cube = SalaryCube.load(argv[2])
+        else:
+            data_set = csv_read(argv[2], **read_options)
+            if data_set.rejects:
+                print('Отклонённые строки:', data_set.rejects)
+            cube = data_set.build_cube(argv[4:])
+        Report(report_columns(argv[4]), argv[4]).generate_html(
+            {name: finalize_stat(*cube.query(name)) for name in argv[4:]}, argv[3])
+        return
+
+    if len(argv) >= 5 and argv[1] == 'farm':
+        outputs = ('excel', 'image', 'pdf')
+        directories = {name: os.path.abspath(os.path.join(argv[3], name.replace(os.sep, '_')))
+                       for name in dict.fromkeys(argv[4:])}
+        start = time.perf_counter()
+        if argv[2].endswith('.cube'):
+            cube = SalaryCube.load(argv[2])
+            results = run_farm({name: (directory, name, finalize_stat(*cube.query(name)), outputs)
+                                for name, directory in directories.items()}, render_report)
+        else:
+            data_set = csv_read(argv[2], **read_options)
+            if data_set.rejects:
+                print('Отклонённые строки:', data_set.rejects)
+            with data_set.share() as columns:
+                del data_set
+                results = run_farm({name: (directory, name, columns.path, outputs)
+                                    for name, directory in directories.items()}, render_shared_report)
+        print(format_summary(results, time.perf_counter() - start))
+        return
+
+    if len(argv) in (4, 5) and argv[1] == 'preview':
+        fraction = float(argv[4]) if len(argv) == 5 else 0.05
+        for snapshot in preview_stat(argv[2], argv[3], step=fraction / 4):
+            print_preview(snapshot)
+            if snapshot['fraction'] >= fraction:
+                break
+        return
+
+    if len(argv) >= 4 and argv[1] == 'worker':
+        if read_options['quarantine'] is not None and len(argv) > 4:
+            raise ValueError("--quarantine для рабочего узла возможен только с одним файлом")
+        data_set = csv_read(argv[3], **read_options)
+        for shard in argv[4:]:
+            shard_set = csv_read(shard, **read_options)
+            data_set.vacancies_objects.extend(shard_set.vacancies_objects)
+            add_rejects(data_set.rejects, shard_set.rejects)
+        if data_set.rejects:
+            print('Отклонённые строки:', data_set.rejects)
+        print('Рабочий узел слушает порт', argv[2], flush=True)
+        serve(int(argv[2]), data_set.get_partial_stat, rejects=data_set.rejects)
+        return
+
+    file_name = input('Введите название файла: ')
+    vacancy_name = input('Введите название профессии: ')
+    printing_type = set()
+    outputs = input('Вакансии, Статистика, График, JSON, HTML или Все (можно несколько через запятую)?: ')
+    for output in outputs.split(','):
+        output = output.strip()
+        if output == "Вакансии":
+            printing_type.add('excel')
+        elif output == "График":
+            printing_type.add('image')
+        elif output == "JSON":
+            printing_type.add('json')
+        elif output == "HTML":
+            printing_type.add('html')
+        elif output == "Все":
+            printing_type.update(OUTPUTS)
+        else:
+            printing_type.add('pdf')
+    build_cache = BuildCache()
+    report = Report(report_columns(vacancy_name), vacancy_name)
+    memory_limit = options.get('memory-limit')
+    cache_dir = options.get('cache-dir')
+    decision = choose_engine(file_name, options.get('engine'), int(memory_limit) if memory_limit else None,
+                             cache_dir, quarantine=read_options['quarantine'] is not None,
+                             dedup=read_options['dedup'] is not None)
+    print(format_decision(decision))
+    data_set = open_data_set(file_name, decision, cache_dir, **read_options)
+    data_set.get_stat(vacancy_name, printing_type, report=report, build_cache=build_cache)
+    if data_set.rejects:
+        print('Отклонённые строки:', data_set.rejects)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,138 @@
+COLUMNS = ('name', 'salary_from', 'salary_to', 'salary_currency', 'area_name', 'published_at')
+NUMBER_PATTERN = r'^-?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?$'
+DATE_PATTERN = r'^\d{4}-(0[1-9]|1[0-2])'
+MAX_INT64 = 2.0 ** 63
+
+
+def _import_pyarrow():
+    """Импортирует pyarrow, который нужен только для чтения .parquet файлов"""
+    try:
+        import pyarrow
+        import pyarrow.compute
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError("Для чтения .parquet файлов нужен пакет pyarrow") from None
+    return pyarrow
+
+
+def _year_of(value):
+    """Возвращает год из значения статистики столбца published_at (строки ISO-8601 или даты)"""
+    if isinstance(value, bytes):
+        value = value.decode('utf-8')
+    if isinstance(value, str):
+        return int(value[:4])
+    return value.year
+
+
+def _row_group_years(metadata, index, column_index):
+    """Возвращает диапазон лет published_at в группе строк по её статистике или None, если статистики нет
+    или её значения не разбираются"""
+    stats = metadata.row_group(index).column(column_index).statistics
+    if stats is None or not stats.has_min_max:
+        return None
+    try:
+        return _year_of(stats.min), _year_of(stats.max)
+    except ValueError:
+        return None
+
+
+def _parse_salary(pa, values):
+    """Переводит столбец оклада в float64, строки, которые не являются числом, становятся null"""
+    pc = pa.compute
+    if pa.types.is_string(values.type) or pa.types.is_large_string(values.type):
+        values = pc.replace_substring_regex(pc.utf8_trim_whitespace(values), r'^\+', '')
+        numeric = pc.fill_null(pc.match_substring_regex(values, NUMBER_PATTERN), False)
+        values = pc.if_else(numeric, values, pa.scalar(None, values.type))
+    return pc.cast(values, pa.float64())
+
+
+def read_row_groups(filename, currency_to_ruble, years=None):
+    """Читает вакансии из .parquet файла по группам строк
+
+    Читаются только столбцы COLUMNS. Если задан years, группы строк, у которых по статистике
+    published_at все годы вне диапазона, не читаются с диска, а оставшиеся строки фильтруются
+    по году. Номер месяца и зарплата в рублях вычисляются векторно, с той же семантикой,
+    что и в Vacancy: int((salary_from + salary_to) // 2 * rate). Строки, в которых оклад не число,
+    зарплата не конечна или не помещается в int64, а дата не разбирается или месяц вне 1..12,
+    не прерывают чтение, а подсчитываются как 'bad_value', как и в csv_read. Год и месяц даты с часовым поясом
+    берутся в этом поясе (как в строке ISO-8601), а не в UTC.
+
+    Args:
+        filename (str): Путь к .parquet файлу
+        currency_to_ruble (dict): Курсы валют к рублю
+        years (tuple[int, int]): Диапазон лет включительно, читаются все годы если None
+    Yields:
+        tuple[dict, dict]: Столбцы группы строк (name, area_name, month, salary_currency, salary) в виде
+            массивов pyarrow и количество отклонённых строк по причинам
+    """
+    pa = _import_pyarrow()
+    pc = pa.compute
+    file = pa.parquet.ParquetFile(filename)
+    published_index = file.schema_arrow.get_field_index('published_at')
+    currencies = pa.array(list(currency_to_ruble), pa.string())
+    rates = pa.array(list(currency_to_ruble.values()), pa.float64())
+
+    for i in range(file.num_row_groups):
+        if years is not None:
+            group_years = _row_group_years(file.metadata, i, published_index)
+            if group_years is not None and (group_years[1] < years[0] or group_years[0] > years[1]):
+                continue
+        table = file.read_row_group(i, columns=list(COLUMNS))
+        rejects = dict()
+
+        valid = None
+        for column in COLUMNS:
+            values = table.column(column)
+            present = pc.is_valid(values)
+            if pa.types.is_string(values.type) or pa.types.is_large_string(values.type):
+                present = pc.and_(present, pc.not_equal(values, ''))
+            valid = present if valid is None else pc.and_kleene(valid, present)
+        valid = pc.fill_null(valid, False)
+        empty = len(table) - pc.sum(valid).as_py() if len(table) else 0
+        if empty:
+            rejects['empty_field'] = empty
+        table = table.filter(valid)
+
+        currency_codes = pc.index_in(table.column('salary_currency'), value_set=currencies)
+        known = pc.is_valid(currency_codes)
+        unknown = len(table) - pc.sum(known).as_py() if len(table) else 0
+        if unknown:
+            rejects['unknown_currency'] = unknown
+        table = table.filter(known)
+        currency_codes = currency_codes.filter(known)
+
+        published = table.column('published_at')
+        salary_sum = pc.add(_parse_salary(pa, table.column('salary_from')),
+                            _parse_salary(pa, table.column('salary_to')))
+        salary = pc.trunc(pc.multiply(pc.floor(pc.divide(salary_sum, 2.0)), pc.take(rates, currency_codes)))
+        good = pc.and_(pc.is_finite(salary), pc.less(pc.abs(salary), MAX_INT64))
+        is_date = pa.types.is_timestamp(published.type) or pa.types.is_date(published.type)
+        if not is_date:
+            good = pc.and_(good, pc.match_substring_regex(published, DATE_PATTERN))
+        good = pc.fill_null(good, False)
+        bad = len(table) - pc.sum(good).as_py() if len(table) else 0
+        if bad:
+            rejects['bad_value'] = bad
+            table, salary = table.filter(good), salary.filter(good)
+            published = table.column('published_at')
+
+        if is_date:
+            if pa.types.is_timestamp(published.type) and published.type.tz is not None:
+                published = pc.local_timestamp(published)
+            year = pc.cast(pc.year(published), pa.int32())
+            month = pc.cast(pc.month(published), pa.int32())
+        else:
+            year = pc.cast(pc.utf8_slice_codeunits(published, 0, 4), pa.int32())
+            month = pc.cast(pc.utf8_slice_codeunits(published, 5, 7), pa.int32())
+        if years is not None:
+            in_range = pc.and_(pc.greater_equal(year, years[0]), pc.less_equal(year, years[1]))
+            table, year, month = table.filter(in_range), year.filter(in_range), month.filter(in_range)
+            salary = salary.filter(in_range)
+
+        yield {
+            'name': table.column('name'),
+            'area_name': table.column('area_name'),
+            'month': pc.subtract(pc.add(pc.multiply(year, 12), month), 1),
+            'salary_currency': table.column('salary_currency'),
+            'salary': pc.cast(salary, pa.int64()),
+        }, rejects
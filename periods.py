@@ -0,0 +1,161 @@
+from functools import lru_cache
+from typing import NamedTuple
+
+import numpy as np
+
+
+class PeriodStat(NamedTuple):
+    """Статистика по месяцам или кварталам
+
+    Attributes:
+        granularity (str): 'month' или 'quarter'
+        salary_stat (dict): Динамика уровня зарплат по периодам
+        rolling_salary_stat (dict): Скользящая средняя зарплата по периодам
+        vacancy_count_stat (dict): Динамика количества вакансий по периодам
+        selected_salary_stat (dict): Динамика уровня зарплат по периодам для выбранной профессии
+        selected_count_stat (dict): Динамика количества вакансий по периодам для выбранной профессии
+    """
+    granularity: str
+    salary_stat: dict
+    rolling_salary_stat: dict
+    vacancy_count_stat: dict
+    selected_salary_stat: dict
+    selected_count_stat: dict
+
+
+@lru_cache(maxsize=4096)
+def _month_index_of_prefix(prefix):
+    """Переводит префикс даты вида 'YYYY-MM' в номер месяца, кэшируя результат
+
+    Raises:
+        ValueError: Если год или месяц не число или месяц вне диапазона 1..12
+    """
+    month = int(prefix[5:7])
+    if not 1 <= month <= 12:
+        raise ValueError(f"Некорректный месяц в дате: {prefix!r}")
+    return int(prefix[:4]) * 12 + month - 1
+
+
+def month_index(published_at):
+    """Возвращает целочисленный номер месяца (год * 12 + месяц - 1) для даты в формате ISO-8601
+
+    Разбирается только префикс 'YYYY-MM', а в пределах одного месяца результат берётся из кэша,
+    поэтому разбор почти не стоит времени даже на миллионах строк.
+
+    Args:
+        published_at (str): Дата в формате ISO-8601, например '2022-07-05T18:19:30+0300'
+    Returns:
+        int: Номер месяца
+    Raises:
+        ValueError: Если дата не разбирается или месяц вне диапазона 1..12
+    """
+    return _month_index_of_prefix(published_at[:7])
+
+
+def parse_month_indexes(values):
+    """Переводит пачку дат в формате ISO-8601 в массив номеров месяцев
+
+    Args:
+        values (Iterable[str]): Даты в формате ISO-8601
+    Returns:
+        np.ndarray: Массив номеров месяцев (int32)
+    """
+    cache = dict()
+    result = []
+    for value in values:
+        prefix = value[:7]
+        index = cache.get(prefix)
+        if index is None:
+            index = cache[prefix] = _month_index_of_prefix(prefix)
+        result.append(index)
+    return np.array(result, dtype=np.int32)
+
+
+def period_label(index, granularity):
+    """Возвращает подпись периода по его номеру
+
+    Args:
+        index (int): Номер месяца или квартала (год * 4 + квартал - 1)
+        granularity (str): 'month' или 'quarter'
+    Returns:
+        str: Подпись периода, например '2022-07' или '2022-Q3'
+    """
+    if granularity == 'month':
+        return f"{index // 12}-{index % 12 + 1:02d}"
+    return f"{index // 4}-Q{index % 4 + 1}"
+
+
+def period_stat(month_indexes, salaries, granularity='month'):
+    """Группирует зарплаты по месяцам или кварталам сверткой массивов
+
+    Суммы считаются точно в int64 (np.add.at), а не в float64, как bincount с весами.
+
+    Arguments:
+        month_indexes (np.ndarray): Номера месяцев вакансий
+        salaries (np.ndarray): Зарплаты вакансий в рублях
+        granularity (str): 'month' или 'quarter'
+    Returns:
+        tuple[dict, dict]: Средняя зарплата и количество вакансий по периодам
+            (только периоды, в которых есть вакансии, в порядке возрастания)
+    """
+    if granularity not in ('month', 'quarter'):
+        raise ValueError("granularity должно быть 'month' или 'quarter'")
+    if len(month_indexes) == 0:
+        return dict(), dict()
+    indexes = np.asarray(month_indexes, dtype=np.int64)
+    if granularity == 'quarter':
+        indexes = indexes // 3
+    start = int(indexes.min())
+    indexes = indexes - start
+    counts = np.bincount(indexes)
+    sums = np.zeros(len(counts), dtype=np.int64)
+    np.add.at(sums, indexes, np.asarray(salaries, dtype=np.int64))
+    present = np.nonzero(counts)[0]
+    salary_stat = {period_label(int(i) + start, granularity): int(sums[i] // counts[i]) for i in present}
+    count_stat = {period_label(int(i) + start, granularity): int(counts[i]) for i in present}
+    return salary_stat, count_stat
+
+
+def period_index(label):
+    """Возвращает номер периода по его подписи (обратно period_label)
+
+    Args:
+        label (str): Подпись периода, например '2022-07' или '2022-Q3'
+    Returns:
+        int: Номер месяца или квартала
+    """
+    year, _, period = label.partition('-')
+    if period.startswith('Q'):
+        return int(year) * 4 + int(period[1:]) - 1
+    return int(year) * 12 + int(period) - 1
+
+
+def rolling_mean(stat, window=3, granularity='month'):
+    """Считает скользящее среднее по упорядоченному словарю статистики
+
+    Окно отсчитывается по календарным периодам, а не по периодам, в которых есть вакансии:
+    значения переносятся на непрерывный диапазон периодов, и окно, в которое попал период
+    без вакансий, не считается полным.
+
+    Arguments:
+        stat (dict): Значения по периодам (подписи period_label) в порядке возрастания
+        window (int): Размер окна в периодах
+        granularity (str): 'month' или 'quarter'
+    Returns:
+        dict: Скользящее среднее для периодов, у которых набралось полное окно
+    """
+    if window < 1 or len(stat) < window:
+        return dict()
+    labels = list(stat)
+    indexes = np.array([period_index(k) for k in labels], dtype=np.int64)
+    start = int(indexes[0])
+    values = np.full(int(indexes[-1]) - start + 1, np.nan)
+    values[indexes - start] = list(stat.values())
+    if len(values) < window:
+        return dict()
+    cumsum = np.concatenate(([0.0], np.cumsum(np.nan_to_num(values))))
+    gaps = np.concatenate(([0], np.cumsum(np.isnan(values))))
+    means = (cumsum[window:] - cumsum[:-window]) / window
+    full = gaps[window:] - gaps[:-window] == 0
+    return {period_label(i + start + window - 1, granularity): round(float(v), 2)
+            for i, v in enumerate(means) if full[i]}
@@ -0,0 +1,111 @@
+from typing import NamedTuple
+
+import numpy as np
+
+
+class AreaYearPivot(NamedTuple):
+    """Матрица сумм и количеств зарплат город × год
+
+    Attributes:
+        years (list[int]): Годы по возрастанию (столбцы матрицы)
+        areas (list[str]): Города в порядке убывания количества вакансий (строки матрицы)
+        sums (list[list[int]]): Суммы зарплат по городам и годам
+        counts (list[list[int]]): Количества вакансий по городам и годам
+    """
+    years: list
+    areas: list
+    sums: list
+    counts: list
+
+    def averages(self):
+        """Возвращает средние зарплаты по городам и годам
+
+        Returns:
+            list[list[int or None]]: Средняя зарплата (целочисленное деление, как в finalize_stat)
+                или None, если в этом городе в этом году вакансий нет
+        """
+        return [[s // c if c else None for s, c in zip(row_sums, row_counts)]
+                for row_sums, row_counts in zip(self.sums, self.counts)]
+
+    def top(self, n):
+        """Возвращает матрицу только для n городов с наибольшим количеством вакансий
+
+        Args:
+            n (int): Количество городов
+        Returns:
+            AreaYearPivot: Первые n строк матрицы
+        """
+        return AreaYearPivot(self.years, self.areas[:n], self.sums[:n], self.counts[:n])
+
+
+def area_year_pivot(years, area_codes, areas, salaries):
+    """Собирает матрицу город × год одной группировкой по целочисленным кодам ячеек
+
+    Код ячейки — номер города * количество лет + номер года, поэтому суммы и количества
+    по всем ячейкам считаются одним np.add.at (точно в int64) и одним bincount, а память
+    пропорциональна количеству ячеек, а не вакансий.
+
+    Args:
+        years (np.ndarray): Годы вакансий
+        area_codes (np.ndarray): Номера городов вакансий (индексы в areas)
+        areas (list[str]): Названия городов по номерам
+        salaries (np.ndarray): Зарплаты вакансий в рублях
+    Returns:
+        AreaYearPivot: Матрица город × год
+    """
+    if len(years) == 0:
+        return AreaYearPivot([], [], [], [])
+    year_values, year_codes = np.unique(np.asarray(years, dtype=np.int64), return_inverse=True)
+    shape = (len(areas), len(year_values))
+    cells = np.asarray(area_codes, dtype=np.int64) * shape[1] + year_codes
+    sums = np.zeros(shape[0] * shape[1], dtype=np.int64)
+    np.add.at(sums, cells, np.asarray(salaries, dtype=np.int64))
+    sums = sums.reshape(shape)
+    counts = np.bincount(cells, minlength=len(sums.flat)).reshape(shape)
+    order = np.argsort(-counts.sum(axis=1), kind='stable')
+    return AreaYearPivot(year_values.tolist(), [areas[i] for i in order],
+                         sums[order].tolist(), counts[order].tolist())
+
+
+def add_pivot_cells(cells, years, area_codes, areas, salaries):
+    """Прибавляет суммы и количества зарплат части данных к накопленным ячейкам город × год
+
+    Позволяет собирать матрицу по частям (например, при потоковом чтении), не храня вакансии.
+
+    Args:
+        cells (dict): Ячейки город -> год -> [сумма, количество], города в порядке первого появления,
+            пополняется
+        years (np.ndarray): Годы вакансий части
+        area_codes (np.ndarray): Номера городов вакансий (индексы в areas, в порядке первого появления)
+        areas (list[str]): Названия городов по номерам
+        salaries (np.ndarray): Зарплаты вакансий в рублях
+    """
+    if len(years) == 0:
+        return
+    year_values, year_codes = np.unique(np.asarray(years, dtype=np.int64), return_inverse=True)
+    flat = np.asarray(area_codes, dtype=np.int64) * len(year_values) + year_codes
+    sums = np.zeros(len(areas) * len(year_values), dtype=np.int64)
+    np.add.at(sums, flat, np.asarray(salaries, dtype=np.int64))
+    counts = np.bincount(flat, minlength=len(sums))
+    year_values = year_values.tolist()
+    for i in np.flatnonzero(counts).tolist():
+        area, year = divmod(i, len(year_values))
+        cell = cells.setdefault(areas[area], dict()).setdefault(year_values[year], [0, 0])
+        cell[0] += int(sums[i])
+        cell[1] += int(counts[i])
+
+
+def pivot_from_cells(cells):
+    """Строит матрицу город × год из ячеек add_pivot_cells
+
+    Args:
+        cells (dict): Ячейки город -> год -> [сумма, количество]
+    Returns:
+        AreaYearPivot: Матрица город × год, как у area_year_pivot по всем данным
+    """
+    years = sorted({year for row in cells.values() for year in row})
+    areas = list(cells)
+    sums = [[row[year][0] if year in row else 0 for year in years] for row in cells.values()]
+    counts = [[row[year][1] if year in row else 0 for year in years] for row in cells.values()]
+    order = sorted(range(len(areas)), key=lambda i: -sum(counts[i]))
+    return AreaYearPivot(years, [areas[i] for i in order], [sums[i] for i in order], [counts[i] for i in order])
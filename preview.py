@@ -0,0 +1,220 @@
+import csv
+import os
+import random
+from math import sqrt
+
+from compression import detect_compression
+
+Z = 1.96
+
+
+class BlockSampler:
+    """Чтение .csv файла блоками фиксированного размера в случайном порядке
+
+    Строка относится к блоку, в котором она начинается, поэтому после чтения всех блоков
+    каждая строка файла прочитана ровно один раз (поля с переводами строк не поддерживаются).
+
+    Attributes:
+        filename (str): Путь к .csv файлу
+        header (list[str]): Заголовок .csv файла
+        block_size (int): Размер блока в байтах
+        num_blocks (int): Количество блоков в файле
+        order (list[int]): Случайный порядок чтения блоков
+    """
+
+    def __init__(self, filename, block_size=1 << 20, seed=None):
+        """Инициализирует объект BlockSampler
+
+        Args:
+            filename (str): Путь к несжатому .csv файлу
+            block_size (int): Размер блока в байтах
+            seed (int): Зерно генератора случайного порядка блоков
+        """
+        if detect_compression(filename) is not None:
+            raise ValueError("Выборка блоками возможна только из несжатого .csv файла")
+        self.filename = filename
+        self.block_size = block_size
+        with open(filename, 'rb') as file:
+            header_line = file.readline()
+            self._data_start = file.tell()
+        self.header = next(csv.reader([header_line.decode('utf-8-sig')]))
+        data_size = os.path.getsize(filename) - self._data_start
+        self.num_blocks = max(1, -(-data_size // block_size))
+        self.order = list(range(self.num_blocks))
+        random.Random(seed).shuffle(self.order)
+
+    def read_block(self, index):
+        """Читает строки, которые начинаются в блоке
+
+        Args:
+            index (int): Номер блока
+        Returns:
+            list[list[str]]: Разобранные строки блока
+        """
+        start = self._data_start + index * self.block_size
+        end = start + self.block_size
+        with open(self.filename, 'rb') as file:
+            if index > 0:
+                file.seek(start - 1)
+                file.readline()
+            else:
+                file.seek(start)
+            lines = []
+            while file.tell() < end:
+                line = file.readline()
+                if not line:
+                    break
+                lines.append(line.decode('utf-8'))
+        return list(csv.reader(lines))
+
+    def blocks(self):
+        """Читает блоки в случайном порядке
+
+        Yields:
+            list[list[str]]: Разобранные строки очередного блока
+        """
+        for index in self.order:
+            yield self.read_block(index)
+
+
+def ratio_estimate(y, x, yy, xy, xx, m, num_blocks):
+    """Оценивает отношение сумм по выборке блоков с доверительным интервалом
+
+    Используется оценка отношения для кластерной выборки с поправкой на конечность совокупности:
+    после чтения всех блоков интервал равен нулю. Оценка считается по накопленным суммам
+    по блокам, а не по самим блокам, поэтому её стоимость не зависит от количества блоков.
+
+    Args:
+        y (int): Сумма числителя Σy по прочитанным блокам
+        x (int): Сумма знаменателя Σx
+        yy (int): Сумма квадратов Σy²
+        xy (int): Сумма произведений Σxy
+        xx (int): Сумма квадратов Σx²
+        m (int): Количество прочитанных блоков
+        num_blocks (int): Общее количество блоков в файле
+    Returns:
+        tuple[float, float]: Оценка отношения и половина ширины 95% доверительного интервала
+    """
+    if x == 0:
+        return 0.0, float('inf')
+    ratio = y / x
+    if m < 2:
+        return ratio, float('inf')
+    # Σ(y - ratio * x)² с точным целочисленным числителем, без потери точности на вычитании
+    residual = (x * x * yy - 2 * x * y * xy + y * y * xx) / (x * x)
+    variance = (1 - m / num_blocks) * residual / (m - 1) / m / (x / m) ** 2
+    return ratio, Z * sqrt(max(variance, 0.0))
+
+
+def total_estimate(y, yy, m, num_blocks):
+    """Оценивает сумму по всему файлу по выборке блоков с доверительным интервалом
+
+    Args:
+        y (int): Сумма Σy по прочитанным блокам
+        yy (int): Сумма квадратов Σy²
+        m (int): Количество прочитанных блоков
+        num_blocks (int): Общее количество блоков в файле
+    Returns:
+        tuple[float, float]: Оценка суммы и половина ширины 95% доверительного интервала
+    """
+    if m < 2:
+        return float(y * num_blocks / max(m, 1)), float('inf')
+    variance = num_blocks ** 2 * (1 - m / num_blocks) * ((m * yy - y * y) / (m * (m - 1))) / m
+    return y / m * num_blocks, Z * sqrt(max(variance, 0.0))
+
+
+class PreviewStat:
+    """Накопитель статистики по прочитанным блокам для оценок с доверительными интервалами
+
+    Для каждого ключа накапливаются суммы по блокам (целые, поэтому точные): Σ зарплат, Σ количеств,
+    их квадратов и произведений, а также Σ произведений количества на размер блока для доли вакансий.
+    Поэтому add_block стоит O(вакансий блока), а snapshot — O(ключей), независимо от количества блоков.
+
+    Attributes:
+        num_blocks (int): Общее количество блоков в файле
+        m (int): Количество прочитанных блоков
+        totals (list[int]): Σ количеств вакансий по блокам и Σ их квадратов
+        moments (dict): Суммы по группам ('year', 'selected', 'area') и ключам:
+            [Σs, Σc, Σs², Σsc, Σc², Σct], где s и c — сумма и количество зарплат ключа в блоке,
+            а t — количество вакансий в блоке
+    """
+
+    def __init__(self, num_blocks):
+        """Инициализирует объект PreviewStat
+
+        Args:
+            num_blocks (int): Общее количество блоков в файле
+        """
+        self.num_blocks = num_blocks
+        self.m = 0
+        self.totals = [0, 0]
+        self.moments = {'year': dict(), 'selected': dict(), 'area': dict()}
+
+    def add_block(self, vacancies, vacancy_name):
+        """Добавляет суммы и количества по вакансиям одного блока
+
+        Args:
+            vacancies (Iterable[Vacancy]): Вакансии блока
+            vacancy_name (str): Название вакансии, о которой нужно отдельно собрать статистику
+        """
+        block = {'year': dict(), 'selected': dict(), 'area': dict()}
+        total = 0
+        for vacancy in vacancies:
+            salary = vacancy.salary
+            total += 1
+            for group, key, condition in (('year', vacancy.year, True),
+                                          ('selected', vacancy.year, vacancy_name in vacancy.name),
+                                          ('area', vacancy.area_name, True)):
+                if condition:
+                    sums = block[group].setdefault(key, [0, 0])
+                    sums[0] += salary
+                    sums[1] += 1
+        self.m += 1
+        self.totals[0] += total
+        self.totals[1] += total * total
+        for group, keys in block.items():
+            moments = self.moments[group]
+            for key, (s, c) in keys.items():
+                entry = moments.get(key)
+                if entry is None:
+                    entry = moments[key] = [0, 0, 0, 0, 0, 0]
+                entry[0] += s
+                entry[1] += c
+                entry[2] += s * s
+                entry[3] += s * c
+                entry[4] += c * c
+                entry[5] += c * total
+
+    def _ratio(self, entry):
+        """Оценка средней зарплаты ключа (Σs / Σc)"""
+        return ratio_estimate(entry[0], entry[1], entry[2], entry[3], entry[4], self.m, self.num_blocks)
+
+    def _total(self, entry):
+        """Оценка количества вакансий ключа во всём файле"""
+        return total_estimate(entry[1], entry[4], self.m, self.num_blocks)
+
+    def snapshot(self):
+        """Оценивает статистику по прочитанным блокам
+
+        Returns:
+            dict: Оценки с половиной ширины 95% доверительного интервала (значение, ±):
+                'salary_stat', 'vacancy_count_stat', 'selected_salary_stat', 'selected_count_stat'
+                по годам, 'area_salary_stat' и 'doly_stat' по городам с долей не меньше 1%,
+                а также 'fraction' — доля прочитанных блоков
+        """
+        years = sorted(self.moments['year'])
+        selected = self.moments['selected']
+        empty = [0, 0, 0, 0, 0, 0]
+        result = {'fraction': self.m / self.num_blocks}
+        result['salary_stat'] = {k: self._ratio(self.moments['year'][k]) for k in years}
+        result['vacancy_count_stat'] = {k: self._total(self.moments['year'][k]) for k in years}
+        result['selected_salary_stat'] = {k: self._ratio(selected.get(k, empty)) for k in years}
+        result['selected_count_stat'] = {k: self._total(selected.get(k, empty)) for k in years}
+        areas = self.moments['area']
+        doly_stat = {k: ratio_estimate(e[1], self.totals[0], e[4], e[5], self.totals[1], self.m, self.num_blocks)
+                     for k, e in areas.items()}
+        doly_stat = {k: v for k, v in doly_stat.items() if v[0] >= 0.01}
+        result['doly_stat'] = dict(sorted(doly_stat.items(), key=lambda kv: -kv[1][0]))
+        area_salary_stat = {k: self._ratio(areas[k]) for k in doly_stat}
+        result['area_salary_stat'] = dict(sorted(area_salary_stat.items(), key=lambda kv: -kv[1][0]))
+        return result
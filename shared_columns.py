@@ -0,0 +1,191 @@
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+COLUMNS = ('year', 'month', 'salary', 'area_codes', 'name_codes')
+STRING_COLUMNS = ('areas', 'names')
+SHM_DIRECTORY = '/dev/shm'
+FORMAT_VERSION = 2
+
+
+class StringColumn:
+    """Строки в виде смещений и общего буфера байтов UTF-8
+
+    В отличие от массива numpy dtype=str (UCS-4 фиксированной ширины по самой длинной строке)
+    занимает столько байт, сколько строки в UTF-8, плюс 8 байт на строку.
+
+    Attributes:
+        offsets (np.ndarray): Смещения строк в data (int64), на одно больше, чем строк
+        data (np.ndarray): Байты UTF-8 всех строк подряд (uint8)
+    """
+
+    def __init__(self, offsets, data):
+        """Инициализирует объект StringColumn
+
+        Args:
+            offsets (np.ndarray): Смещения строк в data, на одно больше, чем строк
+            data (np.ndarray): Байты UTF-8 всех строк подряд
+        """
+        self.offsets = offsets
+        self.data = data
+
+    @staticmethod
+    def encode(strings):
+        """Кодирует строки в смещения и байты UTF-8
+
+        Args:
+            strings (Sequence[str]): Строки
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Смещения (int64) и байты (uint8)
+        """
+        encoded = [s.encode('utf-8') for s in strings]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum(np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded)), out=offsets[1:])
+        return offsets, np.frombuffer(b''.join(encoded), dtype=np.uint8)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index):
+        return self.data[self.offsets[index]:self.offsets[index + 1]].tobytes().decode('utf-8')
+
+    def tolist(self):
+        """Декодирует все строки
+
+        Returns:
+            list[str]: Строки
+        """
+        data = self.data.tobytes()
+        offsets = self.offsets.tolist()
+        return [data[a:b].decode('utf-8') for a, b in zip(offsets, offsets[1:])]
+
+
+class SharedColumns:
+    """Колонки вакансий в отображаемых в память файлах .npy для общего доступа из нескольких процессов
+
+    Города и названия вакансий хранятся словарями (в порядке первого появления, см. StringColumn)
+    и целочисленными кодами. Процессы открывают колонки по пути каталога через np.load(mmap_mode='r'):
+    данные не копируются и не разбираются, а страницы файлов в кэше ОС общие для всех процессов,
+    поэтому каждый дополнительный процесс почти не добавляет памяти.
+
+    Attributes:
+        path (str): Каталог с колонками, по нему другие процессы подключаются к данным (attach)
+        year (np.ndarray): Годы вакансий
+        month (np.ndarray): Номера месяцев вакансий (год * 12 + месяц - 1)
+        salary (np.ndarray): Зарплаты вакансий в рублях
+        area_codes (np.ndarray): Коды городов вакансий (индексы в areas)
+        name_codes (np.ndarray): Коды названий вакансий (индексы в names)
+        areas (StringColumn): Названия городов
+        names (StringColumn): Названия вакансий
+    """
+
+    def __init__(self, path, owner=False):
+        """Инициализирует объект SharedColumns, отображая колонки из каталога в память
+
+        Args:
+            path (str): Каталог с колонками
+            owner (bool): Каталог создан этим объектом и удаляется при close
+        """
+        self.path = path
+        self.owner = owner
+        for column in COLUMNS:
+            setattr(self, column, np.load(os.path.join(path, column + '.npy'), mmap_mode='r'))
+        for column in STRING_COLUMNS:
+            setattr(self, column, StringColumn(np.load(os.path.join(path, column + '.offsets.npy'), mmap_mode='r'),
+                                               np.load(os.path.join(path, column + '.bytes.npy'), mmap_mode='r')))
+
+    @classmethod
+    def create(cls, vacancies, path=None):
+        """Записывает колонки вакансий в каталог и отображает их в память
+
+        Временный каталог создаётся в SHM_DIRECTORY (память), а если его нет или там не хватает
+        места (например, 64 МБ /dev/shm в Docker по умолчанию), то во временном каталоге на диске.
+
+        Args:
+            vacancies (Sequence[Vacancy]): Вакансии
+            path (str): Каталог для колонок, который остаётся после close (например, кэш),
+                временный каталог если None
+        Returns:
+            SharedColumns: Объект SharedColumns, удаляющий временный каталог при close
+        """
+        areas = dict()
+        names = dict()
+        count = len(vacancies)
+        columns = {
+            'year': np.fromiter((v.year for v in vacancies), dtype=np.int32, count=count),
+            'month': np.fromiter((v.month for v in vacancies), dtype=np.int32, count=count),
+            'salary': np.fromiter((v.salary for v in vacancies), dtype=np.int64, count=count),
+            'area_codes': np.fromiter((areas.setdefault(v.area_name, len(areas)) for v in vacancies),
+                                      dtype=np.int32, count=count),
+            'name_codes': np.fromiter((names.setdefault(v.name, len(names)) for v in vacancies),
+                                      dtype=np.int32, count=count),
+        }
+        for column, strings in (('areas', areas), ('names', names)):
+            columns[column + '.offsets'], columns[column + '.bytes'] = StringColumn.encode(list(strings))
+
+        if path is not None:
+            os.makedirs(path, exist_ok=True)
+            _save_columns(path, columns)
+            return cls(path)
+        if os.path.isdir(SHM_DIRECTORY):
+            path = tempfile.mkdtemp(prefix='vacancies-', dir=SHM_DIRECTORY)
+            try:
+                _save_columns(path, columns)
+                return cls(path, owner=True)
+            except OSError:
+                shutil.rmtree(path, ignore_errors=True)
+        path = tempfile.mkdtemp(prefix='vacancies-')
+        try:
+            _save_columns(path, columns)
+        except BaseException:
+            shutil.rmtree(path, ignore_errors=True)
+            raise
+        return cls(path, owner=True)
+
+    @classmethod
+    def attach(cls, path):
+        """Подключается к колонкам, созданным другим процессом
+
+        Args:
+            path (str): Каталог с колонками (SharedColumns.path)
+        Returns:
+            SharedColumns: Объект SharedColumns только для чтения
+        """
+        return cls(path)
+
+    def __len__(self):
+        return len(self.salary)
+
+    def selected(self, vacancy_name):
+        """Возвращает маску вакансий, в названии которых есть vacancy_name
+
+        Проверяется только словарь названий, а не каждая вакансия.
+
+        Args:
+            vacancy_name (str): Название выбранной профессии
+        Returns:
+            np.ndarray: Маска вакансий выбранной профессии
+        """
+        names = self.names.tolist()
+        return np.fromiter((vacancy_name in name for name in names), dtype=bool, count=len(names))[self.name_codes]
+
+    def close(self):
+        """Закрывает отображения, а создатель колонок ещё и удаляет каталог"""
+        for column in COLUMNS + STRING_COLUMNS:
+            setattr(self, column, None)
+        if self.owner:
+            shutil.rmtree(self.path, ignore_errors=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _save_columns(path, columns):
+    """Записывает массивы колонок в каталог файлами .npy"""
+    for column, values in columns.items():
+        np.save(os.path.join(path, column + '.npy'), values)
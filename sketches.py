@@ -0,0 +1,258 @@
+from hashlib import blake2b
+from math import log
+
+
+def hash64(value):
+    """Возвращает стабильный 64-битный хэш строки
+
+    В отличие от встроенного hash() не зависит от PYTHONHASHSEED, поэтому скетчи из разных
+    процессов можно объединять.
+
+    Args:
+        value (str): Строка для хэширования
+    Returns:
+        int: 64-битный хэш
+    """
+    return int.from_bytes(blake2b(value.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+class HyperLogLog:
+    """Приближённый подсчёт количества различных значений в фиксированной памяти
+
+    Attributes:
+        p (int): Точность, количество бит хэша для выбора регистра
+        m (int): Количество регистров (2 ** p)
+        registers (bytearray): Регистры с максимальным рангом для каждого бакета
+    """
+
+    def __init__(self, p=12):
+        """Инициализирует объект HyperLogLog
+
+        Args:
+            p (int): Точность от 4 до 16, стандартная ошибка примерно 1.04 / sqrt(2 ** p)
+        """
+        if not 4 <= p <= 16:
+            raise ValueError("p должно быть от 4 до 16")
+        self.p = p
+        self.m = 1 << p
+        self.registers = bytearray(self.m)
+
+    def add(self, value):
+        """Добавляет значение в скетч
+
+        Args:
+            value (str): Добавляемое значение
+        """
+        h = hash64(value)
+        idx = h >> (64 - self.p)
+        w = h & ((1 << (64 - self.p)) - 1)
+        rank = (64 - self.p) - w.bit_length() + 1
+        if rank > self.registers[idx]:
+            self.registers[idx] = rank
+
+    def merge(self, other):
+        """Объединяет скетч с другим скетчем той же точности
+
+        Args:
+            other (HyperLogLog): Объединяемый скетч
+        """
+        if other.p != self.p:
+            raise ValueError("Нельзя объединить HyperLogLog разной точности")
+        self.registers = bytearray(max(a, b) for a, b in zip(self.registers, other.registers))
+
+    def count(self):
+        """Оценивает количество различных добавленных значений
+
+        Returns:
+            int: Оценка количества различных значений
+        """
+        m = self.m
+        if m >= 128:
+            alpha = 0.7213 / (1 + 1.079 / m)
+        else:
+            alpha = {16: 0.673, 32: 0.697, 64: 0.709}[m]
+        estimate = alpha * m * m / sum(2.0 ** -r for r in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * log(m / zeros)
+        return int(round(estimate))
+
+
+class SpaceSaving:
+    """Поиск самых частых значений (heavy hitters) в фиксированной памяти алгоритмом Space-Saving
+
+    Хранит не более capacity счётчиков. Любое значение с частотой больше n / capacity гарантированно
+    присутствует среди счётчиков. Для каждого значения дополнительно накапливается сумма
+    (например, зарплат) по строкам, увиденным с момента начала его отслеживания.
+
+    Attributes:
+        capacity (int): Максимальное количество счётчиков
+        n (int): Общее количество добавленных значений
+        counts (dict): Оценка частоты значения (с ошибкой не больше errors[key])
+        errors (dict): Максимальная переоценка частоты значения
+        observed (dict): Точное количество строк с момента начала отслеживания значения
+        sums (dict): Сумма весов по строкам с момента начала отслеживания значения
+    """
+
+    def __init__(self, capacity=1000):
+        """Инициализирует объект SpaceSaving
+
+        Args:
+            capacity (int): Максимальное количество счётчиков
+        """
+        if capacity < 1:
+            raise ValueError("capacity должно быть положительным")
+        self.capacity = capacity
+        self.n = 0
+        self.counts = dict()
+        self.errors = dict()
+        self.observed = dict()
+        self.sums = dict()
+        self._buckets = dict()
+        self._min_count = 0
+
+    def _move(self, key, count, new_count):
+        """Переносит значение из корзины count в корзину new_count, поддерживая минимальную частоту"""
+        bucket = self._buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[count]
+            if count == self._min_count:
+                self._min_count = new_count
+        self._buckets.setdefault(new_count, dict())[key] = None
+        self.counts[key] = new_count
+
+    def add(self, key, weight=0):
+        """Добавляет значение в скетч
+
+        Args:
+            key (str): Добавляемое значение
+            weight (int or float): Вес строки, накапливаемый в sums
+        """
+        self.n += 1
+        counts = self.counts
+        if key in counts:
+            count = counts[key]
+            self._move(key, count, count + 1)
+            self.observed[key] += 1
+            self.sums[key] += weight
+            return
+        if len(counts) < self.capacity:
+            counts[key] = 1
+            self.errors[key] = 0
+            self._buckets.setdefault(1, dict())[key] = None
+            self._min_count = 1
+        else:
+            count = self._min_count
+            victim = next(iter(self._buckets[count]))
+            del self._buckets[count][victim]
+            del counts[victim], self.errors[victim], self.observed[victim], self.sums[victim]
+            self._buckets[count][key] = None
+            self._move(key, count, count + 1)
+            self.errors[key] = count
+        self.observed[key] = 1
+        self.sums[key] = weight
+
+    def top(self, k=None):
+        """Возвращает самые частые значения
+
+        Args:
+            k (int): Количество значений, все счётчики если None
+        Returns:
+            list[tuple]: Пары (значение, оценка частоты) в порядке убывания частоты
+        """
+        items = sorted(self.counts.items(), key=lambda kv: -kv[1])
+        return items if k is None else items[:k]
+
+
+class NameSketch:
+    """Приближённая статистика названий вакансий в фиксированной памяти
+
+    Количество различных названий по годам оценивается HyperLogLog, самые частые названия — Space-Saving.
+
+    Attributes:
+        names (SpaceSaving): Счётчики самых частых названий
+        names_by_year (dict): HyperLogLog различных названий по годам
+    """
+
+    def __init__(self, capacity=1000):
+        """Инициализирует объект NameSketch
+
+        Args:
+            capacity (int): Количество счётчиков Space-Saving
+        """
+        self.names = SpaceSaving(capacity)
+        self.names_by_year = dict()
+
+    def add(self, year, name):
+        """Добавляет название вакансии
+
+        Args:
+            year (int): Год вакансии
+            name (str): Название вакансии
+        """
+        self.names.add(name)
+        if year not in self.names_by_year:
+            self.names_by_year[year] = HyperLogLog()
+        self.names_by_year[year].add(name)
+
+    def estimates(self, k=10):
+        """Возвращает оценки
+
+        Args:
+            k (int): Количество самых частых названий
+        Returns:
+            dict: Количество различных названий по годам ('distinct_names_by_year')
+                и k самых частых названий с оценкой частоты ('top_names')
+        """
+        return {
+            'distinct_names_by_year': {year: self.names_by_year[year].count() for year in sorted(self.names_by_year)},
+            'top_names': dict(self.names.top(k)),
+        }
+
+
+class BloomFilter:
+    """Вероятностное множество в фиксированной памяти для поиска повторов
+
+    Ложноотрицательных ответов не бывает, вероятность ложноположительного ответа примерно
+    (1 - e ** (-hashes * n / bits)) ** hashes после добавления n значений.
+
+    Attributes:
+        bits (int): Количество бит в фильтре
+        hashes (int): Количество хэш-функций
+        array (bytearray): Битовый массив фильтра
+    """
+
+    def __init__(self, size_bytes, hashes=7):
+        """Инициализирует объект BloomFilter
+
+        Args:
+            size_bytes (int): Размер битового массива в байтах
+            hashes (int): Количество хэш-функций
+        """
+        if size_bytes < 1 or hashes < 1:
+            raise ValueError("size_bytes и hashes должны быть положительными")
+        self.bits = size_bytes * 8
+        self.hashes = hashes
+        self.array = bytearray(size_bytes)
+
+    def add(self, value):
+        """Добавляет значение в фильтр
+
+        Args:
+            value (str): Добавляемое значение
+        Returns:
+            bool: True, если значение (вероятно) уже было добавлено раньше
+        """
+        digest = blake2b(value.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        array = self.array
+        present = True
+        for i in range(self.hashes):
+            bit = (h1 + i * h2) % self.bits
+            byte, mask = bit >> 3, 1 << (bit & 7)
+            if not array[byte] & mask:
+                present = False
+                array[byte] |= mask
+        return present
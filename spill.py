@@ -0,0 +1,133 @@
+import heapq
+import os
+import pickle
+import shutil
+import tempfile
+
+KEY_BYTES = 300
+CHUNK_SIZE = 10000
+MERGE_FAN_IN = 64
+
+
+def _read_run(path):
+    """Читает отсортированный файл частичных сумм по частям"""
+    with open(path, 'rb') as file:
+        while True:
+            try:
+                chunk = pickle.load(file)
+            except EOFError:
+                return
+            yield from chunk
+
+
+def _combine(items):
+    """Складывает частичные суммы одинаковых ключей в отсортированном потоке"""
+    current = None
+    for key, salary, count, first in items:
+        if current is not None and current[0] == key:
+            current[1] += salary
+            current[2] += count
+            current[3] = min(current[3], first)
+        else:
+            if current is not None:
+                yield tuple(current)
+            current = [key, salary, count, first]
+    if current is not None:
+        yield tuple(current)
+
+
+def _write_run(path, items):
+    """Записывает отсортированные частичные суммы в файл частями по CHUNK_SIZE"""
+    with open(path, 'wb') as file:
+        chunk = []
+        for item in items:
+            chunk.append(item)
+            if len(chunk) == CHUNK_SIZE:
+                pickle.dump(chunk, file, pickle.HIGHEST_PROTOCOL)
+                chunk = []
+        if chunk:
+            pickle.dump(chunk, file, pickle.HIGHEST_PROTOCOL)
+
+
+class SpillingAccumulator:
+    """Накопитель сумм и количеств зарплат по ключу с ограничением памяти
+
+    Когда количество ключей в памяти превышает бюджет, частичные суммы сортируются по ключу
+    и сбрасываются в файл на локальном диске, а в конце все файлы сливаются за один проход.
+    Если файлов становится MERGE_FAN_IN, они заранее сливаются в один, чтобы не держать открытыми
+    слишком много файлов. Для каждого ключа хранится также порядковый номер первого появления,
+    чтобы итоговый порядок ключей совпадал с порядком при накоплении в обычном словаре.
+
+    Attributes:
+        max_keys (int): Максимальное количество ключей в памяти
+        n (int): Количество добавленных значений
+        sums (dict): Частичные суммы в памяти: ключ -> [сумма, количество, номер первого появления]
+        runs (list[str]): Пути к сброшенным на диск файлам
+    """
+
+    def __init__(self, memory_budget, directory=None):
+        """Инициализирует объект SpillingAccumulator
+
+        Args:
+            memory_budget (int): Бюджет памяти под ключи в байтах (примерно KEY_BYTES байт на ключ)
+            directory (str): Каталог для временных файлов, системный по умолчанию
+        """
+        self.max_keys = max(1, memory_budget // KEY_BYTES)
+        self.n = 0
+        self.sums = dict()
+        self.runs = []
+        self._runs_written = 0
+        self._directory = directory
+        self._tmp = None
+
+    def add(self, key, salary):
+        """Добавляет зарплату по ключу
+
+        Args:
+            key (str): Ключ, например название города
+            salary (int): Зарплата
+        """
+        entry = self.sums.get(key)
+        if entry is None:
+            if len(self.sums) >= self.max_keys:
+                self.spill()
+            self.sums[key] = [salary, 1, self.n]
+        else:
+            entry[0] += salary
+            entry[1] += 1
+        self.n += 1
+
+    def spill(self):
+        """Сбрасывает частичные суммы из памяти в отсортированный файл на диске"""
+        if not self.sums:
+            return
+        if self._tmp is None:
+            self._tmp = tempfile.mkdtemp(prefix='spill-', dir=self._directory)
+        self._runs_written += 1
+        path = os.path.join(self._tmp, f'run-{self._runs_written}.pickle')
+        _write_run(path, sorted((k, *v) for k, v in self.sums.items()))
+        self.runs.append(path)
+        self.sums = dict()
+        if len(self.runs) >= MERGE_FAN_IN:
+            self._runs_written += 1
+            path = os.path.join(self._tmp, f'run-{self._runs_written}.pickle')
+            _write_run(path, _combine(heapq.merge(*map(_read_run, self.runs))))
+            for run in self.runs:
+                os.remove(run)
+            self.runs = [path]
+
+    def items(self):
+        """Сливает частичные суммы из памяти и с диска
+
+        Returns:
+            Iterator[tuple]: (ключ, сумма, количество, номер первого появления) в порядке возрастания ключа
+        """
+        memory = sorted((k, *v) for k, v in self.sums.items())
+        return _combine(heapq.merge(memory, *map(_read_run, self.runs)))
+
+    def close(self):
+        """Удаляет временные файлы"""
+        if self._tmp is not None:
+            shutil.rmtree(self._tmp, ignore_errors=True)
+            self._tmp = None
+        self.runs = []
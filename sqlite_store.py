@@ -0,0 +1,124 @@
+import sqlite3
+from itertools import islice
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS vacancies (
+    name TEXT NOT NULL,
+    area_name TEXT NOT NULL,
+    year INTEGER NOT NULL,
+    month INTEGER NOT NULL,
+    salary_currency TEXT NOT NULL,
+    salary INTEGER NOT NULL
+)
+"""
+
+REJECTS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS rejects (
+    reason TEXT PRIMARY KEY,
+    count INTEGER NOT NULL
+)
+"""
+
+INDEXES = (
+    "CREATE INDEX IF NOT EXISTS vacancies_year ON vacancies (year, salary)",
+    "CREATE INDEX IF NOT EXISTS vacancies_area ON vacancies (area_name, salary)",
+)
+
+
+def import_vacancies(db_path, vacancies, batch_size=50000, rejects=None):
+    """Загружает вакансии в базу SQLite, заменяя её прежнее содержимое
+
+    Вставка идёт пачками через executemany в одной транзакции, индексы строятся после загрузки.
+
+    Args:
+        db_path (str): Путь к файлу базы данных
+        vacancies (Iterable[Vacancy]): Вакансии
+        batch_size (int): Количество строк в одной пачке executemany
+        rejects (dict): Количество строк, отклонённых при чтении, по причинам (см. query_rejects)
+    Returns:
+        int: Количество загруженных вакансий
+    """
+    rows = ((v.name, v.area_name, v.year, v.month, v.salary_currency, v.salary) for v in vacancies)
+    connection = sqlite3.connect(db_path)
+    try:
+        connection.execute("PRAGMA synchronous = OFF")
+        count = 0
+        with connection:
+            connection.execute("DROP TABLE IF EXISTS vacancies")
+            connection.execute("DROP TABLE IF EXISTS rejects")
+            connection.execute(SCHEMA)
+            connection.execute(REJECTS_SCHEMA)
+            connection.executemany("INSERT INTO rejects VALUES (?, ?)", (rejects or dict()).items())
+            while batch := list(islice(rows, batch_size)):
+                connection.executemany("INSERT INTO vacancies VALUES (?, ?, ?, ?, ?, ?)", batch)
+                count += len(batch)
+            for index in INDEXES:
+                connection.execute(index)
+        connection.execute("ANALYZE")
+        connection.commit()
+    finally:
+        connection.close()
+    return count
+
+
+def query_stat(db_path, vacancy_name):
+    """Собирает суммы и количества для статистики запросами GROUP BY к базе SQLite
+
+    База открывается только для чтения, поэтому её могут одновременно использовать несколько процессов.
+    Выбранная профессия ищется как подстрока с учётом регистра, как и в DataSet.get_stat.
+    Города возвращаются в порядке первого появления (по rowid), как в словарях DataSet.get_partial_stat,
+    чтобы города с равными значениями сортировались в finalize_stat так же.
+
+    Args:
+        db_path (str): Путь к файлу базы данных
+        vacancy_name (str): Название вакансии, о которой нужно отдельно собрать статистику
+    Returns:
+        tuple: Общее количество вакансий, суммы и количества зарплат по годам, то же для выбранной
+            профессии, суммы и количества зарплат по городам и количество вакансий по городам
+            (в порядке аргументов finalize_stat)
+    """
+    connection = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        salary_stat = dict()
+        vacancy_count_stat = dict()
+        selected_salary_stat = dict()
+        selected_count_stat = dict()
+        for year, salary, count in connection.execute(
+                "SELECT year, SUM(salary), COUNT(*) FROM vacancies GROUP BY year"):
+            salary_stat[year] = salary
+            vacancy_count_stat[year] = count
+            selected_salary_stat[year] = 0
+            selected_count_stat[year] = 0
+        for year, salary, count in connection.execute(
+                "SELECT year, SUM(salary), COUNT(*) FROM vacancies WHERE instr(name, ?) > 0 GROUP BY year",
+                (vacancy_name,)):
+            selected_salary_stat[year] = salary
+            selected_count_stat[year] = count
+
+        area_salary_stat = dict()
+        area_count_stat = dict()
+        for area_name, salary, count in connection.execute(
+                "SELECT area_name, SUM(salary), COUNT(*) FROM vacancies GROUP BY area_name ORDER BY MIN(rowid)"):
+            area_salary_stat[area_name] = salary
+            area_count_stat[area_name] = count
+    finally:
+        connection.close()
+    return (sum(vacancy_count_stat.values()), salary_stat, vacancy_count_stat, selected_salary_stat,
+            selected_count_stat, area_salary_stat, area_count_stat, dict(area_count_stat))
+
+
+def query_rejects(db_path):
+    """Возвращает количество строк, отклонённых при загрузке базы, по причинам
+
+    Args:
+        db_path (str): Путь к файлу базы данных
+    Returns:
+        dict: Количество отклонённых строк по причинам (пусто для баз без таблицы rejects)
+    """
+    connection = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        return dict(connection.execute("SELECT reason, count FROM rejects ORDER BY rowid"))
+    except sqlite3.OperationalError:
+        return dict()
+    finally:
+        connection.close()
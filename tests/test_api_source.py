@@ -0,0 +1,77 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+import main
+
+aiohttp = pytest.importorskip('aiohttp')
+
+
+def item(name, salary_from, salary_to='100000', currency='RUR'):
+    return {'name': name, 'salary': {'from': salary_from, 'to': salary_to, 'currency': currency},
+            'area': {'name': 'Москва'}, 'published_at': '2022-07-05T18:19:30+0300'}
+
+
+PAGES = [
+    [item('Программист', '50000'), item('Аналитик', '60000')],
+    [item('Программист Python', '70000'), item('Менеджер', '80000', currency='XXX')],
+    [item('Тестировщик', 'inf')],
+]
+
+
+@pytest.fixture
+def server():
+    requests = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+            page = int(parse_qs(url.query)['page'][0])
+            requests.append((url.path, page, time.monotonic()))
+            if url.path == '/broken':
+                self.send_response(503)
+                self.end_headers()
+                return
+            if page == 1 and sum(1 for r in requests if r[1] == 1) == 1:
+                self.send_response(429)
+                self.send_header('Retry-After', '1')
+                self.end_headers()
+                return
+            body = json.dumps({'items': PAGES[page], 'pages': len(PAGES), 'page': page}).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f'http://127.0.0.1:{httpd.server_address[1]}', requests
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_api_read_paginates_and_honours_retry_after(server):
+    url, requests = server
+    data_set = main.api_read(url + '/vacancies', per_page=2, rate=None, backoff=0.01)
+
+    assert sorted(v.name for v in data_set.vacancies_objects) == ['Аналитик', 'Программист', 'Программист Python']
+    assert data_set.rejects == {'unknown_currency': 1, 'bad_value': 1}
+    assert sorted(page for _, page, _ in requests) == [0, 1, 1, 2]
+    first, retry = [t for _, page, t in requests if page == 1]
+    assert retry - first >= 1
+
+
+def test_api_read_raises_after_retries_are_exhausted(server):
+    url, requests = server
+    with pytest.raises(aiohttp.ClientResponseError) as error:
+        main.api_read(url + '/broken', retries=2, rate=None, backoff=0.01)
+    assert error.value.status == 503
+    assert len(requests) == 3
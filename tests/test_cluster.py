@@ -0,0 +1,65 @@
+import json
+import socket
+import threading
+import time
+
+import main
+from cluster import serve
+
+HEADER = ['name', 'salary_from', 'salary_to', 'salary_currency', 'area_name', 'published_at']
+SHARDS = [
+    [['Программист Python', '100000', '150000', 'RUR', 'Москва', '2021-03-01T10:00:00+0300'],
+     ['Аналитик', '60000', '80000', 'RUR', 'Пермь', '2021-05-01T10:00:00+0300'],
+     ['Программист', '2000', '3000', 'USD', 'Москва', '2022-01-15T10:00:00+0300'],
+     ['Менеджер', 'abc', '80000', 'RUR', 'Пермь', '2022-01-15T10:00:00+0300']],
+    [['Java программист', '90000', '110000', 'RUR', 'Казань', '2021-07-01T10:00:00+0300'],
+     ['Программист', '120000', '160000', 'RUR', 'Пермь', '2022-02-01T10:00:00+0300'],
+     ['Тестировщик', '50000', '70000', 'XXX', 'Казань', '2022-02-01T10:00:00+0300'],
+     ['Дизайнер', '70000', '', 'RUR', 'Москва', '2022-03-01T10:00:00+0300']],
+]
+
+
+def write_csv(path, rows):
+    with open(path, 'w', encoding='utf-8-sig', newline='') as file:
+        main.csv.writer(file).writerows([HEADER] + rows)
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_worker(path):
+    data_set = main.csv_read(str(path))
+    port = free_port()
+    threading.Thread(target=serve, args=(port, data_set.get_partial_stat, '127.0.0.1', data_set.rejects),
+                     daemon=True).start()
+    for _ in range(100):
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=1).close()
+            break
+        except OSError:
+            time.sleep(0.05)
+    return f'127.0.0.1:{port}'
+
+
+def test_cluster_matches_single_data_set(tmp_path, monkeypatch):
+    for i, rows in enumerate(SHARDS):
+        write_csv(tmp_path / f'shard{i}.csv', rows)
+    write_csv(tmp_path / 'all.csv', SHARDS[0] + SHARDS[1])
+    addresses = [start_worker(tmp_path / f'shard{i}.csv') for i in range(len(SHARDS))]
+
+    (tmp_path / 'single').mkdir()
+    (tmp_path / 'cluster').mkdir()
+    monkeypatch.chdir(tmp_path / 'single')
+    data_set = main.csv_read(str(tmp_path / 'all.csv'))
+    data_set.get_stat('Программист', ['json'])
+    monkeypatch.chdir(tmp_path / 'cluster')
+    cluster = main.ClusterDataSet(addresses)
+    cluster.get_stat('Программист', ['json'])
+
+    single = json.loads((tmp_path / 'single' / 'stats.json').read_text(encoding='utf-8'))
+    distributed = json.loads((tmp_path / 'cluster' / 'stats.json').read_text(encoding='utf-8'))
+    assert distributed == single
+    assert cluster.rejects == data_set.rejects == {'bad_value': 1, 'unknown_currency': 1, 'empty_field': 1}
@@ -0,0 +1,30 @@
+import pytest
+
+import main
+from sqlite_store import import_vacancies
+
+HEADER = ['name', 'salary_from', 'salary_to', 'salary_currency', 'area_name', 'published_at']
+ROWS = [['Программист', '100000', '150000', 'RUR', 'Москва', '2021-03-01T10:00:00+0300'],
+        ['Программист', '1e19', '1e19', 'RUR', 'Москва', '2021-04-01T10:00:00+0300'],
+        ['Аналитик', '-3e19', '100000', 'RUR', 'Пермь', '2021-05-01T10:00:00+0300'],
+        ['Аналитик', '60000', '80000', 'RUR', 'Пермь', '2022-01-15T10:00:00+0300']]
+
+
+def test_csv_read_rejects_salaries_outside_int64(tmp_path):
+    path = tmp_path / 'vacancies.csv'
+    with open(path, 'w', encoding='utf-8-sig', newline='') as file:
+        main.csv.writer(file).writerows([HEADER] + ROWS)
+
+    data_set = main.csv_read(str(path), batch_size=2)
+
+    assert [v.salary for v in data_set.vacancies_objects] == [125000, 70000]
+    assert data_set.rejects == {'bad_value': 2}
+    assert data_set.get_columns('Программист', areas=True)['salary'].tolist() == [125000, 70000]
+    import_vacancies(str(tmp_path / 'vacancies.sqlite'), data_set.vacancies_objects)
+
+
+def test_vacancy_rejects_salaries_outside_int64():
+    fields = dict(zip(HEADER, ROWS[1]))
+    with pytest.raises(ValueError):
+        main.Vacancy(**fields)
+    assert main.Vacancy(**dict(zip(HEADER, ROWS[0]))).salary == 125000
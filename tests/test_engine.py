@@ -0,0 +1,52 @@
+import pytest
+
+import main
+from engine import choose_engine
+
+HEADER = ['name', 'salary_from', 'salary_to', 'salary_currency', 'area_name', 'published_at']
+ROWS = [['Программист', '100000', '150000', 'RUR', 'Москва', '2021-03-01T10:00:00+0300'],
+        ['Аналитик', '60000', '80000', 'XXX', 'Пермь', '2022-01-15T10:00:00+0300'],
+        ['Программист', '100000', '150000', 'RUR', 'Москва', '2021-03-01T10:00:00+0300']]
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / 'vacancies.csv'
+    with open(path, 'w', encoding='utf-8-sig', newline='') as file:
+        main.csv.writer(file).writerows([HEADER] + ROWS)
+    return str(path)
+
+
+def test_quarantine_is_written_by_the_chosen_engine(source, tmp_path):
+    cache_dir = str(tmp_path / 'cache')
+    decision = choose_engine(source, directory=cache_dir, quarantine=True)
+    assert decision.engine == 'csv' and not decision.write_cache
+
+    quarantine = tmp_path / 'quarantine.csv'
+    data_set = main.open_data_set(source, decision, cache_dir, quarantine=str(quarantine))
+    assert data_set.rejects == {'unknown_currency': 1}
+    assert len(data_set.vacancies_objects) == 2
+    with open(quarantine, encoding='utf-8-sig', newline='') as file:
+        assert list(main.csv.reader(file))[1] == ROWS[1] + ['unknown_currency']
+
+
+@pytest.mark.parametrize('force', ['checkpoint', 'columns'])
+def test_quarantine_is_refused_by_engines_that_cannot_write_it(source, force):
+    with pytest.raises(ValueError):
+        choose_engine(source, force, quarantine=True)
+
+
+def test_dedup_is_applied_by_the_chosen_engine(source, tmp_path):
+    cache_dir = str(tmp_path / 'cache')
+    decision = choose_engine(source, directory=cache_dir, dedup=True)
+    assert decision.engine == 'csv' and not decision.write_cache
+
+    data_set = main.open_data_set(source, decision, cache_dir, dedup=main.DEDUP_KEY)
+    assert data_set.rejects == {'unknown_currency': 1, 'duplicate': 1}
+    assert [v.name for v in data_set.vacancies_objects] == ['Программист']
+
+
+@pytest.mark.parametrize('force', ['checkpoint', 'columns'])
+def test_dedup_is_refused_by_engines_that_cannot_apply_it(source, force):
+    with pytest.raises(ValueError):
+        choose_engine(source, force, dedup=True)